@@ -1,6 +1,7 @@
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
 
@@ -13,8 +14,32 @@ app.conf.beat_schedule = {
         "task": "core.tasks.update_faiss_index",
         "schedule": crontab(hour=3, minute=0),
     },
-    "scrape-articles-hourly": {
-        "task": "core.tasks.scrape_articles",
-        "schedule": crontab(minute=0),  # Run every hour
-    }
+    "schedule-due-sources": {
+        "task": "core.tasks.schedule_due_sources",
+        "schedule": 60,  # Each source is scraped on its own scraping_interval
+    },
+    "fetch-frontier": {
+        "task": "core.tasks.fetch_frontier",
+        "schedule": 300,  # Picks up URLs left behind by failed or crashed workers
+    },
+    "pretranslate-articles": {
+        "task": "core.tasks.pretranslate_articles",
+        "schedule": crontab(minute="*/15", hour="1-5"),  # Off-peak only
+    },
 }
+
+
+@worker_process_init.connect
+def warm_up_models(**kwargs):
+    """Load the ML models in every process of the ML worker pool before its first task."""
+    if not os.environ.get("ML_WORKER"):
+        return
+    from django.conf import settings
+    from core.utils import article_summarizer, fake_news_detector, model_registry
+
+    if settings.INFERENCE_SOCKET:
+        # The inference server holds the models; only progressive
+        # summaries still run in the worker
+        model_registry.warmup(["summarizer"])
+    else:
+        model_registry.warmup()
@@ -15,6 +15,29 @@ LOGOUT_REDIRECT_URL = "login"
 
 LIBRETRANSLATE_API = "http://localhost:5000"
 LIBRETRANSLATE_TIMEOUT = 30
+LIBRETRANSLATE_MAX_IN_FLIGHT = 4
+# Pre-translation of new articles into users' preferred languages
+PRETRANSLATION_OFF_PEAK_HOURS = (1, 6)  # UTC, [start, end)
+PRETRANSLATION_BUDGET_SECONDS = 600  # per run, split between languages
+# Padded tokens per summarizer generate() call; lower it on small GPUs
+SUMMARY_BATCH_TOKENS = 8192
+# Padded tokens per fake news detector forward pass
+FAKE_NEWS_BATCH_TOKENS = 16384
+# "torch", or "onnx" / "onnx-int8" after manage.py export_fake_news_onnx
+FAKE_NEWS_BACKEND = os.environ.get("FAKE_NEWS_BACKEND", "torch")
+FAKE_NEWS_ONNX_THREADS = int(os.environ.get("FAKE_NEWS_ONNX_THREADS", 0)) or None
+# Prefilter P(fake) inside this band is escalated to the transformer
+FAKE_NEWS_UNCERTAINTY_BAND = (0.1, 0.9)
+# Shared inference server (manage.py inference_server): a Unix socket path
+# or host:port; empty runs the models inside each process
+INFERENCE_SOCKET = os.environ.get("INFERENCE_SOCKET", "")
+INFERENCE_TIMEOUT = 600
+# Summarizer inference; see core.utils.article_summarizer.summarizer_options
+SUMMARIZER_DEVICE = os.environ.get("SUMMARIZER_DEVICE", "auto")
+SUMMARIZER_CPU_DTYPE = os.environ.get("SUMMARIZER_CPU_DTYPE", "fp32")
+SUMMARIZER_QUANTIZE = os.environ.get("SUMMARIZER_QUANTIZE", "") == "1"
+SUMMARIZER_THREADS = int(os.environ.get("SUMMARIZER_THREADS", 0)) or None
+SUMMARIZER_INTEROP_THREADS = 1
 
 
 DEBUG = True
@@ -84,17 +107,11 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 CELERY_BROKER_URL = "redis://localhost:6380/0"
+ROBOTS_CACHE_REDIS_URL = "redis://localhost:6380/1"
+TRANSLATION_CACHE_REDIS_URL = "redis://localhost:6380/2"
+TRANSLATION_CACHE_MAX_ENTRIES = 200000
 CELERY_RESULT_BACKEND = "redis://localhost:6380/0"
-CELERY_BEAT_SCHEDULE = {
-    "scrape-articles": {
-        "task": "core.tasks.scrape_articles",
-        "schedule": 1800,
-    },
-    "update-event-clusters": {
-        "task": "core.tasks.update_event_clusters",
-        "schedule": 3600,
-    },
-}
+# The beat schedule is app.conf.beat_schedule in NewsAggregator/celery.py
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
@@ -0,0 +1,90 @@
+"""
+Fake news cascade: fraction escalated to the transformer and accuracy delta.
+
+Scores a labelled sample of the True.csv/Fake.csv training data (or, with
+--from-db, stored articles, where agreement with the transformer stands in
+for accuracy) with the hashed n-gram prefilter and with the transformer
+detector, then replays the cascade for each uncertainty band: texts the
+prefilter is sure about keep its label, the rest take the transformer's.
+Reports per band the fraction escalated, cascade accuracy against the
+transformer alone, and the time per article both ways.
+
+    python benchmarks/bench_cascade.py --dataset ../fake-news-detector/fake-news-detector-files
+        [--texts 1000] [--bands 0.05-0.95,0.1-0.9,0.2-0.8] [--from-db]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+import django
+
+django.setup()
+
+from core.utils.fake_news_detector import detect_fake_news_batch, load_prefilter
+from core.utils.fake_news_prefilter import FAKE_THRESHOLD, in_band
+from bench_fake_news import corpus_from_dataset, corpus_from_db
+
+
+def parse_bands(value):
+    return [tuple(float(x) for x in band.split("-")) for band in value.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", help="directory with True.csv and Fake.csv")
+    parser.add_argument("--from-db", action="store_true", help="score stored articles")
+    parser.add_argument("--texts", type=int, default=1000)
+    parser.add_argument("--bands", type=parse_bands, default=parse_bands("0.05-0.95,0.1-0.9,0.2-0.8"))
+    args = parser.parse_args()
+    if not args.dataset and not args.from_db:
+        parser.error("give --dataset or --from-db")
+
+    texts, labels = (
+        corpus_from_dataset(args.dataset, args.texts)
+        if args.dataset
+        else corpus_from_db(args.texts)
+    )
+    prefilter = load_prefilter()
+
+    start = time.perf_counter()
+    probabilities = prefilter.score_many(texts)
+    prefilter_time = (time.perf_counter() - start) / len(texts)
+
+    detect_fake_news_batch(texts[:8])
+    start = time.perf_counter()
+    transformer = [is_fake for is_fake, _ in detect_fake_news_batch(texts)]
+    transformer_time = (time.perf_counter() - start) / len(texts)
+
+    truth = labels if labels is not None else transformer
+    measure = "accuracy" if labels is not None else "agreement"
+    transformer_accuracy = statistics.mean(p == t for p, t in zip(transformer, truth))
+    prefilter_accuracy = statistics.mean((p > FAKE_THRESHOLD) == t for p, t in zip(probabilities, truth))
+    print(
+        f"{len(texts)} texts; prefilter {prefilter_time * 1e6:.0f}us/article, "
+        f"{measure} {prefilter_accuracy:.2%}; "
+        f"transformer {transformer_time * 1000:.1f}ms/article, {measure} {transformer_accuracy:.2%}"
+    )
+
+    for band in args.bands:
+        escalated = [in_band(p, band) for p in probabilities]
+        cascade = [
+            t if up else p > FAKE_THRESHOLD for p, t, up in zip(probabilities, transformer, escalated)
+        ]
+        accuracy = statistics.mean(c == t for c, t in zip(cascade, truth))
+        fraction = statistics.mean(escalated)
+        per_article = prefilter_time + fraction * transformer_time
+        print(
+            f"band {band[0]:.2f}-{band[1]:.2f}: escalated {fraction:>6.1%}  "
+            f"{measure} {accuracy:.2%} ({(accuracy - transformer_accuracy) * 100:+.2f}pt)  "
+            f"{per_article * 1000:.2f}ms/article ({transformer_time / per_article:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Fake news detector latency and accuracy per inference backend.
+
+Loads the detector with each backend (torch, onnx, onnx-int8; export the
+ONNX files first with manage.py export_fake_news_onnx) and scores the same
+texts in dynamically padded batches and one at a time. Reports load time,
+batch throughput, single-text p50/p95 latency, agreement with the torch
+backend (same label, largest score difference) and, with --dataset,
+accuracy on the True.csv/Fake.csv files the detector was trained from.
+Without --dataset or --from-db the texts are sentences of the English
+language sample, 1 to 40 per text.
+
+    python benchmarks/bench_fake_news.py [--texts 200] [--single 50]
+        [--backends torch,onnx,onnx-int8] [--threads 4]
+        [--dataset ../fake-news-detector/fake-news-detector-files] [--from-db]
+"""
+import argparse
+import csv
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+import django
+
+django.setup()
+
+import torch
+from django.conf import settings
+from core.utils.fake_news_detector import MODEL_DIR, load_detector, score_batch
+from core.utils.language_samples import SAMPLES
+
+
+def make_corpus(n_texts, seed=42):
+    sentences = re.split(r"(?<=[.!?])\s+", " ".join(SAMPLES["en"].split()))
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(sentences) for _ in range(rng.randint(1, 40)))
+        for _ in range(n_texts)
+    ], None
+
+
+def corpus_from_dataset(directory, n_texts, seed=42):
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for name, is_fake in (("True.csv", False), ("Fake.csv", True)):
+        with open(Path(directory) / name, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for row in rng.sample(rows, min(len(rows), n_texts // 2)):
+            texts.append(f"{row['title']} {row['text']}")
+            labels.append(is_fake)
+    return texts, labels
+
+
+def corpus_from_db(n_texts):
+    from core.models import Article
+
+    articles = Article.objects.exclude(raw_content="").order_by("-publication_date")
+    return [a.processed_content or a.raw_content for a in articles[:n_texts]], None
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def run_backend(backend, texts, n_single):
+    start = time.perf_counter()
+    model, tokenizer = load_detector(MODEL_DIR, backend)
+    load_time = time.perf_counter() - start
+    score_batch(model, tokenizer, texts[:8])
+
+    start = time.perf_counter()
+    scores = score_batch(model, tokenizer, texts)
+    batch_time = time.perf_counter() - start
+
+    latencies = []
+    for text in texts[:n_single]:
+        t0 = time.perf_counter()
+        score_batch(model, tokenizer, [text])
+        latencies.append(time.perf_counter() - t0)
+    return scores, load_time, batch_time, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=200)
+    parser.add_argument("--single", type=int, default=50, help="texts timed one at a time")
+    parser.add_argument("--backends", default="torch,onnx,onnx-int8")
+    parser.add_argument("--threads", type=int, default=None, help="intra-op threads")
+    parser.add_argument("--dataset", help="directory with True.csv and Fake.csv")
+    parser.add_argument("--from-db", action="store_true", help="score stored articles")
+    args = parser.parse_args()
+
+    if args.dataset:
+        texts, labels = corpus_from_dataset(args.dataset, args.texts)
+    elif args.from_db:
+        texts, labels = corpus_from_db(args.texts)
+    else:
+        texts, labels = make_corpus(args.texts)
+
+    threads = args.threads or os.cpu_count()
+    torch.set_num_threads(threads)
+    settings.FAKE_NEWS_ONNX_THREADS = threads
+    print(f"{len(texts)} texts, {sum(map(len, texts))} chars, {threads} threads")
+
+    reference = None
+    for backend in args.backends.split(","):
+        scores, load_time, batch_time, latencies = run_backend(backend, texts, args.single)
+        if reference is None:
+            reference = scores
+        agreement = statistics.mean(
+            (a > 50) == (b > 50) for a, b in zip(reference, scores)
+        )
+        drift = max(abs(a - b) for a, b in zip(reference, scores))
+        line = (
+            f"{backend:<10} load {load_time:>5.1f}s  "
+            f"batch {len(texts) / batch_time:>7.1f} texts/s  "
+            f"single p50 {percentile(latencies, 50) * 1000:>6.1f}ms "
+            f"p95 {percentile(latencies, 95) * 1000:>6.1f}ms  "
+            f"agreement {agreement:.1%}  max drift {drift:.2f}pt"
+        )
+        if labels is not None:
+            accuracy = statistics.mean((s > 50) == fake for s, fake in zip(scores, labels))
+            line += f"  accuracy {accuracy:.1%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
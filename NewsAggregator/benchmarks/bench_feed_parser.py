@@ -0,0 +1,72 @@
+"""
+Compare the streaming lxml feed parser with the BeautifulSoup "xml" path the
+scrapers used before, on synthetic RSS feeds of increasing size.
+
+    python benchmarks/bench_feed_parser.py [--items 100 1000 5000] [--limit 15]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+from core.utils.feed_parser import iter_feed_items
+
+ITEM = """
+<item>
+  <title>Story number {i} about the economy and the weather</title>
+  <description><![CDATA[<p>{body}</p>]]></description>
+  <pubDate>Mon, 01 Jan 2024 10:{m:02d}:00 GMT</pubDate>
+  <link>https://example.com/news/{i}</link>
+  <guid>https://example.com/news/{i}</guid>
+</item>"""
+
+
+def make_feed(n_items):
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    items = "".join(ITEM.format(i=i, m=i % 60, body=body) for i in range(n_items))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{items}</channel></rss>'.encode()
+
+
+def parse_bs4(data, limit):
+    soup = BeautifulSoup(data, "xml")
+    return [
+        {
+            "title": item.title.text if item.title else "",
+            "content": item.description.text if item.description else "",
+            "date": item.pubDate.text if item.pubDate else "",
+            "url": item.link.text if item.link else "",
+        }
+        for item in soup.find_all("item")[:limit]
+    ]
+
+
+def parse_lxml(data, limit):
+    return list(iter_feed_items(data, limit=limit))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--limit", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>7} {'size':>9} {'bs4 ms':>10} {'lxml ms':>10} {'speedup':>8}")
+    for n_items in args.items:
+        data = make_feed(n_items)
+        assert [i["title"] for i in parse_bs4(data, args.limit)] == [
+            i["title"] for i in parse_lxml(data, args.limit)
+        ]
+        bs4_s = min(timeit.repeat(lambda: parse_bs4(data, args.limit), number=1, repeat=args.repeat))
+        lxml_s = min(timeit.repeat(lambda: parse_lxml(data, args.limit), number=1, repeat=args.repeat))
+        print(
+            f"{n_items:>7} {len(data) // 1024:>7}KB {bs4_s * 1000:>10.2f} "
+            f"{lxml_s * 1000:>10.2f} {bs4_s / lxml_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark for core.utils.dates.parse_date against the previous
+dateutil-first implementation, over date strings as they appear in the feeds
+and article pages we scrape.
+
+    python benchmarks/bench_parse_date.py [--rounds 2000]
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.utils.dates import DATE_FORMATS, parse_date
+
+# (source, date string) pairs taken from NPR, Guardian, Al Jazeera, ABC AU and
+# USA Today feeds, APIs and article pages
+CORPUS = [
+    ("npr", "Thu, 14 Mar 2024 17:05:12 -0400"),
+    ("npr", "Wed, 13 Mar 2024 09:00:00 -0400"),
+    ("npr", "2024-03-14T17:05:12-04:00"),
+    ("guardian", "2024-03-14T21:05:12Z"),
+    ("guardian", "2024-03-14T06:00:01Z"),
+    ("aljazeera", "Thu, 14 Mar 2024 20:41:02 +0000"),
+    ("aljazeera", "14 Mar 2024"),
+    ("abc_au", "Fri, 15 Mar 2024 08:12:44 +1100"),
+    ("abc_au", "2024-03-15T08:12:44+11:00"),
+    ("usa_today", "Thu, 14 Mar 2024 21:33:10 GMT"),
+    ("usa_today", "March 14, 2024"),
+    ("usa_today", "March 14, 2024, 5:33 PM"),
+    ("usa_today", "2024-03-14T21:33:10.000Z"),
+    ("npr", "Thursday, March 14, 2024"),
+    ("npr", "March 14, 2024 17:05"),
+]
+
+
+def legacy_parse_date(date_str, formats=DATE_FORMATS):
+    if not date_str:
+        return datetime.now()
+    try:
+        from dateutil import parser as dateutil_parser
+        return dateutil_parser.parse(date_str)
+    except Exception:
+        pass
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str.strip(), fmt)
+        except ValueError:
+            continue
+    return datetime.now()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    for source, date_str in CORPUS:
+        new, old = parse_date(date_str, source=source), legacy_parse_date(date_str)
+        assert new.tzinfo is not None, date_str
+        assert new.replace(tzinfo=None) == old.replace(tzinfo=None) or new == old, date_str
+
+    n = args.rounds * len(CORPUS)
+    legacy_s = timeit.timeit(
+        lambda: [legacy_parse_date(d) for _, d in CORPUS], number=args.rounds
+    )
+    new_s = timeit.timeit(
+        lambda: [parse_date(d, source=s) for s, d in CORPUS], number=args.rounds
+    )
+    print(f"{len(CORPUS)} strings x {args.rounds} rounds")
+    print(f"legacy (dateutil first): {legacy_s / n * 1e6:8.2f} us/date")
+    print(f"fast path + memo:        {new_s / n * 1e6:8.2f} us/date")
+    print(f"speedup:                 {legacy_s / new_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Scraper throughput against the local fixture server, no network needed.
+
+Serves recorded fixtures (or a generated set) through FixtureServer with the
+given latency, then reports articles/second for one concurrent scrape of every
+built-in source. With --django it also times scraping end to end on a
+throwaway test database: core.tasks.scrape_articles (discovery) and then, in
+this process, the frontier fetches it would have queued on the frontier worker.
+
+    python benchmarks/bench_scrapers.py [--fixtures DIR] [--latency 0.05]
+        [--delay 0] [--per-host 2] [--rounds 3] [--django]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# The fixture machinery is test support code, next to the tests using it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "core" / "tests"))
+
+from http_fixtures import (
+    FixtureServer,
+    FixtureStore,
+    adapter_from_env,
+    write_synthetic_fixtures,
+)
+from core.utils import scrapers
+from core.utils.fetch_engine import run_scrapers
+from core.utils.robots_cache import RobotsCache
+from core.utils.scrapers import get_async_scraper_for_url
+
+SOURCES = {
+    "NPR": "https://www.npr.org/sections/news/",
+    "The Guardian": "https://www.theguardian.com/international",
+    "Al Jazeera English": "https://www.aljazeera.com",
+    "USA Today": "https://www.usatoday.com/news/",
+    "ABC News (AU)": "https://www.abc.net.au/news/",
+}
+
+
+def bench_engine(args):
+    jobs = [(get_async_scraper_for_url(url), url) for url in SOURCES.values()]
+    best = None
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        results = run_scrapers(
+            jobs,
+            delay_range=(args.delay, args.delay),
+            per_host_limit=args.per_host,
+            robots=RobotsCache(),
+        )
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, results)
+
+    elapsed, results = best
+    total = 0
+    for name, articles in zip(SOURCES, results):
+        count = 0 if isinstance(articles, Exception) else len(articles)
+        total += count
+        print(f"  {name:<20} {count:>4} articles")
+    print(f"engine: {total} articles in {elapsed:.3f}s -> {total / elapsed:.1f} articles/s")
+
+
+def bench_scrape_articles(args, tmp):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+    import django
+
+    django.setup()
+    from django.db import connection
+    from django.db.models import Count
+    from django.test.utils import setup_test_environment
+    from core import tasks
+    from core.models import Article, FrontierURL, NewsSource
+    from core.utils import frontier, ingest
+    from core.utils.feed_cache import FeedCache
+    from core.utils.robots_cache import robots_cache
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    # Only scraping and ingest are measured, not the translation follow-up;
+    # nothing goes through the broker or the shared Redis robots cache
+    ingest.dispatch_follow_up = lambda article_ids: None
+    robots_cache.redis_url = ""
+    robots_cache._redis = None
+    try:
+        for name, url in SOURCES.items():
+            NewsSource.objects.create(name=name, base_url=url)
+        start = time.perf_counter()
+        feed_cache = FeedCache(Path(tmp) / "feed_cache.json")
+        with mock.patch.object(tasks.fetch_frontier, "delay"), \
+                mock.patch.object(tasks, "FeedCache", lambda: feed_cache):
+            tasks.scrape_articles()
+        discovered = time.perf_counter()
+        discovered_count = Article.objects.count()
+        # The pages scrape_articles queued, as fetch_frontier works through them
+        while rows := frontier.claim_batch():
+            results = frontier.fetch_batch(
+                rows, delay_range=(args.delay, args.delay), per_host_limit=args.per_host
+            )
+            frontier.complete_batch(rows, results)
+        elapsed = time.perf_counter() - start
+
+        count = Article.objects.count()
+        states = dict(
+            FrontierURL.objects.values_list("state").annotate(n=Count("id")).order_by()
+        )
+        print(
+            f"scrape_articles: {discovered_count} articles stored, "
+            f"{sum(states.values())} URLs discovered in {discovered - start:.3f}s"
+        )
+        print(f"fetch_frontier: {count - discovered_count} articles stored in {elapsed - (discovered - start):.3f}s {states}")
+        print(f"end to end: {count} articles stored in {elapsed:.3f}s -> {count / elapsed:.1f} articles/s")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", help="recorded fixture directory (default: generated)")
+    parser.add_argument("--items", type=int, default=15, help="items per generated feed")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--delay", type=float, default=0.0, help="per-host politeness delay")
+    parser.add_argument("--per-host", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--django", action="store_true", help="also time scrape_articles end to end")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FixtureStore(args.fixtures or tmp)
+        if not args.fixtures:
+            write_synthetic_fixtures(store, n_items=args.items)
+
+        with FixtureServer(store, latency=args.latency, jitter=args.jitter) as server:
+            scrapers.http_adapter_factory = adapter_from_env
+            os.environ["SCRAPER_HTTP_MODE"] = "local"
+            os.environ["SCRAPER_FIXTURE_SERVER"] = server.url
+            print(f"fixture server {server.url}, latency {args.latency * 1000:.0f}ms")
+            bench_engine(args)
+            if args.django:
+                bench_scrape_articles(args, tmp)
+            print(f"requests served: {server.requests_served}")
+
+
+if __name__ == "__main__":
+    main()
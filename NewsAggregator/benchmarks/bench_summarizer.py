@@ -0,0 +1,148 @@
+"""
+Summarizer latency and ROUGE drift across CPU inference modes.
+
+Loads core.utils.article_summarizer on CPU in each requested mode (fp32,
+bf16, fp32 with dynamic int8 quantization, ...), summarizes the same corpus
+one article at a time and reports latency per article plus ROUGE-1/2/L F1
+of every mode against the baseline mode, fp16 weights as the summarizer
+was loaded before it had a CPU mode. The corpus is the latest articles of
+the database with --from-db, otherwise shuffled sentences of the English
+language sample.
+
+    python benchmarks/bench_summarizer.py [--articles 20] [--sentences 30]
+        [--modes fp32,bf16,fp32-int8] [--baseline fp16] [--threads 8]
+        [--from-db]
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+import django
+
+django.setup()
+
+from core.utils.article_summarizer import initialize_summarizer, summarize_article
+from core.utils.language_samples import SAMPLES
+
+
+def make_corpus(n_articles, n_sentences, seed=42):
+    sentences = re.split(r"(?<=[.!?])\s+", " ".join(SAMPLES["en"].split()))
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(sentences) for _ in range(n_sentences))
+        for _ in range(n_articles)
+    ]
+
+
+def corpus_from_db(n_articles):
+    from core.models import Article
+
+    articles = Article.objects.exclude(raw_content="").order_by("-publication_date")
+    return [a.processed_content or a.raw_content for a in articles[:n_articles]]
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def _tokens(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def _f1(overlap, hyp_total, ref_total):
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / hyp_total, overlap / ref_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(reference, hypothesis, n):
+    ref = Counter(zip(*[_tokens(reference)[i:] for i in range(n)]))
+    hyp = Counter(zip(*[_tokens(hypothesis)[i:] for i in range(n)]))
+    return _f1(sum((ref & hyp).values()), sum(hyp.values()), sum(ref.values()))
+
+
+def rouge_l(reference, hypothesis):
+    ref, hyp = _tokens(reference), _tokens(hypothesis)
+    previous = [0] * (len(hyp) + 1)
+    for r in ref:
+        current = [0]
+        for j, h in enumerate(hyp):
+            current.append(previous[j] + 1 if r == h else max(previous[j + 1], current[j]))
+        previous = current
+    return _f1(previous[-1], len(hyp), len(ref))
+
+
+def parse_mode(mode):
+    dtype, _, quantize = mode.partition("-")
+    return dtype, quantize == "int8"
+
+
+def run_mode(mode, corpus, threads):
+    dtype, quantize = parse_mode(mode)
+    start = time.perf_counter()
+    summarizer = initialize_summarizer(
+        device="cpu", dtype=dtype, quantize=quantize, threads=threads
+    )
+    load_time = time.perf_counter() - start
+    summarize_article(corpus[0], summarizer)
+
+    summaries, latencies = [], []
+    for text in corpus:
+        t0 = time.perf_counter()
+        summaries.append(summarize_article(text, summarizer))
+        latencies.append(time.perf_counter() - t0)
+    return summaries, latencies, load_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=20)
+    parser.add_argument("--sentences", type=int, default=30, help="sentences per article")
+    parser.add_argument("--modes", default="fp32,bf16,fp32-int8")
+    parser.add_argument("--baseline", default="fp16", help="mode the others are compared to")
+    parser.add_argument("--threads", type=int, default=None, help="intra-op threads")
+    parser.add_argument("--from-db", action="store_true", help="summarize stored articles")
+    args = parser.parse_args()
+
+    corpus = (
+        corpus_from_db(args.articles)
+        if args.from_db
+        else make_corpus(args.articles, args.sentences)
+    )
+    print(
+        f"{len(corpus)} articles, {sum(map(len, corpus))} chars, "
+        f"{args.threads or os.cpu_count()} threads"
+    )
+
+    reference = None
+    for mode in [args.baseline] + [m for m in args.modes.split(",") if m != args.baseline]:
+        summaries, latencies, load_time = run_mode(mode, corpus, args.threads)
+        if reference is None:
+            reference = summaries
+        scores = [
+            (rouge_n(ref, hyp, 1), rouge_n(ref, hyp, 2), rouge_l(ref, hyp))
+            for ref, hyp in zip(reference, summaries)
+        ]
+        r1, r2, rl = (statistics.mean(col) for col in zip(*scores))
+        print(
+            f"{mode:<12} load {load_time:>5.1f}s  "
+            f"mean {statistics.mean(latencies):>6.2f}s  "
+            f"p50 {percentile(latencies, 50):>6.2f}s  "
+            f"p95 {percentile(latencies, 95):>6.2f}s  "
+            f"ROUGE-1 {r1:.3f}  ROUGE-2 {r2:.3f}  ROUGE-L {rl:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Translation throughput against the local LibreTranslate stand-in.
+
+Starts core.utils.translation_server with the given latency, per-character
+cost and failure rate, points LIBRETRANSLATE_API at it and translates a
+generated corpus through core.utils.translation.translate_article_content,
+reporting chars/s, p50/p99 latency per article and the retry overhead of
+the injected failures. With --celery it also runs the
+core.tasks.translate_article_content task (eagerly) on a throwaway test
+database.
+
+    python benchmarks/bench_translation.py [--articles 40] [--sentences 40]
+        [--latency 0.05] [--per-char 0.00002] [--workers 4]
+        [--failure-rate 0.05] [--celery]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+import django
+
+django.setup()
+
+from django.conf import settings
+from core.utils.translation_cache import translation_cache
+from core.utils.translation_server import TranslateServer
+
+WORDS = (
+    "the government said on tuesday that new plan would increase spending "
+    "public health education after months pressure from opposition parties "
+    "officials warned prices energy food households central bank rates "
+    "inflation remain above target longer than expected police protest"
+).split()
+
+
+def make_corpus(n_articles, n_sentences, seed=42):
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(n_articles):
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))).capitalize() + "."
+            for _ in range(n_sentences)
+        ]
+        articles.append(" ".join(sentences))
+    return articles
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def report(label, latencies, chars, server, elapsed):
+    print(
+        f"{label:<28} {chars / elapsed:>10.0f} chars/s  "
+        f"p50 {percentile(latencies, 50) * 1000:>7.1f}ms  "
+        f"p99 {percentile(latencies, 99) * 1000:>7.1f}ms  "
+        f"{server.requests_served:>4} requests ({server.failures} failed)"
+    )
+
+
+def run_helper(corpus, server, label):
+    from core.utils.translation import translate_article_content
+
+    server.reset_counts()
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for text in corpus:
+        t0 = time.perf_counter()
+        try:
+            translate_article_content(text, "es")
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    report(label, latencies, sum(map(len, corpus)), server, elapsed)
+    if errors:
+        print(f"{'':<28} {errors} articles failed")
+    return elapsed, server.requests_served
+
+
+def run_celery(corpus, server):
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+    from django.utils import timezone
+    from core.models import Article, NewsSource
+    from core.tasks import translate_article_content
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        source = NewsSource.objects.create(name="Bench", base_url="https://example.com")
+        ids = [
+            Article.objects.create(
+                source=source,
+                title=f"Article {i}",
+                raw_content=text,
+                language="en",
+                publication_date=timezone.now(),
+            ).id
+            for i, text in enumerate(corpus)
+        ]
+        translation_cache.clear()
+        server.reset_counts()
+        latencies = []
+        start = time.perf_counter()
+        for article_id in ids:
+            t0 = time.perf_counter()
+            translate_article_content.apply(args=(article_id, "es"))
+            latencies.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - start
+        report("celery task (eager)", latencies, sum(map(len, corpus)), server, elapsed)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--sentences", type=int, default=40, help="sentences per article")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--per-char", type=float, default=0.00002, help="seconds per character")
+    parser.add_argument("--workers", type=int, default=4, help="server worker slots")
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--celery", action="store_true", help="also run the Celery task")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.articles, args.sentences)
+    # Measure the server round trips, not a shared Redis cache
+    translation_cache._redis = False
+
+    with TranslateServer(
+        latency=args.latency, per_char=args.per_char, workers=args.workers, seed=1
+    ) as server:
+        settings.LIBRETRANSLATE_API = server.url
+        print(
+            f"stand-in {server.url}: latency {args.latency * 1000:.0f}ms, "
+            f"{args.per_char * 1e6:.0f}us/char, {args.workers} workers; "
+            f"{args.articles} articles, {sum(map(len, corpus))} chars"
+        )
+
+        translation_cache.clear()
+        base_elapsed, base_requests = run_helper(corpus, server, "helper, cold cache")
+        run_helper(corpus, server, "helper, warm cache")
+
+        if args.failure_rate:
+            translation_cache.clear()
+            server.failure_rate = args.failure_rate
+            elapsed, requests = run_helper(
+                corpus, server, f"helper, {args.failure_rate:.0%} failures"
+            )
+            print(
+                f"retry overhead: +{requests - base_requests} requests "
+                f"({(requests - base_requests) / base_requests:.0%}), "
+                f"+{elapsed - base_elapsed:.2f}s ({(elapsed - base_elapsed) / base_elapsed:.0%})"
+            )
+            server.failure_rate = 0.0
+
+        if args.celery:
+            run_celery(corpus, server)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,69 @@
 from django.contrib import admin
-from .models import CustomUser, NewsSource, Article
+from .models import (
+    Article,
+    ArticleTranslation,
+    CustomUser,
+    FrontierURL,
+    NewsSource,
+    ScrapeRun,
+)
+from .utils.scheduling import effective_interval, expected_rate
+
+
+class ArticleTranslationInline(admin.StackedInline):
+    model = ArticleTranslation
+    fields = ("language", "content", "updated_at")
+    readonly_fields = ("updated_at",)
+    extra = 0
 
 
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
-    list_display = ("title", "source", "publication_date", "is_verified")
-    list_filter = ("source", "is_verified")
+    list_display = ("title", "source", "publication_date", "is_verified", "is_fake_news", "fake_news_tier")
+    list_filter = ("source", "is_verified", "fake_news_tier")
     search_fields = ("title", "raw_content")
+    inlines = [ArticleTranslationInline]
+
+
+@admin.register(FrontierURL)
+class FrontierURLAdmin(admin.ModelAdmin):
+    list_display = ("url", "source", "state", "attempts", "discovered_at", "fetched_at")
+    list_filter = ("state", "source")
+    search_fields = ("url", "title")
+
+
+class ScrapeRunInline(admin.TabularInline):
+    model = ScrapeRun
+    fields = ("ran_at", "found", "new_items", "interval")
+    readonly_fields = fields
+    ordering = ("-ran_at",)
+    extra = 0
+    max_num = 0
+
+
+@admin.register(NewsSource)
+class NewsSourceAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "is_active",
+        "scraping_interval",
+        "learned_interval",
+        "expected_yield",
+        "last_scraped_at",
+        "next_scrape_at",
+    )
+    list_filter = ("is_active",)
+    readonly_fields = ("yield_profile", "last_scraped_at", "consecutive_failures")
+    inlines = [ScrapeRunInline]
+
+    @admin.display(description="Current interval (s)")
+    def learned_interval(self, obj):
+        return effective_interval(obj)
+
+    @admin.display(description="New items/hour")
+    def expected_yield(self, obj):
+        rate = expected_rate(obj)
+        return "-" if rate is None else f"{rate:.2f}"
 
 
-admin.site.register(CustomUser)
-admin.site.register(NewsSource)
\ No newline at end of file
+admin.site.register(CustomUser)
\ No newline at end of file
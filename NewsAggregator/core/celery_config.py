@@ -17,9 +17,28 @@ enable_utc = True
 
 # Worker settings
 worker_prefetch_multiplier = 1
-worker_max_tasks_per_child = 1
+# Processes are reused so loaded models stay resident; recycle them only
+# after many tasks or when they grow past ~4 GB
+worker_max_tasks_per_child = 500
+worker_max_memory_per_child = 4_000_000  # KiB
 worker_pool = 'prefork'
 
+# Article pages are fetched on a separate pool: celery worker -Q frontier
+# Model inference runs on its own pool that loads the models at startup:
+#   ML_WORKER=1 celery -A NewsAggregator worker -Q ml --concurrency 1
+# or, with INFERENCE_SOCKET set, in manage.py inference_server; the ml
+# workers then only forward texts and need no ML_WORKER (with it, they
+# warm just the summarizer for summarize_article_progressive)
+task_routes = {
+    'core.tasks.fetch_frontier': {'queue': 'frontier'},
+    'core.tasks.pretranslate_articles': {'queue': 'translations'},
+    'core.tasks.process_article_summary': {'queue': 'ml'},
+    'core.tasks.summarize_articles_batch': {'queue': 'ml'},
+    'core.tasks.summarize_article_progressive': {'queue': 'ml'},
+    'core.tasks.process_fake_news_detection': {'queue': 'ml'},
+    'core.tasks.detect_fake_news_articles_batch': {'queue': 'ml'},
+}
+
 # CUDA settings
 if torch.cuda.is_available():
     os.environ['CUDA_VISIBLE_DEVICES'] = '0' 
\ No newline at end of file
@@ -0,0 +1,26 @@
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from core.utils.fake_news_detector import MODEL_DIR
+from core.utils.fake_news_onnx import export_onnx
+
+
+class Command(BaseCommand):
+    help = "Export the fake news detector to ONNX (and dynamic int8) for FAKE_NEWS_BACKEND"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model-dir", default=str(MODEL_DIR))
+        parser.add_argument(
+            "--no-quantize", action="store_true", help="Skip the int8 model"
+        )
+        parser.add_argument("--opset", type=int, default=17)
+
+    def handle(self, *args, **options):
+        paths = export_onnx(
+            Path(options["model_dir"]),
+            quantize=not options["no_quantize"],
+            opset=options["opset"],
+        )
+        for path in paths:
+            self.stdout.write(
+                self.style.SUCCESS(f"Wrote {path} ({path.stat().st_size / 1e6:.1f} MB)")
+            )
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.utils import model_registry
+from core.utils.inference_server import MAX_BATCH, MAX_WAIT, InferenceServer, model_handlers
+
+
+class Command(BaseCommand):
+    help = "Serve the summarizer, fake news cascade and sentence embedder to views and tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--address",
+            default=getattr(settings, "INFERENCE_SOCKET", ""),
+            help="Unix socket path or host:port (default: INFERENCE_SOCKET)",
+        )
+        parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="Texts per micro-batch")
+        parser.add_argument(
+            "--max-wait-ms", type=float, default=MAX_WAIT * 1000, help="How long a batch waits to fill"
+        )
+        parser.add_argument("--no-warmup", action="store_true", help="Load models on first request")
+
+    def handle(self, *args, **options):
+        if not options["address"]:
+            self.stderr.write("Give --address or set INFERENCE_SOCKET")
+            return
+
+        handlers, encoders = model_handlers()
+        if not options["no_warmup"]:
+            model_registry.warmup()
+
+        server = InferenceServer(
+            options["address"],
+            handlers,
+            encoders,
+            max_batch=options["max_batch"],
+            max_wait=options["max_wait_ms"] / 1000,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Serving {', '.join(handlers)} on {options['address']} "
+                f"(batches of {options['max_batch']}, {options['max_wait_ms']:.0f}ms wait)"
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
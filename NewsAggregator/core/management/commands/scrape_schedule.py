@@ -0,0 +1,52 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from django.utils import timezone
+from core.models import NewsSource, ScrapeRun
+from core.utils.scheduling import effective_interval, expected_rate, interval_bounds
+
+
+class Command(BaseCommand):
+    help = "Show the learned scrape schedule and recent yield of every news source"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=1, help="Yield history window in days"
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        since = now - timedelta(days=options["days"])
+
+        history = {
+            row["source"]: row
+            for row in ScrapeRun.objects.filter(ran_at__gte=since)
+            .values("source")
+            .annotate(runs=Count("id"), new_items=Sum("new_items"))
+        }
+
+        for source in NewsSource.objects.order_by("name"):
+            low, high = interval_bounds(source)
+            rate = expected_rate(source, now)
+            runs = history.get(source.id, {"runs": 0, "new_items": 0})
+
+            self.stdout.write(f"\n{source.name}{'' if source.is_active else ' (inactive)'}")
+            self.stdout.write(
+                f"  interval: {effective_interval(source, now)}s now "
+                f"(configured {source.scraping_interval}s, bounds {low}-{high}s)"
+            )
+            self.stdout.write(
+                f"  expected yield: {'-' if rate is None else f'{rate:.2f}'} new items/hour"
+            )
+            self.stdout.write(
+                f"  last {options['days']}d: {runs['runs']} runs, {runs['new_items'] or 0} new items"
+            )
+            self.stdout.write(f"  next scrape: {source.next_scrape_at or 'due'}")
+
+            profile = source.yield_profile or []
+            if len(profile) == 24:
+                hours = " ".join(
+                    f"{hour:02d}:{'-' if r is None else f'{r:.1f}'}"
+                    for hour, r in enumerate(profile)
+                )
+                self.stdout.write(f"  per hour (UTC): {hours}")
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+from core.utils.text import normalize_title
+
+
+def backfill_title_keys(apps, schema_editor):
+    """
+    Fill ``title_key`` of rows stored before it existed. The first row of a
+    headline per source gets the plain key; later copies get it suffixed
+    with their id, so the unique constraint applies without deleting any.
+    """
+    Article = apps.get_model("core", "Article")
+    taken = set(
+        Article.objects.exclude(title_key="").values_list("source_id", "title_key")
+    )
+    updated = []
+    rows = Article.objects.filter(title_key="").only("id", "source_id", "title")
+    for article in rows.order_by("id").iterator():
+        key = normalize_title(article.title)
+        if not key:
+            continue
+        if (article.source_id, key) in taken:
+            suffix = f" #{article.id}"
+            key = key[: 500 - len(suffix)] + suffix
+        taken.add((article.source_id, key))
+        article.title_key = key
+        updated.append(article)
+    Article.objects.bulk_update(updated, ["title_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_article_title_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_title_keys, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="article",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("title_key", ""), _negated=True),
+                fields=("source", "title_key"),
+                name="unique_article_title_per_source",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_article_title_key_backfill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newssource',
+            name='consecutive_failures',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='newssource',
+            name='last_scraped_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='newssource',
+            name='next_scrape_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
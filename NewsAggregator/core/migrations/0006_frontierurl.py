@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_article_near_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='url',
+            field=models.URLField(blank=True, db_index=True, default='', max_length=1000),
+        ),
+        migrations.CreateModel(
+            name='FrontierURL',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=1000, unique=True)),
+                ('title', models.CharField(blank=True, default='', max_length=500)),
+                ('summary', models.TextField(blank=True, default='')),
+                ('published', models.CharField(blank=True, default='', max_length=100)),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('fetching', 'Fetching'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('discovered_at', models.DateTimeField(auto_now_add=True)),
+                ('fetched_at', models.DateTimeField(blank=True, null=True)),
+                ('article', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='core.article')),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='frontier', to='core.newssource')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['state', 'discovered_at'], name='core_fronti_state_e5ee40_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_frontierurl'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newssource',
+            name='yield_profile',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.CreateModel(
+            name='ScrapeRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ran_at', models.DateTimeField()),
+                ('found', models.PositiveIntegerField(default=0)),
+                ('new_items', models.PositiveIntegerField(default=0)),
+                ('interval', models.PositiveIntegerField(help_text='Seconds until the next scrape')),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scrape_runs', to='core.newssource')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['source', 'ran_at'], name='core_scrape_source__9c03b5_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_scraperun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=10)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='core.article')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('article', 'language'), name='unique_article_translation')],
+            },
+        ),
+    ]
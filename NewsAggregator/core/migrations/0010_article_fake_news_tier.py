@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_article_language'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='fake_news_tier',
+            field=models.CharField(blank=True, default='', max_length=12),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+from core.utils.language_id import detect_language
+
+
+def copy_translated_content(apps, schema_editor):
+    """
+    Keep the single translation stored on each article as an
+    ArticleTranslation. It did not record its language, so that is detected.
+    """
+    Article = apps.get_model("core", "Article")
+    ArticleTranslation = apps.get_model("core", "ArticleTranslation")
+    rows = (
+        Article.objects.exclude(translated_content__isnull=True)
+        .exclude(translated_content="")
+        .only("id", "language", "translated_content")
+    )
+    translations = []
+    for article in rows.iterator():
+        language = detect_language(article.translated_content)[0]
+        if language and language != (article.language or "en"):
+            translations.append(
+                ArticleTranslation(
+                    article_id=article.id,
+                    language=language,
+                    content=article.translated_content,
+                )
+            )
+    # Translations stored since keep precedence
+    ArticleTranslation.objects.bulk_create(
+        translations, batch_size=500, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_article_fake_news_tier"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_translated_content, migrations.RunPython.noop),
+    ]
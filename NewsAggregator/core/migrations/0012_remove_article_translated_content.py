@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_copy_translated_content'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='article',
+            name='translated_content',
+        ),
+    ]
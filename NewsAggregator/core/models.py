@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from .utils.text import normalize_title
 
 
 class CustomUser(AbstractUser):
@@ -16,23 +17,121 @@ class NewsSource(models.Model):
     base_url = models.URLField()
     scraping_interval = models.PositiveIntegerField(default=3600)
     is_active = models.BooleanField(default=True)
+    last_scraped_at = models.DateTimeField(null=True, blank=True)
+    next_scrape_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    consecutive_failures = models.PositiveIntegerField(default=0)
+    # Learned new items per hour for each UTC hour of the day (None = no data)
+    yield_profile = models.JSONField(default=list, blank=True)
+
+
+class ScrapeRun(models.Model):
+    """How many new items one successful scrape of a source turned up."""
+    source = models.ForeignKey(NewsSource, on_delete=models.CASCADE, related_name="scrape_runs")
+    ran_at = models.DateTimeField()
+    found = models.PositiveIntegerField(default=0)
+    new_items = models.PositiveIntegerField(default=0)
+    interval = models.PositiveIntegerField(help_text="Seconds until the next scrape")
+
+    class Meta:
+        indexes = [models.Index(fields=["source", "ran_at"])]
 
 
 class Article(models.Model):
     source = models.ForeignKey(NewsSource, on_delete=models.CASCADE)
     title = models.CharField(max_length=500)
+    title_key = models.CharField(max_length=500, blank=True, default="")
+    url = models.URLField(max_length=1000, blank=True, default="", db_index=True)
+    language = models.CharField(max_length=10, blank=True, default="", db_index=True)
     raw_content = models.TextField()
     processed_content = models.TextField(null=True)
     summary = models.TextField(null=True)
-    translated_content = models.TextField(null=True)
     publication_date = models.DateTimeField()
     is_verified = models.BooleanField(default=False)
     verification_score = models.FloatField(null=True)
     is_fake_news = models.BooleanField(default=False, null=True)
     fake_news_confidence = models.FloatField(null=True, blank=True)
+    # Which cascade tier decided is_fake_news: "prefilter" or "transformer"
+    fake_news_tier = models.CharField(max_length=12, blank=True, default="")
     article_summary = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    minhash = models.BinaryField(null=True, editable=False)
+    canonical = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="duplicates",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "title_key"],
+                condition=~models.Q(title_key=""),
+                name="unique_article_title_per_source",
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.title_key:
+            self.title_key = normalize_title(self.title)
+        super().save(*args, **kwargs)
+
+class ArticleTranslation(models.Model):
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="translations")
+    language = models.CharField(max_length=10)
+    content = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "language"], name="unique_article_translation"
+            )
+        ]
+
+class LSHBucket(models.Model):
+    """One MinHash LSH band of a canonical article, for near-duplicate lookup."""
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name="lsh_buckets")
+    key = models.BigIntegerField(db_index=True)
+
+class FrontierURL(models.Model):
+    """
+    An article URL discovered on a feed or index page, and its fetch state.
+
+    Discovery only inserts rows; fetch workers lease pending rows, fetch the
+    page and ingest it. A lease that expires (worker crash) makes the row
+    pending again, so an interrupted run resumes where it stopped. A failed
+    fetch is pending with ``lease_expires_at`` set to its retry time.
+    """
+    PENDING = "pending"
+    FETCHING = "fetching"
+    DONE = "done"
+    FAILED = "failed"
+    STATES = [
+        (PENDING, "Pending"),
+        (FETCHING, "Fetching"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    source = models.ForeignKey(NewsSource, on_delete=models.CASCADE, related_name="frontier")
+    url = models.URLField(max_length=1000, unique=True)
+    title = models.CharField(max_length=500, blank=True, default="")
+    summary = models.TextField(blank=True, default="")
+    published = models.CharField(max_length=100, blank=True, default="")
+    state = models.CharField(max_length=10, choices=STATES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    article = models.ForeignKey(Article, null=True, blank=True, on_delete=models.SET_NULL)
+    discovered_at = models.DateTimeField(auto_now_add=True)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["state", "discovered_at"])]
 
 class EventCluster(models.Model):
     name = models.CharField(max_length=200)
@@ -1,9 +1,16 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Article
+from .utils.ingest import dispatch_follow_up
+from .utils.language_id import detect_language, needs_translation
 
 @receiver(post_save, sender=Article)
 def handle_article_translation(sender, instance, created, **kwargs):
-    if created and instance.raw_content:
-        from .tasks import translate_article_content
-        translate_article_content.delay(instance.id, target_lang='en')
+    if not created or not instance.raw_content:
+        return
+    if not instance.language:
+        # Saved outside ingest_articles: detect the language here
+        instance.language = detect_language(f"{instance.title}. {instance.raw_content}")[0]
+        Article.objects.filter(pk=instance.pk).update(language=instance.language)
+    if needs_translation(instance.language):
+        dispatch_follow_up([instance.id])
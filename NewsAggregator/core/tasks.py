@@ -1,12 +1,28 @@
+from functools import partial
 from celery import shared_task
 from .models import NewsSource, Article
-from .utils.scrapers import get_scraper_for_url, parse_date
+from .utils.scrapers import get_async_scraper_for_url
+from .utils.fetch_engine import run_scrapers
+from .utils.feed_cache import FeedCache
+from .utils.frontier import (
+    claim_batch,
+    complete_batch,
+    fetch_batch,
+    record_discovered,
+)
+from .utils.scheduling import (
+    claim_source,
+    due_sources,
+    record_failure,
+    record_success,
+)
+from .utils.near_duplicates import canonical_articles, share_with_duplicates
 from .utils.clustering import cluster_recent_articles
 from .utils.recommendations import build_tfidf_matrix
 from .utils.article_summarizer import summarize_article
-from .utils.fake_news_detector import detect_fake_news
-from .utils.translation import translate_article_content
-from libretranslatepy import LibreTranslateAPI
+from .utils import inference
+from .utils.translation import translate_and_store
+from .utils.pretranslation import is_off_peak, pretranslate
 from django.conf import settings
 import logging
 from celery.result import AsyncResult
@@ -15,55 +31,51 @@ import multiprocessing
 logger = logging.getLogger(__name__)
 
 
+def _translate_article(article_id, target_lang):
+    article = Article.objects.get(id=article_id)
+
+    logger.info(f"Starting translation of article {article_id} to {target_lang}")
+    logger.info(f"Using LibreTranslate API at: {settings.LIBRETRANSLATE_API}")
+
+    # Sentences are batched into a few concurrent requests; failed ones are
+    # retried individually and cached ones are not sent at all
+    translated_content = translate_and_store(article, target_lang)
+    logger.info(f"Successfully translated article {article_id}")
+    return translated_content
+
+
 @shared_task(bind=True, max_retries=3)
 def translate_article_content(self, article_id, target_lang):
     try:
-        lt = LibreTranslateAPI(settings.LIBRETRANSLATE_API)
-        article = Article.objects.get(id=article_id)
-        content = article.processed_content or article.raw_content
-        if not content:
-            raise ValueError("No content to translate")
-
-        logger.info(f"Starting translation of article {article_id} to {target_lang}")
-        logger.info(f"Using LibreTranslate API at: {settings.LIBRETRANSLATE_API}")
-
-        chunk_size = 5000
-        chunks = [
-            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
-        ]
-        translated_chunks = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Translating chunk {i+1}/{len(chunks)}")
-            try:
-                translated = lt.translate(
-                    q=chunk,
-                    source="en",
-                    target=target_lang,
-                    timeout=settings.LIBRETRANSLATE_TIMEOUT,
-                )
-                if not translated or translated == chunk:
-                    logger.warning(f"Translation returned same content for chunk {i+1}")
-                    continue
-                translated_chunks.append(translated)
-            except Exception as chunk_error:
-                logger.error(f"Error translating chunk {i+1}: {str(chunk_error)}")
-                raise
-
-        if not translated_chunks:
-            raise ValueError("No content was successfully translated")
-
-        translated_content = " ".join(translated_chunks)
-        logger.info(f"Successfully translated article {article_id}")
-        
-        article.translated_content = translated_content
-        article.save()
-        return translated_content
+        return _translate_article(article_id, target_lang)
     except Exception as e:
         logger.error(f"Translation failed: {str(e)}")
         self.retry(countdown=30, exc=e)
         return f"Translation failed: {str(e)}"
 
 
+@shared_task
+def translate_articles_batch(article_ids, target_lang):
+    """Translate freshly ingested articles in one task instead of one per row."""
+    translated = 0
+    for article_id in article_ids:
+        try:
+            _translate_article(article_id, target_lang)
+            translated += 1
+        except Exception as e:
+            logger.error(f"Translation of article {article_id} failed: {str(e)}")
+    return f"Translated {translated}/{len(article_ids)} articles to {target_lang}"
+
+
+@shared_task
+def pretranslate_articles():
+    """Off-peak: translate new top articles into the languages users prefer."""
+    if not is_off_peak():
+        return "Skipped pre-translation outside the off-peak window"
+    done = pretranslate()
+    return f"Pre-translated {sum(done.values())} articles: {done}"
+
+
 @shared_task
 def check_translation_status(task_id):
     task = AsyncResult(task_id)
@@ -80,61 +92,135 @@ def scrape_articles():
     logger = logging.getLogger(__name__)
     logger.info("Starting article scraping task")
 
-    active_sources = NewsSource.objects.filter(is_active=True)
-    logger.info(f"Found {active_sources.count()} active news sources")
+    active_sources = list(NewsSource.objects.filter(is_active=True))
+    logger.info(f"Found {len(active_sources)} active news sources")
 
+    # Fetch every source concurrently on one engine, then write to the DB here
+    jobs = []
+    sources = []
     for source in active_sources:
-        try:
-            logger.info(f"Processing source: {source.name} ({source.base_url})")
-            scraper = get_scraper_for_url(source.base_url)
+        logger.info(f"Processing source: {source.name} ({source.base_url})")
+        scraper = get_async_scraper_for_url(source.base_url)
 
-            if not scraper:
-                logger.warning(
-                    f"No scraper found for {source.name} ({source.base_url})"
-                )
-                continue
+        if not scraper:
+            logger.warning(
+                f"No scraper found for {source.name} ({source.base_url})"
+            )
+            continue
+
+        logger.info(f"Using scraper for {source.name}")
+        jobs.append((partial(scraper, fetch_pages=False), source.base_url))
+        sources.append(source)
 
-            logger.info(f"Using scraper for {source.name}")
-            articles = scraper(source.base_url)
+    feed_cache = FeedCache()
+    results = run_scrapers(jobs, feed_cache=feed_cache)
+
+    for source, articles in zip(sources, results):
+        try:
+            if isinstance(articles, Exception):
+                raise articles
 
             if not articles:
                 logger.warning(f"No articles found from {source.name}")
+                feed_cache.commit(source.base_url)
+                record_success(source, new_items=0)
                 continue
 
             logger.info(f"Found {len(articles)} articles from {source.name}")
-            new_count = 0
-            for article_data in articles:
-                try:
-                    existing = Article.objects.filter(
-                        source=source, title=article_data["title"]
-                    ).exists()
-
-                    if not existing:
-                        Article.objects.create(
-                            source=source,
-                            title=article_data["title"],
-                            raw_content=article_data["content"],
-                            processed_content=article_data["content"],
-                            publication_date=parse_date(article_data["date"]),
-                        )
-                        new_count += 1
-                        logger.info(f"Added new article: {article_data['title']}")
-                except Exception as e:
-                    logger.error(
-                        f"Error saving article '{article_data.get('title', 'Unknown')}': {str(e)}"
-                    )
+            new_count, queued = record_discovered(source, articles)
+            # Only now may the next run skip these items as already seen
+            feed_cache.commit(source.base_url)
+            record_success(source, new_items=new_count + queued, found=len(articles))
 
             logger.info(
-                f"Scraped {len(articles)} articles from {source.name}, added {new_count} new articles"
+                f"Scraped {len(articles)} articles from {source.name}, added {new_count} new articles, queued {queued} pages"
             )
+            if queued:
+                fetch_frontier.delay(source_id=source.id)
 
         except Exception as e:
+            feed_cache.discard(source.base_url)
             logger.error(f"Error scraping {source.name}: {str(e)}")
             logger.exception(e)  # This will log the full traceback
 
+    feed_cache.save()
     logger.info("Finished article scraping task")
 
 
+@shared_task
+def schedule_due_sources():
+    """Dispatch one scrape_source task for every source whose interval is up."""
+    dispatched = 0
+    for source in due_sources():
+        if claim_source(source):
+            scrape_source.delay(source.id)
+            dispatched += 1
+    return f"Dispatched {dispatched} source scrapes"
+
+
+@shared_task(bind=True, max_retries=3, soft_time_limit=300)
+def scrape_source(self, source_id):
+    try:
+        source = NewsSource.objects.get(id=source_id, is_active=True)
+    except NewsSource.DoesNotExist:
+        return f"Source {source_id} does not exist or is inactive"
+
+    scraper = get_async_scraper_for_url(source.base_url)
+    if not scraper:
+        logger.warning(f"No scraper found for {source.name} ({source.base_url})")
+        return f"No scraper found for {source.name}"
+
+    feed_cache = FeedCache()
+    try:
+        # Discovery only: article pages are fetched by fetch_frontier
+        articles = run_scrapers(
+            [(partial(scraper, fetch_pages=False), source.base_url)],
+            feed_cache=feed_cache,
+        )[0]
+        if isinstance(articles, Exception):
+            raise articles
+        new_count, queued = record_discovered(source, articles or [])
+        # Validators are kept only once the items are stored, so a retry
+        # after a failed write fetches the feed in full again
+        feed_cache.commit(source.base_url)
+        feed_cache.save()
+    except Exception as e:
+        logger.error(f"Error scraping {source.name}: {str(e)}")
+        if self.request.retries >= self.max_retries:
+            record_failure(source)
+            return f"Giving up on {source.name} until its next backoff slot"
+        raise self.retry(
+            countdown=min(60 * 2 ** self.request.retries, source.scraping_interval),
+            exc=e,
+        )
+
+    record_success(source, new_items=new_count + queued, found=len(articles or []))
+    if queued:
+        fetch_frontier.delay(source_id=source.id)
+    return f"Scraped {len(articles or [])} articles from {source.name}, added {new_count} new articles, queued {queued} pages"
+
+
+@shared_task(soft_time_limit=600)
+def fetch_frontier(source_id=None, batch_size=50):
+    """
+    Fetch pending frontier URLs a batch at a time until none are left.
+
+    Routed to its own "frontier" queue so page fetching runs on a separate
+    worker pool from discovery. Progress is saved per batch; anything a
+    crashed worker had leased is picked up again once its lease expires.
+    Failed fetches back off and are retried by a later (beat) run.
+    """
+    fetched = added = 0
+    while True:
+        rows = claim_batch(batch_size, source_id=source_id)
+        if not rows:
+            break
+        results = fetch_batch(rows)
+        added += complete_batch(rows, results)
+        fetched += len(rows)
+    return f"Fetched {fetched} frontier URLs, added {added} new articles"
+
+
 @shared_task(rate_limit="1/h")
 def update_event_clusters():
     cluster_recent_articles(days=7)
@@ -154,10 +240,11 @@ def update_faiss_index():
 @shared_task
 def process_article_summary(article_id):
     try:
-        article = Article.objects.get(id=article_id)
-        summary = summarize_article(article.content)
+        [article] = canonical_articles([Article.objects.get(id=article_id)])
+        [summary] = inference.summarize([article.processed_content or article.raw_content])
         article.article_summary = summary
-        article.save()
+        article.save(update_fields=["article_summary"])
+        share_with_duplicates([article], ["article_summary"])
         return f"Successfully summarized article {article_id}"
     except Article.DoesNotExist:
         return f"Article {article_id} does not exist"
@@ -165,14 +252,73 @@ def process_article_summary(article_id):
         return f"Error summarizing article {article_id}: {str(e)}"
 
 
+@shared_task(bind=True, soft_time_limit=600)
+def summarize_article_progressive(self, article_id):
+    """
+    Summarize one article, publishing the section summaries of a long
+    article as PROGRESS state (``{"partial": text}``) before the final pass.
+    Runs the model in the worker: partials do not stream through the
+    inference server. A near-duplicate's canonical article is summarized
+    in its place.
+    """
+    [article] = canonical_articles([Article.objects.get(id=article_id)])
+    summary = summarize_article(
+        article.processed_content or article.raw_content,
+        on_partial=lambda partial: self.update_state(
+            state="PROGRESS", meta={"partial": partial}
+        ),
+    )
+    article.article_summary = summary
+    article.save(update_fields=["article_summary"])
+    share_with_duplicates([article], ["article_summary"])
+    return summary
+
+
+SUMMARY_BATCH_ARTICLES = 64
+
+
+@shared_task(soft_time_limit=1800)
+def summarize_articles_batch(article_ids):
+    """
+    Summarize many articles with one model pass per group of
+    ``SUMMARY_BATCH_ARTICLES``, writing each group back in one bulk update.
+    Near-duplicates take the summary of their canonical article.
+    """
+    fields = ("id", "canonical_id", "raw_content", "processed_content")
+    articles = canonical_articles(
+        Article.objects.filter(id__in=article_ids).only(*fields), only=fields
+    )
+    summarized = 0
+    for start in range(0, len(articles), SUMMARY_BATCH_ARTICLES):
+        group = articles[start : start + SUMMARY_BATCH_ARTICLES]
+        try:
+            summaries = inference.summarize(
+                [a.processed_content or a.raw_content for a in group]
+            )
+        except Exception as e:
+            logger.error(f"Batch summarization failed for {len(group)} articles: {str(e)}")
+            continue
+        for article, summary in zip(group, summaries):
+            article.article_summary = summary
+        Article.objects.bulk_update(group, ["article_summary"])
+        share_with_duplicates(group, ["article_summary"])
+        summarized += len(group)
+    return f"Summarized {summarized} of {len(article_ids)} articles"
+
+
 @shared_task
 def process_fake_news_detection(article_id):
     try:
-        article = Article.objects.get(id=article_id)
-        is_fake, confidence = detect_fake_news(article.content)
+        [article] = canonical_articles([Article.objects.get(id=article_id)])
+        [(is_fake, confidence, tier)] = inference.classify(
+            [article.processed_content or article.raw_content]
+        )
         article.is_fake_news = is_fake
         article.fake_news_confidence = confidence
-        article.save()
+        article.fake_news_tier = tier
+        fields = ["is_fake_news", "fake_news_confidence", "fake_news_tier"]
+        article.save(update_fields=fields)
+        share_with_duplicates([article], fields)
         return f"Successfully processed fake news detection for article {article_id}"
     except Article.DoesNotExist:
         return f"Article {article_id} does not exist"
@@ -180,3 +326,39 @@ def process_fake_news_detection(article_id):
         return (
             f"Error processing fake news detection for article {article_id}: {str(e)}"
         )
+
+
+FAKE_NEWS_BATCH_ARTICLES = 256
+
+
+@shared_task(soft_time_limit=1800)
+def detect_fake_news_articles_batch(article_ids):
+    """
+    Score many articles through the prefilter cascade (escalated ones in
+    length-sorted, dynamically padded batches), writing each group of
+    ``FAKE_NEWS_BATCH_ARTICLES`` back in one bulk update. Near-duplicates
+    take the result of their canonical article.
+    """
+    fields = ("id", "canonical_id", "raw_content", "processed_content")
+    articles = canonical_articles(
+        Article.objects.filter(id__in=article_ids).only(*fields), only=fields
+    )
+    scored = 0
+    for start in range(0, len(articles), FAKE_NEWS_BATCH_ARTICLES):
+        group = articles[start : start + FAKE_NEWS_BATCH_ARTICLES]
+        try:
+            results = inference.classify(
+                [a.processed_content or a.raw_content for a in group]
+            )
+        except Exception as e:
+            logger.error(f"Batch fake news detection failed for {len(group)} articles: {str(e)}")
+            continue
+        for article, (is_fake, confidence, tier) in zip(group, results):
+            article.is_fake_news = is_fake
+            article.fake_news_confidence = confidence
+            article.fake_news_tier = tier
+        fields = ["is_fake_news", "fake_news_confidence", "fake_news_tier"]
+        Article.objects.bulk_update(group, fields)
+        share_with_duplicates(group, fields)
+        scored += len(group)
+    return f"Scored {scored} of {len(article_ids)} articles"
@@ -0,0 +1,319 @@
+"""
+Offline HTTP fixtures for the scrapers' tests and benchmarks.
+
+With ``core.utils.scrapers.http_adapter_factory`` set to
+``adapter_from_env``, ``get_session`` picks a transport from the
+environment:
+
+    SCRAPER_HTTP_MODE=record  fetch from the network and save every response
+    SCRAPER_HTTP_MODE=replay  answer every request from saved fixtures
+    SCRAPER_HTTP_MODE=local   send every request to a FixtureServer at
+                              SCRAPER_FIXTURE_SERVER (real sockets, latency)
+
+Fixtures live in SCRAPER_FIXTURES_DIR as ``<sha1>.json`` metadata plus a
+``<sha1>.body`` file with the raw (decoded) response body.
+"""
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from core.utils.text import normalize_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "http"
+
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class FixtureStore:
+    def __init__(self, directory=DEFAULT_FIXTURES_DIR):
+        self.directory = Path(directory)
+
+    def _key(self, url):
+        return hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def save(self, url, status, headers, body):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = self._key(url)
+        meta = {
+            "url": normalize_url(url),
+            "status": status,
+            "headers": {h: headers[h] for h in _KEPT_HEADERS if headers.get(h)},
+        }
+        (self.directory / f"{key}.body").write_bytes(body)
+        (self.directory / f"{key}.json").write_text(json.dumps(meta, indent=2))
+
+    def load(self, url):
+        """``{"url", "status", "headers", "body"}`` for ``url``, or None."""
+        key = self._key(url)
+        try:
+            meta = json.loads((self.directory / f"{key}.json").read_text())
+            meta["body"] = (self.directory / f"{key}.body").read_bytes()
+        except FileNotFoundError:
+            return None
+        return meta
+
+
+def _build_response(request, status, headers, body, reason=None):
+    response = Response()
+    response.status_code = status
+    response.reason = reason or ("OK" if status < 400 else "Not Found")
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Real network transport that saves every response it receives."""
+
+    def __init__(self, store, **kwargs):
+        self.store = store
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        try:
+            self.store.save(request.url, response.status_code, response.headers, response.content)
+        except Exception as e:
+            logger.warning(f"Could not record {request.url}: {str(e)}")
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """In-process transport answering from fixtures; unknown URLs get a 404."""
+
+    def __init__(self, store):
+        self.store = store
+        super().__init__()
+
+    def send(self, request, **kwargs):
+        fixture = self.store.load(request.url)
+        if fixture is None:
+            logger.warning(f"No fixture for {request.url}")
+            return _build_response(request, 404, {}, b"", reason="No fixture")
+        return _build_response(request, fixture["status"], fixture["headers"], fixture["body"])
+
+    def close(self):
+        pass
+
+
+class LocalServerAdapter(HTTPAdapter):
+    """Rewrites every request to a FixtureServer, keeping the original URL."""
+
+    def __init__(self, server_url, **kwargs):
+        self.server_url = server_url.rstrip("/")
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        parts = urlsplit(original_url)
+        request.url = f"{self.server_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+        if parts.query:
+            request.url += f"?{parts.query}"
+        response = super().send(request, **kwargs)
+        request.url = original_url
+        response.url = original_url
+        return response
+
+
+def adapter_from_env(pool_maxsize=10):
+    """Transport selected by SCRAPER_HTTP_MODE, or None for the real network."""
+    mode = os.environ.get("SCRAPER_HTTP_MODE")
+    if not mode:
+        return None
+
+    store = FixtureStore(os.environ.get("SCRAPER_FIXTURES_DIR", DEFAULT_FIXTURES_DIR))
+    if mode == "record":
+        return RecordingAdapter(store, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    if mode == "replay":
+        return ReplayAdapter(store)
+    if mode == "local":
+        return LocalServerAdapter(
+            os.environ["SCRAPER_FIXTURE_SERVER"],
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+        )
+    raise ValueError(f"Unknown SCRAPER_HTTP_MODE: {mode}")
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        _, scheme, rest = self.path.split("/", 2)
+        fixture = server.store.load(f"{scheme}://{rest}")
+
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay:
+            time.sleep(delay)
+        server.count_request()
+
+        if fixture is None:
+            self._send(404, {"Content-Type": "text/plain"}, b"No fixture")
+            return
+
+        headers = dict(fixture["headers"])
+        etag = headers.get("ETag")
+        if etag and self.headers.get("If-None-Match") == etag:
+            self._send(304, {"ETag": etag}, b"")
+            return
+        self._send(fixture["status"], headers, fixture["body"])
+
+    def _send(self, status, headers, body):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Date", formatdate(usegmt=True))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the news sites, serving a FixtureStore over HTTP.
+
+    Every response is delayed by ``latency`` plus up to ``jitter`` seconds.
+    Responses with an ETag honour If-None-Match with a 304. Use as a
+    context manager; ``url`` is what SCRAPER_FIXTURE_SERVER should hold.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, store, latency=0.0, jitter=0.0, host="127.0.0.1", port=0):
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_served = 0
+        self._count_lock = threading.Lock()
+        self._thread = None
+        super().__init__((host, port), _FixtureHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self):
+        with self._count_lock:
+            self.requests_served += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def write_synthetic_fixtures(store, n_items=15):
+    """
+    Fill ``store`` with small generated responses for every built-in scraper.
+
+    The NPR feed is deliberately missing so its scraper falls back to the
+    section page and fetches ``n_items`` article pages, covering the HTML
+    path as well as the RSS and JSON feeds. Every feed item links to an
+    article page too, for the frontier fetches that follow discovery.
+    """
+    rss_item = (
+        "<item><title>{name} story {i}</title><description>Synthetic summary {i} for "
+        "{name}.</description><pubDate>Thu, 14 Mar 2024 17:{i:02d}:00 GMT</pubDate>"
+        "<link>https://{host}/story/{i}</link><guid>{host}-{i}</guid></item>"
+    )
+
+    def rss(name, host):
+        items = "".join(rss_item.format(name=name, host=host, i=i) for i in range(n_items))
+        body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>{items}</channel></rss>'
+        return body.encode("utf-8")
+
+    xml = {"Content-Type": "application/rss+xml; charset=utf-8"}
+    js = {"Content-Type": "application/json"}
+    html = {"Content-Type": "text/html; charset=utf-8"}
+
+    store.save("https://www.abc.net.au/news/feed/45910/rss.xml", 200, dict(xml, ETag='"abc-1"'), rss("ABC", "www.abc.net.au"))
+    store.save("https://www.usatoday.com/arc/outboundfeeds/rss/", 200, dict(xml, ETag='"usat-1"'), rss("USA Today", "www.usatoday.com"))
+
+    guardian = {
+        "response": {
+            "results": [
+                {
+                    "id": f"world/{i}",
+                    "webTitle": f"Guardian story {i}",
+                    "webPublicationDate": f"2024-03-14T17:{i:02d}:00Z",
+                    "webUrl": f"https://www.theguardian.com/world/{i}",
+                    "fields": {"bodyText": f"Synthetic Guardian body {i}. " * 40},
+                }
+                for i in range(n_items)
+            ]
+        }
+    }
+    store.save(
+        "https://content.guardianapis.com/search?api-key=test&show-fields=bodyText%2Cpublication&page-size=15",
+        200, js, json.dumps(guardian).encode("utf-8"),
+    )
+
+    aljazeera = {
+        "items": [
+            {
+                "title": f"Al Jazeera story {i}",
+                "description": f"Synthetic Al Jazeera summary {i}.",
+                "pubDate": f"Thu, 14 Mar 2024 17:{i:02d}:00 +0000",
+                "link": f"https://www.aljazeera.com/news/{i}",
+            }
+            for i in range(n_items)
+        ]
+    }
+    store.save("https://www.aljazeera.com/api/v1/feed", 200, js, json.dumps(aljazeera).encode("utf-8"))
+
+    section = "".join(
+        f'<article><h3><a href="/2024/03/14/story-{i}">NPR story {i}</a></h3></article>'
+        for i in range(n_items)
+    )
+    store.save("https://www.npr.org/sections/news/", 200, html, f"<html><body>{section}</body></html>".encode("utf-8"))
+    paragraph = "<p>" + "Synthetic NPR paragraph with enough words to look like a story. " * 5 + "</p>"
+    for i in range(n_items):
+        page = (
+            f'<html><body><h1>NPR story {i}</h1><time datetime="2024-03-14T17:{i:02d}:00-04:00"></time>'
+            f'<div class="storytext">{paragraph * 8}</div></body></html>'
+        )
+        store.save(f"https://www.npr.org/2024/03/14/story-{i}", 200, html, page.encode("utf-8"))
+
+    for name, url in (
+        ("ABC", "https://www.abc.net.au/story/{i}"),
+        ("USA Today", "https://www.usatoday.com/story/{i}"),
+        ("Al Jazeera", "https://www.aljazeera.com/news/{i}"),
+    ):
+        paragraph = f"<p>{'Synthetic ' + name + ' paragraph with enough words to look like a story. ' * 5}</p>"
+        for i in range(n_items):
+            page = (
+                f'<html><body><article><h1>{name} story {i}</h1>'
+                f'<time datetime="2024-03-14T17:{i:02d}:00Z"></time>{paragraph * 8}</article></body></html>'
+            )
+            store.save(url.format(i=i), 200, html, page.encode("utf-8"))
@@ -0,0 +1,25 @@
+import unittest
+from core.utils.batching import padded_batches
+
+
+class TestPaddedBatches(unittest.TestCase):
+    def test_batches_stay_within_budget(self):
+        lengths = [5, 300, 40, 512, 12, 90, 90, 7, 250, 33]
+        batches = list(padded_batches(lengths, 600))
+        for batch in batches:
+            self.assertLessEqual(max(lengths[i] for i in batch) * len(batch), 600)
+        self.assertEqual(sorted(i for batch in batches for i in batch), list(range(len(lengths))))
+
+    def test_longest_first(self):
+        lengths = [10, 30, 20]
+        self.assertEqual(list(padded_batches(lengths, 1000)), [[1, 2, 0]])
+
+    def test_oversized_input_gets_own_batch(self):
+        self.assertEqual(list(padded_batches([2000, 10, 10], 1000)), [[0], [1, 2]])
+
+    def test_empty(self):
+        self.assertEqual(list(padded_batches([], 1000)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from core.utils import dates
+from core.utils.dates import parse_date
+
+
+class TestParseDate(unittest.TestCase):
+    def test_iso_8601(self):
+        self.assertEqual(
+            parse_date("2024-03-14T21:05:12Z"),
+            datetime(2024, 3, 14, 21, 5, 12, tzinfo=timezone.utc),
+        )
+
+    def test_rfc_2822(self):
+        parsed = parse_date("Thu, 14 Mar 2024 17:05:12 -0400")
+        self.assertEqual(parsed.utcoffset(), timedelta(hours=-4))
+        self.assertEqual(parsed.astimezone(timezone.utc).hour, 21)
+
+    def test_naive_results_are_utc(self):
+        self.assertEqual(
+            parse_date("March 14, 2024"),
+            datetime(2024, 3, 14, tzinfo=timezone.utc),
+        )
+
+    def test_format_is_memoized_per_source(self):
+        parse_date("March 14, 2024, 5:33 PM", source="test-source")
+        self.assertEqual(dates._format_memo["test-source"][0][0], "%B %d, %Y, %I:%M %p")
+
+    def test_empty_and_duration_fall_back_to_now(self):
+        for value in ("", None, "P3M,47S"):
+            parsed = parse_date(value)
+            self.assertIsNotNone(parsed.tzinfo)
+            self.assertLess(datetime.now(timezone.utc) - parsed, timedelta(seconds=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from core.utils.extractors import (
+    EXTRACTORS,
+    GENERIC_EXTRACTOR,
+    lookup_domain,
+    parse_html,
+)
+from core.utils.scrapers import SCRAPERS, get_scraper_for_url, scrape_npr
+
+SECTION = """
+<html><body>
+  <article><h3><a href="/2024/03/14/first">First story</a></h3></article>
+  <article><h2><a href="https://www.npr.org/2024/03/14/second">Second story</a></h2></article>
+  <article><p>No link here</p></article>
+</body></html>
+"""
+
+ARTICLE = """
+<html><head><title>Page</title></head><body>
+  <h1>First story</h1>
+  <time datetime="2024-03-14T17:05:12-04:00">March 14, 2024</time>
+  <div class="storytext"><p>Paragraph one.</p><p> </p><p>Paragraph two.</p></div>
+</body></html>
+"""
+
+UNKNOWN_ARTICLE = """
+<html><head><meta property="og:title" content="Generic title"></head><body>
+  <nav><p>Home News Sport Weather Culture Travel Opinion</p></nav>
+  <div id="main">
+    <p>The first long paragraph of the story that readers care about.</p>
+    <p>The second long paragraph with even more detail about the event.</p>
+  </div>
+  <footer><p>Copyright notice and a long list of footer links here.</p></footer>
+</body></html>
+"""
+
+
+class TestExtractors(unittest.TestCase):
+    def test_section_links(self):
+        links = EXTRACTORS["npr.org"].extract_links(
+            parse_html(SECTION), "https://www.npr.org/sections/news/"
+        )
+        self.assertEqual(
+            links,
+            [
+                ("First story", "https://www.npr.org/2024/03/14/first"),
+                ("Second story", "https://www.npr.org/2024/03/14/second"),
+            ],
+        )
+
+    def test_article_with_spec(self):
+        extracted = EXTRACTORS["npr.org"].extract_article(parse_html(ARTICLE))
+        self.assertEqual(extracted["title"], "First story")
+        self.assertEqual(extracted["content"], "Paragraph one. Paragraph two.")
+        self.assertEqual(extracted["date"], "2024-03-14T17:05:12-04:00")
+
+    def test_generic_fallback(self):
+        extracted = GENERIC_EXTRACTOR.extract_article(parse_html(UNKNOWN_ARTICLE))
+        self.assertEqual(extracted["title"], "Generic title")
+        self.assertTrue(extracted["content"].startswith("The first long paragraph"))
+        self.assertNotIn("Copyright", extracted["content"])
+
+    def test_lookup_domain(self):
+        self.assertEqual(lookup_domain("www.npr.org", SCRAPERS), "npr.org")
+        self.assertEqual(lookup_domain("feeds.npr.org", SCRAPERS), "npr.org")
+        self.assertEqual(lookup_domain("edition.theguardian.com:443", SCRAPERS), "theguardian.com")
+        self.assertIsNone(lookup_domain("example.com", SCRAPERS))
+        self.assertIs(get_scraper_for_url("https://www.npr.org/sections/news/"), scrape_npr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+try:
+    import numpy as np
+    import torch
+    from sklearn.linear_model import LogisticRegression
+    from transformers import (
+        BertTokenizerFast,
+        DebertaV2Config,
+        DebertaV2ForSequenceClassification,
+    )
+    from core.utils import fake_news_detector
+    from core.utils.fake_news_prefilter import FAKE_LABEL, Prefilter, feature_matrix
+except ImportError:
+    torch = None
+
+FAKE = "SHOCKING secret cure they do not want you to know, share before it is deleted"
+REAL = "The ministry said on Tuesday that exports rose 3 percent in March from a year earlier"
+
+
+@unittest.skipIf(torch is None, "needs torch, transformers and scikit-learn")
+class TestTiersAgree(unittest.TestCase):
+    """Both tiers, trained on the labels of train.py, call the same texts fake."""
+
+    @classmethod
+    def setUpClass(cls):
+        texts = [FAKE, REAL]
+        labels = np.array([FAKE_LABEL, 1 - FAKE_LABEL])
+
+        # As train_prefilter
+        model = LogisticRegression(C=100.0, solver="liblinear")
+        model.fit(feature_matrix(texts), (labels == FAKE_LABEL).astype(int))
+        cls.prefilter = Prefilter(model.coef_.ravel(), model.intercept_[0])
+
+        # As train, on a tiny DeBERTa
+        cls.tmp = tempfile.TemporaryDirectory()
+        vocab = Path(cls.tmp.name) / "vocab.txt"
+        words = sorted({w for text in texts for w in text.lower().replace(",", "").split()})
+        vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ","] + words))
+        cls.tokenizer = BertTokenizerFast(str(vocab))
+
+        torch.manual_seed(0)
+        config = DebertaV2Config(
+            vocab_size=len(cls.tokenizer),
+            hidden_size=32,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            intermediate_size=64,
+            max_position_embeddings=128,
+            num_labels=2,
+        )
+        cls.detector = DebertaV2ForSequenceClassification(config)
+        batch = cls.tokenizer(texts, padding=True, return_tensors="pt")
+        optimizer = torch.optim.AdamW(cls.detector.parameters(), lr=1e-3)
+        cls.detector.train()
+        for _ in range(50):
+            loss = cls.detector(**batch, labels=torch.tensor(labels)).loss
+            loss.backward()
+            optimizer.step()
+            optimizer.zero_grad()
+        cls.detector.eval()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def get_model(self, name):
+        if name == "fake_news_prefilter":
+            return self.prefilter
+        return self.detector, self.tokenizer
+
+    def classify(self, band):
+        with mock.patch.object(fake_news_detector.model_registry, "get_model", self.get_model):
+            return fake_news_detector.classify_cascade([FAKE, REAL], band=band)
+
+    def test_prefilter_and_transformer_agree(self):
+        # An empty band leaves every text to the prefilter, a full one to the transformer
+        by_prefilter = self.classify((0.0, 0.0))
+        by_transformer = self.classify((0.0, 1.0))
+
+        self.assertEqual({tier for _, _, tier in by_prefilter}, {fake_news_detector.TIER_PREFILTER})
+        self.assertEqual({tier for _, _, tier in by_transformer}, {fake_news_detector.TIER_TRANSFORMER})
+        self.assertEqual([is_fake for is_fake, _, _ in by_prefilter], [True, False])
+        self.assertEqual([is_fake for is_fake, _, _ in by_transformer], [True, False])
+        for is_fake, score, _ in by_prefilter + by_transformer:
+            self.assertEqual(is_fake, score > 50)
+
+    def test_missing_prefilter_is_looked_up_once(self):
+        calls = []
+
+        def get_model(name):
+            calls.append(name)
+            if name == "fake_news_prefilter":
+                raise FileNotFoundError(name)
+            return self.detector, self.tokenizer
+
+        with mock.patch.object(fake_news_detector, "_prefilter_missing", False), \
+                mock.patch.object(fake_news_detector.model_registry, "get_model", get_model):
+            for _ in range(3):
+                results = fake_news_detector.classify_cascade([FAKE, REAL])
+                self.assertEqual([r[0] for r in results], [True, False])
+        self.assertEqual(calls.count("fake_news_prefilter"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
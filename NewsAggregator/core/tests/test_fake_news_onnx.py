@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import numpy as np
+    import torch
+    from transformers import DebertaV2Config, DebertaV2ForSequenceClassification
+    from core.utils.fake_news_onnx import OnnxDetector, export_onnx, onnx_path
+    from core.utils.fake_news_prefilter import FAKE_LABEL
+except ImportError:
+    torch = None
+
+
+@unittest.skipIf(torch is None, "needs torch, transformers and onnxruntime")
+class TestOnnxParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.model_dir = Path(cls.tmp.name)
+        torch.manual_seed(0)
+        config = DebertaV2Config(
+            vocab_size=200,
+            hidden_size=32,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            intermediate_size=64,
+            max_position_embeddings=128,
+            num_labels=2,
+        )
+        cls.model = DebertaV2ForSequenceClassification(config).eval()
+        cls.model.save_pretrained(cls.model_dir)
+        export_onnx(cls.model_dir, quantize=True)
+
+        # Two padded rows of different lengths, like a dynamically padded batch
+        rng = np.random.default_rng(0)
+        cls.input_ids = rng.integers(3, 200, size=(3, 24))
+        cls.attention_mask = np.ones_like(cls.input_ids)
+        cls.attention_mask[1, 10:] = 0
+        cls.attention_mask[2, 17:] = 0
+        cls.input_ids[cls.attention_mask == 0] = 0
+
+        with torch.no_grad():
+            cls.expected = cls.model(
+                input_ids=torch.tensor(cls.input_ids),
+                attention_mask=torch.tensor(cls.attention_mask),
+            ).logits.numpy()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_fp32_logits_match_torch(self):
+        detector = OnnxDetector(onnx_path(self.model_dir), threads=1)
+        logits = detector.logits(self.input_ids, self.attention_mask)
+        np.testing.assert_allclose(logits, self.expected, atol=1e-4)
+
+    def test_int8_probabilities_close_to_torch(self):
+        detector = OnnxDetector(onnx_path(self.model_dir, quantized=True), threads=1)
+        expected = torch.softmax(torch.tensor(self.expected), dim=1)[:, FAKE_LABEL].numpy()
+        probabilities = detector.fake_probabilities(self.input_ids, self.attention_mask)
+        np.testing.assert_allclose(probabilities, expected, atol=0.05)
+
+    def test_missing_export(self):
+        with self.assertRaises(FileNotFoundError):
+            OnnxDetector(self.model_dir / "missing.onnx")
+
+
+if __name__ == '__main__':
+    unittest.main()
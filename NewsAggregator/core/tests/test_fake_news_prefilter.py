@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+import numpy as np
+from core.utils.fake_news_prefilter import N_FEATURES, Prefilter, features, in_band
+
+
+class TestFeatures(unittest.TestCase):
+    def test_deterministic_and_normalised(self):
+        text = "Shocking hoax: celebrity secretly replaced by body double, insiders say."
+        indices, values = features(text)
+        again_indices, again_values = features(text)
+        np.testing.assert_array_equal(indices, again_indices)
+        np.testing.assert_array_equal(values, again_values)
+        self.assertAlmostEqual(float(np.linalg.norm(values)), 1.0, places=5)
+        self.assertTrue(np.all((indices >= 0) & (indices < N_FEATURES)))
+
+    def test_case_insensitive(self):
+        np.testing.assert_array_equal(features("Breaking News")[0], features("breaking news")[0])
+
+    def test_empty(self):
+        indices, values = features("")
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(len(values), 0)
+
+
+class TestPrefilter(unittest.TestCase):
+    def setUp(self):
+        weights = np.zeros(N_FEATURES, dtype=np.float32)
+        indices, values = features("hoax")
+        weights[indices] = 20 * np.sign(values)
+        self.prefilter = Prefilter(weights, bias=-2.0)
+
+    def test_scores(self):
+        self.assertGreater(self.prefilter.score("hoax"), 0.99)
+        self.assertLess(self.prefilter.score("parliament passed the budget"), 0.2)
+        self.assertAlmostEqual(self.prefilter.score(""), 1 / (1 + np.exp(2.0)), places=5)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "prefilter.npz"
+            self.prefilter.save(path)
+            loaded = Prefilter.load(path)
+        self.assertEqual(
+            loaded.score_many(["hoax", "budget"]), self.prefilter.score_many(["hoax", "budget"])
+        )
+
+    def test_in_band(self):
+        self.assertTrue(in_band(0.5, (0.1, 0.9)))
+        self.assertFalse(in_band(0.05, (0.1, 0.9)))
+        self.assertFalse(in_band(0.95, (0.1, 0.9)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from core.utils.feed_parser import iter_feed_items
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+  <title>Feed</title>
+  <item>
+    <title>First</title>
+    <description><![CDATA[<p>Body</p>]]></description>
+    <pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
+    <link>https://example.com/1</link>
+    <guid>id-1</guid>
+  </item>
+  <item>
+    <title>Second</title>
+    <dc:date>2024-01-02T00:00:00Z</dc:date>
+    <link>https://example.com/2</link>
+  </item>
+  <item><title>Third</title></item>
+</channel>
+</rss>"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Atom entry</title>
+    <id>urn:entry:1</id>
+    <link rel="alternate" href="https://example.com/a"/>
+    <updated>2024-01-01T00:00:00Z</updated>
+    <summary>Summary</summary>
+  </entry>
+</feed>"""
+
+
+class TestFeedParser(unittest.TestCase):
+    def test_rss_items_are_normalized(self):
+        items = list(iter_feed_items(RSS))
+        self.assertEqual([i["title"] for i in items], ["First", "Second", "Third"])
+        self.assertEqual(items[0]["content"], "<p>Body</p>")
+        self.assertEqual(items[0]["date"], "Mon, 01 Jan 2024 10:00:00 GMT")
+        self.assertEqual(items[0]["guid"], "id-1")
+        self.assertEqual(items[1]["date"], "2024-01-02T00:00:00Z")
+        self.assertEqual(items[1]["guid"], "https://example.com/2")
+
+    def test_limit_stops_early(self):
+        self.assertEqual(len(list(iter_feed_items(RSS, limit=2))), 2)
+
+    def test_atom_entries(self):
+        (item,) = list(iter_feed_items(ATOM))
+        self.assertEqual(item["title"], "Atom entry")
+        self.assertEqual(item["url"], "https://example.com/a")
+        self.assertEqual(item["content"], "Summary")
+        self.assertEqual(item["guid"], "urn:entry:1")
+
+    def test_truncated_feed_keeps_complete_items(self):
+        items = list(iter_feed_items(RSS[: RSS.index(b"<item><title>Third")]))
+        self.assertEqual([i["title"] for i in items], ["First", "Second"])
+
+
+if __name__ == '__main__':
+    unittest.main()
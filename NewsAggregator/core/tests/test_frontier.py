@@ -0,0 +1,138 @@
+import os
+import unittest
+from datetime import timedelta
+from unittest import mock
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+from django.test import TestCase
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+from core.models import Article, FrontierURL, NewsSource
+from core.utils import frontier, ingest
+from core.utils.fetch_engine import RobotsDisallowed
+
+
+def setUpModule():
+    global _databases
+    _databases = setup_databases(verbosity=0, interactive=False)
+
+
+def tearDownModule():
+    teardown_databases(_databases, verbosity=0)
+
+
+class TestFrontier(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(name="Example", base_url="https://example.com")
+        patcher = mock.patch.object(ingest, "dispatch_follow_up")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = timezone.now()
+        frontier.record_discovered(
+            self.source,
+            [
+                {
+                    "title": f"Story {i}",
+                    "content": f"Teaser {i}.",
+                    "date": "2024-03-14T12:00:00+00:00",
+                    "url": f"https://example.com/story/{i}",
+                }
+                for i in range(3)
+            ],
+        )
+
+    def page(self, row):
+        content = f"Full text of {row.title}."
+        return {"title": row.title, "content": content, "date": "", "url": row.url}, None
+
+    def test_discovered_urls_are_queued_once(self):
+        self.assertEqual(FrontierURL.objects.filter(state=FrontierURL.PENDING).count(), 3)
+        again = {"title": "Story 0", "content": "", "date": "", "url": "https://example.com/story/0"}
+        ingested, queued = frontier.record_discovered(self.source, [again])
+        self.assertEqual((ingested, queued), (0, 0))
+
+    def test_full_text_items_survive_a_failed_ingest(self):
+        item = {
+            "title": "Long read",
+            "content": "Paragraph. " * frontier.FULL_CONTENT_CHARS,
+            "date": "2024-03-14T12:00:00+00:00",
+            "url": "https://example.com/long-read",
+        }
+        with mock.patch.object(ingest, "ingest_articles", side_effect=RuntimeError("db down")):
+            with self.assertRaises(RuntimeError):
+                frontier.record_discovered(self.source, [item])
+        self.assertFalse(FrontierURL.objects.filter(url=item["url"]).exists())
+
+        self.assertEqual(frontier.record_discovered(self.source, [item]), (1, 0))
+        row = FrontierURL.objects.get(url=item["url"])
+        self.assertEqual(row.state, FrontierURL.DONE)
+        self.assertEqual(row.article.title, "Long read")
+
+    def test_leased_rows_are_not_claimed_twice(self):
+        first = frontier.claim_batch(2, now=self.now)
+        second = frontier.claim_batch(10, now=self.now)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({r.pk for r in first} & {r.pk for r in second})
+        self.assertEqual(frontier.claim_batch(10, now=self.now), [])
+
+    def test_expired_lease_is_claimed_again(self):
+        rows = frontier.claim_batch(now=self.now)
+        expiry = self.now + timedelta(seconds=frontier.LEASE_SECONDS)
+        self.assertEqual(frontier.claim_batch(now=expiry - timedelta(seconds=1)), [])
+
+        reclaimed = frontier.claim_batch(now=expiry + timedelta(seconds=1))
+        self.assertEqual({r.pk for r in reclaimed}, {r.pk for r in rows})
+        self.assertTrue(all(r.attempts == 2 for r in reclaimed))
+
+    def test_fetched_rows_are_stored_and_done(self):
+        rows = frontier.claim_batch(now=self.now)
+        added = frontier.complete_batch(rows, [self.page(row) for row in rows], now=self.now)
+        self.assertEqual(added, 3)
+        self.assertEqual(FrontierURL.objects.filter(state=FrontierURL.DONE).count(), 3)
+        row = FrontierURL.objects.get(url="https://example.com/story/0")
+        self.assertEqual(row.article.raw_content, "Full text of Story 0.")
+
+    def test_failed_fetch_backs_off_before_retrying(self):
+        [row] = frontier.claim_batch(1, now=self.now)
+        frontier.complete_batch([row], [(None, ConnectionError("timed out"))], now=self.now)
+
+        row.refresh_from_db()
+        self.assertEqual(row.state, FrontierURL.PENDING)
+        retry_at = self.now + frontier.retry_delay(1)
+        self.assertEqual(row.lease_expires_at, retry_at)
+        early = frontier.claim_batch(now=retry_at - timedelta(seconds=1))
+        self.assertNotIn(row.pk, [r.pk for r in early])
+        due = frontier.claim_batch(now=retry_at + timedelta(seconds=1))
+        self.assertIn(row.pk, [r.pk for r in due])
+        self.assertGreater(frontier.retry_delay(2), frontier.retry_delay(1))
+
+    def test_row_gives_up_after_max_attempts(self):
+        now = self.now
+        for attempt in range(1, frontier.MAX_ATTEMPTS + 1):
+            [row] = frontier.claim_batch(1, now=now)
+            self.assertEqual(row.attempts, attempt)
+            frontier.complete_batch([row], [(None, ConnectionError("timed out"))], now=now)
+            now += frontier.retry_delay(attempt) + timedelta(seconds=1)
+
+        row.refresh_from_db()
+        self.assertEqual(row.state, FrontierURL.FAILED)
+        self.assertIsNone(row.lease_expires_at)
+        # Stored from the feed's teaser instead
+        self.assertEqual(row.article.raw_content, row.summary)
+        later = frontier.claim_batch(now=now + timedelta(days=1))
+        self.assertNotIn(row.pk, [r.pk for r in later])
+
+    def test_robots_refusal_is_final(self):
+        [row] = frontier.claim_batch(1, now=self.now)
+        frontier.complete_batch([row], [(None, RobotsDisallowed(row.url))], now=self.now)
+        row.refresh_from_db()
+        self.assertEqual(row.state, FrontierURL.FAILED)
+        self.assertEqual(Article.objects.filter(url=row.url).count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
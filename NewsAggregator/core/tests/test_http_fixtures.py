@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from core.utils.feed_cache import FeedCache
+from core.utils.fetch_engine import run_scrapers
+from http_fixtures import (
+    FixtureServer,
+    FixtureStore,
+    adapter_from_env,
+    write_synthetic_fixtures,
+)
+from core.utils import scrapers
+from core.utils.robots_cache import RobotsCache
+from core.utils.scrapers import ASYNC_SCRAPERS, get_session
+
+SOURCES = {
+    "npr.org": "https://www.npr.org/sections/news/",
+    "theguardian.com": "https://www.theguardian.com/international",
+    "aljazeera.com": "https://www.aljazeera.com",
+    "abc.net.au": "https://www.abc.net.au/news/",
+    "usatoday.com": "https://www.usatoday.com/news/",
+}
+
+
+class TestOfflineScrapers(unittest.TestCase):
+    """Runs every scraper against the local fixture server, no network needed."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = FixtureStore(self.tmp.name)
+        write_synthetic_fixtures(self.store, n_items=5)
+        self.server = FixtureServer(self.store).start()
+        env = {"SCRAPER_HTTP_MODE": "local", "SCRAPER_FIXTURE_SERVER": self.server.url}
+        self.env = mock.patch.dict(os.environ, env)
+        self.env.start()
+        self.transport = mock.patch.object(scrapers, "http_adapter_factory", adapter_from_env)
+        self.transport.start()
+
+    def tearDown(self):
+        self.transport.stop()
+        self.env.stop()
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def _scrape_all(self, **engine_kwargs):
+        jobs = [(ASYNC_SCRAPERS[domain], url) for domain, url in SOURCES.items()]
+        engine_kwargs.setdefault("robots", RobotsCache(redis_url=""))
+        return dict(zip(SOURCES, run_scrapers(jobs, delay_range=(0, 0), **engine_kwargs)))
+
+    def test_every_scraper_returns_articles(self):
+        for domain, articles in self._scrape_all().items():
+            self.assertEqual(len(articles), 5, domain)
+            for article in articles:
+                for field in ("title", "content", "date", "url"):
+                    self.assertTrue(article[field], f"{domain} article has empty {field}")
+
+    def test_unchanged_feeds_are_skipped(self):
+        feed_cache = FeedCache(os.path.join(self.tmp.name, "feed_cache.json"))
+        self._scrape_all(feed_cache=feed_cache)
+        feed_cache.commit()
+        feed_cache.save()
+        again = self._scrape_all(feed_cache=FeedCache(feed_cache.path))
+        self.assertEqual(again["abc.net.au"], [])
+        self.assertEqual(again["theguardian.com"], [])
+
+    def test_uncommitted_feeds_are_fetched_again(self):
+        feed_cache = FeedCache(os.path.join(self.tmp.name, "feed_cache.json"))
+        self._scrape_all(feed_cache=feed_cache)
+        # abc.net.au's articles were stored, usatoday.com's write failed
+        feed_cache.commit(SOURCES["abc.net.au"])
+        feed_cache.discard(SOURCES["usatoday.com"])
+        feed_cache.save()
+        again = self._scrape_all(feed_cache=FeedCache(feed_cache.path))
+        self.assertEqual(again["abc.net.au"], [])
+        self.assertEqual(len(again["usatoday.com"]), 5)
+
+    def test_record_then_replay(self):
+        record_dir = os.path.join(self.tmp.name, "recorded")
+        # Recording from the stand-in server plays the part of the network
+        url = f"{self.server.url}/https/www.usatoday.com/arc/outboundfeeds/rss/"
+        env = {"SCRAPER_HTTP_MODE": "record", "SCRAPER_FIXTURES_DIR": record_dir}
+        with mock.patch.dict(os.environ, env):
+            live = get_session().get(url)
+        self.assertIsNotNone(FixtureStore(record_dir).load(url))
+
+        env["SCRAPER_HTTP_MODE"] = "replay"
+        with mock.patch.dict(os.environ, env):
+            replayed = get_session().get(url)
+        self.assertEqual(replayed.status_code, 200)
+        self.assertEqual(replayed.content, live.content)
+        self.assertEqual(replayed.headers["ETag"], live.headers["ETag"])
+
+if __name__ == '__main__':
+    unittest.main()
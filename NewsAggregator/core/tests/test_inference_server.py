@@ -0,0 +1,159 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+import numpy as np
+from core.utils import inference
+from core.utils.inference import InferenceClient, InferenceError, ServerUnavailable, encode_array
+from core.utils.inference_server import InferenceServer, MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def upper(texts, suffix=""):
+            self.calls.append(list(texts))
+            return [text.upper() + suffix for text in texts]
+
+        self.upper = upper
+
+    def submit_concurrently(self, batcher, requests):
+        results = [None] * len(requests)
+
+        def run(i, texts, options):
+            results[i] = batcher.submit(texts, options)
+
+        threads = [
+            threading.Thread(target=run, args=(i, texts, options))
+            for i, (texts, options) in enumerate(requests)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_requests_share_a_batch(self):
+        batcher = MicroBatcher(self.upper, max_batch=64, max_wait=0.2)
+        self.addCleanup(batcher.stop)
+        requests = [([f"a{i}", f"b{i}"], None) for i in range(8)]
+        results = self.submit_concurrently(batcher, requests)
+
+        self.assertEqual(results, [[f"A{i}", f"B{i}"] for i in range(8)])
+        self.assertLess(len(self.calls), 8)
+        self.assertEqual(sum(map(len, self.calls)), 16)
+
+    def test_max_batch_caps_a_batch(self):
+        batcher = MicroBatcher(self.upper, max_batch=4, max_wait=0.2)
+        self.addCleanup(batcher.stop)
+        self.submit_concurrently(batcher, [([str(i)], None) for i in range(12)])
+        self.assertTrue(all(len(call) <= 4 for call in self.calls))
+
+    def test_options_run_apart(self):
+        batcher = MicroBatcher(self.upper, max_batch=64, max_wait=0.2)
+        self.addCleanup(batcher.stop)
+        results = self.submit_concurrently(
+            batcher, [(["x"], {"suffix": "!"}), (["y"], {"suffix": "?"}), (["z"], {"suffix": "!"})]
+        )
+        self.assertEqual(results, [["X!"], ["Y?"], ["Z!"]])
+
+    def test_errors_reach_every_request_of_the_batch(self):
+        def fail(texts):
+            raise RuntimeError("model exploded")
+
+        batcher = MicroBatcher(fail, max_wait=0.0)
+        self.addCleanup(batcher.stop)
+        with self.assertRaises(RuntimeError):
+            batcher.submit(["a"])
+
+
+class TestInferenceServer(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.address = os.path.join(tmp.name, "inference.sock")
+
+        handlers = {
+            "summarize": lambda texts, max_length=130, min_length=30: [
+                text[:max_length] for text in texts
+            ],
+            "embed": lambda texts: np.array([[len(text), 1.0] for text in texts]),
+            "classify": lambda texts: [[False, 12.5, "prefilter"] for _ in texts],
+            "slow": lambda texts: time.sleep(0.5) or texts,
+        }
+        self.server = InferenceServer(
+            self.address, handlers, {"embed": encode_array}, max_wait=0.005
+        ).start()
+        self.addCleanup(self.server.stop)
+        self.client = InferenceClient(self.address, timeout=5)
+        self.addCleanup(self.client.close)
+
+    def test_round_trip(self):
+        self.assertEqual(self.client.summarize(["abcdef", "xy"], max_length=3), ["abc", "xy"])
+        self.assertEqual(self.client.classify(["a"]), [(False, 12.5, "prefilter")])
+        embeddings = self.client.embed(["abc", "de"])
+        self.assertEqual(embeddings.dtype, np.float32)
+        np.testing.assert_array_equal(embeddings, [[3, 1], [2, 1]])
+
+    def test_ping_counts_batches(self):
+        self.client.summarize(["a"])
+        stats = self.client.ping()
+        self.assertEqual(stats["summarize"], {"batches": 1, "requests": 1})
+
+    def test_unknown_op(self):
+        with self.assertRaises(InferenceError):
+            self.client.request("translate", ["a"])
+
+    def test_unreachable_server(self):
+        client = InferenceClient(self.address + ".missing", timeout=1)
+        with self.assertRaises(ServerUnavailable):
+            client.summarize(["a"])
+        with mock.patch.object(inference, "get_client", return_value=client):
+            self.assertIsNone(inference._remote("summarize", ["a"], 130, 30))
+
+    def test_reconnects_are_backed_off(self):
+        client = InferenceClient(self.address + ".later", timeout=1)
+        self.addCleanup(client.close)
+        now = time.monotonic()
+        with mock.patch.object(inference.time, "monotonic", return_value=now):
+            with self.assertRaises(ServerUnavailable):
+                client.summarize(["a"])
+            server = InferenceServer(self.address + ".later", {"summarize": lambda texts: texts})
+            self.addCleanup(server.stop)
+            server.start()
+            # Not tried again until the delay has passed
+            with self.assertRaises(ServerUnavailable):
+                client.summarize(["a"])
+        later = now + inference.RECONNECT_DELAY
+        with mock.patch.object(inference.time, "monotonic", return_value=later):
+            self.assertEqual(client.request("summarize", ["a"]), ["a"])
+
+    def test_reconnect_delay_doubles(self):
+        client = InferenceClient(self.address + ".missing", timeout=1)
+        delays = []
+        for _ in range(3):
+            with mock.patch.object(inference.time, "monotonic", return_value=client._retry_at):
+                with self.assertRaises(ServerUnavailable):
+                    client.summarize(["a"])
+                delays.append(client._retry_at - inference.time.monotonic())
+        self.assertEqual(delays, [5, 10, 20])
+
+    def test_busy_server_times_out_instead_of_falling_back(self):
+        client = InferenceClient(self.address, timeout=0.1)
+        self.addCleanup(client.close)
+        with mock.patch.object(inference, "get_client", return_value=client):
+            with self.assertRaises(socket.timeout):
+                inference._remote("request", "slow", ["a"])
+
+    def test_dropped_connection_is_reopened(self):
+        self.client.ping()
+        # As if the server restarted since the connection was opened
+        self.client._local.conn[0].shutdown(socket.SHUT_RDWR)
+        self.assertEqual(self.client.summarize(["abc"], max_length=2), ["ab"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import unittest
+from unittest import mock
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+from django.test import TestCase
+from django.test.utils import setup_databases, teardown_databases
+from core.models import Article, NewsSource
+from core.utils import ingest
+
+
+def setUpModule():
+    global _databases
+    _databases = setup_databases(verbosity=0, interactive=False)
+
+
+def tearDownModule():
+    teardown_databases(_databases, verbosity=0)
+
+
+def scraped(title, content="Short teaser text."):
+    return {
+        "title": title,
+        "content": content,
+        "date": "2024-03-14T12:00:00+00:00",
+        "url": f"https://example.com/{title.lower().replace(' ', '-')}",
+    }
+
+
+class TestIngestArticles(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(name="Example", base_url="https://example.com")
+        patcher = mock.patch.object(ingest, "dispatch_follow_up")
+        self.dispatch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_duplicate_headlines_in_one_batch_are_stored_once(self):
+        created = ingest.ingest_articles(
+            self.source,
+            [scraped("Storm hits coast"), scraped("Storm Hits  Coast!"), scraped("Markets rally")],
+        )
+        self.assertEqual(len(created), 2)
+        self.assertEqual(Article.objects.filter(source=self.source).count(), 2)
+
+    def test_existing_headlines_are_skipped(self):
+        ingest.ingest_articles(self.source, [scraped("Storm hits coast")])
+        created = ingest.ingest_articles(
+            self.source, [scraped("storm hits coast"), scraped("Markets rally")]
+        )
+        self.assertEqual([a.title for a in created], ["Markets rally"])
+        self.assertEqual(Article.objects.filter(source=self.source).count(), 2)
+
+    def test_rows_stored_concurrently_are_left_to_their_worker(self):
+        ingest.ingest_articles(self.source, [scraped("Storm hits coast")])
+        real_existing_keys = ingest._existing_keys
+        lookups = []
+
+        def existing_keys(source, title_keys):
+            lookups.append(title_keys)
+            # The first lookup runs before the other worker's insert lands
+            return set() if len(lookups) == 1 else real_existing_keys(source, title_keys)
+
+        with mock.patch.object(ingest, "_existing_keys", existing_keys):
+            created = ingest.ingest_articles(
+                self.source, [scraped("Storm hits coast"), scraped("Markets rally")]
+            )
+        self.assertEqual([a.title for a in created], ["Markets rally"])
+        self.assertIsNotNone(created[0].pk)
+        self.assertEqual(len(lookups), 2)
+        self.assertEqual(Article.objects.filter(source=self.source).count(), 2)
+
+    def test_follow_up_is_dispatched_once_per_new_row(self):
+        with mock.patch.object(ingest, "detect_language", return_value=("es", 1.0)):
+            created = ingest.ingest_articles(
+                self.source, [scraped("Tormenta en la costa"), scraped("Suben los mercados")]
+            )
+            ingest.ingest_articles(self.source, [scraped("Tormenta en la costa")])
+        self.dispatch.assert_called_once()
+        self.assertCountEqual(self.dispatch.call_args[0][0], [a.id for a in created])
+
+    def test_english_rows_are_not_translated(self):
+        with mock.patch.object(ingest, "detect_language", return_value=("en", 1.0)):
+            ingest.ingest_articles(self.source, [scraped("Storm hits coast")])
+        self.dispatch.assert_called_once_with([])
+
+
+if __name__ == '__main__':
+    unittest.main()
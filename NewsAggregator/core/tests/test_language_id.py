@@ -0,0 +1,33 @@
+import unittest
+from core.utils.language_id import detect_language, needs_translation
+
+
+class TestDetectLanguage(unittest.TestCase):
+    def test_latin_languages(self):
+        samples = {
+            "en": "The president said on Monday that the talks with the union had broken down.",
+            "es": "El presidente dijo el lunes que las conversaciones con el sindicato se habían roto.",
+            "fr": "Le président a déclaré lundi que les discussions avec le syndicat avaient échoué.",
+            "de": "Der Präsident sagte am Montag, die Gespräche mit der Gewerkschaft seien gescheitert.",
+        }
+        for language, text in samples.items():
+            with self.subTest(language=language):
+                self.assertEqual(detect_language(text)[0], language)
+
+    def test_script_shortcut(self):
+        self.assertEqual(
+            detect_language("Президент заявил в понедельник, что переговоры сорвались."),
+            ("ru", 1.0),
+        )
+
+    def test_too_short_is_undetermined(self):
+        self.assertEqual(detect_language("OK 123"), ("", 0.0))
+
+    def test_needs_translation(self):
+        self.assertFalse(needs_translation("en"))
+        self.assertFalse(needs_translation(""))
+        self.assertTrue(needs_translation("es"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import threading
+import unittest
+from core.utils import model_registry
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.loads = 0
+        self.warmed = []
+
+        def loader():
+            self.loads += 1
+            return object()
+
+        model_registry.register("test-model", loader, warmup=self.warmed.append)
+        self.addCleanup(model_registry.unload, "test-model")
+
+    def test_loaded_once_across_threads(self):
+        seen = []
+        threads = [
+            threading.Thread(target=lambda: seen.append(model_registry.get_model("test-model")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(len({id(model) for model in seen}), 1)
+
+    def test_warmup_loads_and_runs_inference(self):
+        model_registry.warmup(["test-model"])
+        self.assertTrue(model_registry.is_loaded("test-model"))
+        self.assertEqual(self.warmed, [model_registry.get_model("test-model")])
+        self.assertEqual(self.loads, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
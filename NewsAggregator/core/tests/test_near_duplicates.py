@@ -0,0 +1,176 @@
+import os
+import unittest
+from unittest import mock
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+from django.test import TestCase
+from django.test.utils import setup_databases, teardown_databases
+from core.models import Article, NewsSource
+from core.utils import ingest
+from core.utils.near_duplicates import (
+    BANDS,
+    MIN_TOKENS,
+    NUM_PERM,
+    band_keys,
+    canonical_articles,
+    minhash,
+    share_with_duplicates,
+    similarity,
+)
+
+STORY = (
+    "Heavy rain and strong winds hit the northern coast on Tuesday, cutting power "
+    "to thousands of homes and closing several roads, officials said. Emergency "
+    "crews worked through the night to clear fallen trees, and forecasters warned "
+    "that a second storm could arrive by the weekend, bringing more flooding to "
+    "low lying towns along the river."
+)
+REWRITE = STORY.replace("officials said", "local officials said").replace(
+    "by the weekend", "by Saturday"
+)
+OTHER = (
+    "The central bank left interest rates unchanged on Wednesday and said inflation "
+    "was easing faster than expected, though policymakers cautioned that wage growth "
+    "remained strong and that any cut would depend on data over the coming months, "
+    "sending bond yields lower and lifting shares of homebuilders and regional banks."
+)
+
+
+def setUpModule():
+    global _databases
+    _databases = setup_databases(verbosity=0, interactive=False)
+
+
+def tearDownModule():
+    teardown_databases(_databases, verbosity=0)
+
+
+class TestMinHash(unittest.TestCase):
+    def test_signature_shape_and_determinism(self):
+        signature = minhash(STORY)
+        self.assertEqual(signature.shape, (NUM_PERM,))
+        self.assertEqual(signature.dtype.name, "uint32")
+        self.assertTrue((signature == minhash(STORY)).all())
+
+    def test_case_and_punctuation_do_not_matter(self):
+        self.assertEqual(similarity(minhash(STORY), minhash(STORY.upper().replace(",", ""))), 1.0)
+
+    def test_short_text_has_no_signature(self):
+        self.assertIsNone(minhash(" ".join(["word"] * (MIN_TOKENS - 1))))
+        self.assertIsNone(minhash(""))
+        self.assertIsNone(minhash(None))
+
+    def test_similarity_separates_rewrites_from_other_stories(self):
+        self.assertGreaterEqual(similarity(minhash(STORY), minhash(REWRITE)), 0.5)
+        self.assertLess(similarity(minhash(STORY), minhash(OTHER)), 0.1)
+
+    def test_band_keys(self):
+        keys = band_keys(minhash(STORY))
+        self.assertEqual(len(keys), BANDS)
+        self.assertEqual(keys, band_keys(minhash(STORY)))
+        self.assertTrue(all(-(2**63) <= key < 2**63 for key in keys))
+        # Identical rows in different bands still land in different buckets
+        self.assertEqual(len(set(band_keys(minhash(STORY) * 0))), BANDS)
+
+    def test_near_duplicates_share_a_band(self):
+        self.assertTrue(set(band_keys(minhash(STORY))) & set(band_keys(minhash(REWRITE))))
+        self.assertFalse(set(band_keys(minhash(STORY))) & set(band_keys(minhash(OTHER))))
+
+
+def scraped(title, content):
+    return {"title": title, "content": content, "date": "2024-03-14T12:00:00+00:00", "url": ""}
+
+
+class TestDuplicateLinking(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(name="Example", base_url="https://example.com")
+        patcher = mock.patch.object(ingest, "dispatch_follow_up")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_duplicates_within_one_batch_are_linked(self):
+        created = ingest.ingest_articles(
+            self.source,
+            [scraped("Storm hits coast", STORY), scraped("Storm batters coast", STORY),
+             scraped("Rates on hold", OTHER)],
+        )
+        by_title = {a.title: a for a in created}
+        canonical = by_title["Storm hits coast"]
+        self.assertIsNone(canonical.canonical_id)
+        self.assertEqual(by_title["Storm batters coast"].canonical_id, canonical.id)
+        self.assertIsNone(by_title["Rates on hold"].canonical_id)
+        self.assertEqual(canonical.lsh_buckets.count(), BANDS)
+        self.assertEqual(by_title["Storm batters coast"].lsh_buckets.count(), 0)
+
+    def test_results_reach_duplicates_linked_before_them(self):
+        ingest.ingest_articles(self.source, [scraped("Storm hits coast", STORY)])
+        [duplicate] = ingest.ingest_articles(self.source, [scraped("Storm batters coast", STORY)])
+        canonical = duplicate.canonical
+        self.assertIsNone(duplicate.article_summary)
+
+        canonical.article_summary = "Storm hits the coast."
+        canonical.save(update_fields=["article_summary"])
+        share_with_duplicates([canonical], ["article_summary"])
+        duplicate.refresh_from_db()
+        self.assertEqual(duplicate.article_summary, "Storm hits the coast.")
+
+    def test_models_run_on_canonical_articles_only(self):
+        created = ingest.ingest_articles(
+            self.source,
+            [scraped("Storm hits coast", STORY), scraped("Storm batters coast", STORY),
+             scraped("Rates on hold", OTHER)],
+        )
+        by_title = {a.title: a for a in created}
+        canonical = by_title["Storm hits coast"]
+        duplicate = by_title["Storm batters coast"]
+        other = by_title["Rates on hold"]
+        articles = canonical_articles([duplicate, other, canonical])
+        self.assertEqual(sorted(a.id for a in articles), sorted([canonical.id, other.id]))
+
+        [article] = canonical_articles([Article.objects.get(pk=duplicate.pk)], only=("id", "title"))
+        self.assertEqual(article.title, "Storm hits coast")
+
+
+try:
+    from core import tasks
+except ImportError:
+    tasks = None
+
+
+@unittest.skipIf(tasks is None, "core.tasks needs the ML dependencies")
+class TestDuplicateTasks(TestCase):
+    def setUp(self):
+        source = NewsSource.objects.create(name="Example", base_url="https://example.com")
+        with mock.patch.object(ingest, "dispatch_follow_up"):
+            ingest.ingest_articles(
+                source, [scraped("Storm hits coast", STORY), scraped("Storm batters coast", STORY)]
+            )
+        self.canonical = Article.objects.get(title="Storm hits coast")
+        self.duplicate = Article.objects.get(title="Storm batters coast")
+
+    def test_batch_summary_of_a_duplicate_runs_on_its_canonical(self):
+        with mock.patch.object(tasks.inference, "summarize", return_value=["Storm."]) as summarize:
+            tasks.summarize_articles_batch([self.duplicate.id])
+        summarize.assert_called_once()
+        self.assertEqual(len(summarize.call_args[0][0]), 1)
+        self.duplicate.refresh_from_db()
+        self.canonical.refresh_from_db()
+        self.assertEqual(self.duplicate.article_summary, "Storm.")
+        self.assertEqual(self.canonical.article_summary, "Storm.")
+
+    def test_batch_detection_scores_duplicates_once(self):
+        result = [(True, 97.0, "prefilter")]
+        with mock.patch.object(tasks.inference, "classify", return_value=result) as classify:
+            tasks.detect_fake_news_articles_batch([self.canonical.id, self.duplicate.id])
+        self.assertEqual(len(classify.call_args[0][0]), 1)
+        self.duplicate.refresh_from_db()
+        self.assertEqual(
+            (self.duplicate.is_fake_news, self.duplicate.fake_news_tier), (True, "prefilter")
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
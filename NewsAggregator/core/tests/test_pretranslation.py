@@ -0,0 +1,169 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import setup_databases, teardown_databases
+from core.models import Article, ArticleTranslation, CustomUser, NewsSource, UserActivity
+from core.utils import pretranslation, translation
+
+NOW = datetime(2024, 3, 14, 3, 0, tzinfo=dt_timezone.utc)
+
+
+def setUpModule():
+    global _databases
+    _databases = setup_databases(verbosity=0, interactive=False)
+
+
+def tearDownModule():
+    teardown_databases(_databases, verbosity=0)
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def translate_text(self, text, source, target):
+        self.calls.append((source, target))
+        return f"[{target}] {text}"
+
+
+class TranslationTestCase(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(name="Example", base_url="https://example.com")
+        self.translator = FakeClient()
+        patcher = mock.patch.object(translation, "get_client", return_value=self.translator)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def article(self, title, age=timedelta(hours=1), **fields):
+        fields.setdefault("language", "en")
+        article = Article.objects.create(
+            source=self.source,
+            title=title,
+            raw_content=f"{title}.",
+            processed_content=f"{title}.",
+            publication_date=NOW - age,
+            **fields,
+        )
+        Article.objects.filter(pk=article.pk).update(created_at=NOW - age)
+        return article
+
+
+class TestCandidates(TranslationTestCase):
+    def test_recent_canonical_untranslated_articles_only(self):
+        recent = self.article("Storm hits coast")
+        self.article("Old story", age=timedelta(hours=pretranslation.LOOKBACK_HOURS + 1))
+        self.article("Storm batters coast", canonical=recent)
+        self.article("Tormenta en la costa", language="es")
+        done = self.article("Markets rally")
+        ArticleTranslation.objects.create(article=done, language="es", content="Suben los mercados.")
+
+        since = NOW - timedelta(hours=pretranslation.LOOKBACK_HOURS)
+        self.assertEqual(list(pretranslation.candidates("es", since)), [recent])
+
+    def test_most_read_first(self):
+        quiet = self.article("Quiet story")
+        busy = self.article("Busy story", age=timedelta(hours=2))
+        user = CustomUser.objects.create(username="reader")
+        UserActivity.objects.create(user=user, article=busy, activity_type="read")
+
+        since = NOW - timedelta(hours=pretranslation.LOOKBACK_HOURS)
+        self.assertEqual(list(pretranslation.candidates("es", since)), [busy, quiet])
+
+    def test_pretranslate_stores_the_languages_users_prefer(self):
+        article = self.article("Storm hits coast")
+        CustomUser.objects.create(username="ana", language_preference="es")
+        CustomUser.objects.create(username="bob", language_preference="en")
+
+        self.assertEqual(pretranslation.pretranslate(budget_seconds=60, now=NOW), {"es": 1})
+        self.assertEqual(self.translator.calls, [("en", "es")])
+        self.assertEqual(translation.stored_translation(article, "es"), "[es] Storm hits coast.")
+        # Nothing left to do on the next run
+        self.assertEqual(pretranslation.pretranslate(budget_seconds=60, now=NOW), {"es": 0})
+
+    def test_off_peak_window(self):
+        self.assertTrue(pretranslation.is_off_peak(NOW))
+        self.assertFalse(pretranslation.is_off_peak(NOW.replace(hour=12)))
+
+
+class TestStoredTranslation(TranslationTestCase):
+    def test_one_row_per_language(self):
+        article = self.article("Storm hits coast")
+        translation.translate_and_store(article, "es")
+        translation.translate_and_store(article, "fr")
+        translation.translate_and_store(article, "es")
+
+        self.assertEqual(ArticleTranslation.objects.filter(article=article).count(), 2)
+        self.assertEqual(translation.stored_translation(article, "fr"), "[fr] Storm hits coast.")
+        self.assertIsNone(translation.stored_translation(article, "de"))
+
+    def test_original_language_is_not_translated(self):
+        article = self.article("Tormenta en la costa", language="es")
+        self.assertEqual(translation.translate_and_store(article, "es"), "Tormenta en la costa.")
+        self.assertEqual(self.translator.calls, [])
+
+    def test_duplicates_read_their_canonical_translation(self):
+        canonical = self.article("Storm hits coast")
+        duplicate = self.article("Storm batters coast", canonical=canonical)
+        translation.translate_and_store(canonical, "es")
+        self.assertEqual(translation.stored_translation(duplicate, "es"), "[es] Storm hits coast.")
+
+
+class TestCopyTranslatedContent(TransactionTestCase):
+    before = [("core", "0010_article_fake_news_tier")]
+    after = [("core", "0012_remove_article_translated_content")]
+
+    def tearDown(self):
+        # Leave the schema as the other tests expect it
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_stored_translations_are_copied(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        apps = executor.loader.project_state(self.before).apps
+        Source = apps.get_model("core", "NewsSource")
+        OldArticle = apps.get_model("core", "Article")
+        source = Source.objects.create(name="Example", base_url="https://example.com")
+
+        def old_article(title, translated_content, language="en"):
+            return OldArticle.objects.create(
+                source=source,
+                title=title,
+                raw_content=f"{title}.",
+                processed_content=f"{title}.",
+                publication_date=NOW,
+                language=language,
+                translated_content=translated_content,
+            ).pk
+
+        spanish = old_article(
+            "Storm hits coast",
+            "Fuertes lluvias y vientos azotaron la costa norte el martes y dejaron "
+            "sin luz a miles de hogares, dijeron las autoridades.",
+        )
+        untranslated = old_article("Markets rally", None)
+        echoed = old_article("Rates on hold", "Rates on hold, the central bank said on Wednesday.")
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.after)
+
+        self.assertEqual(
+            list(ArticleTranslation.objects.values_list("article_id", "language")),
+            [(spanish, "es")],
+        )
+        self.assertFalse(ArticleTranslation.objects.filter(article_id__in=[untranslated, echoed]).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
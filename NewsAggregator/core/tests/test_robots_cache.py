@@ -0,0 +1,94 @@
+import unittest
+from unittest import mock
+from core.utils import robots_cache
+from core.utils.robots_cache import ROBOTS_USER_AGENT, RobotsCache
+
+ROBOTS = "User-agent: *\nDisallow: /private/\nCrawl-delay: 2\n"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key, (None,))[0]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = (value, ttl)
+
+
+class TestRobotsCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(robots_cache.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.downloads = []
+
+    def cache(self, status=200, body=ROBOTS, shared=None):
+        cache = RobotsCache(ttl=60, failure_ttl=10, redis_url="")
+        cache._redis = shared or False
+
+        def download(base_url):
+            self.downloads.append(base_url)
+            return status, body
+
+        cache._download = download
+        return cache
+
+    def test_lookups_within_the_ttl_reuse_the_download(self):
+        cache = self.cache()
+        self.assertFalse(cache.can_fetch("https://example.com/private/a", ROBOTS_USER_AGENT))
+        self.now += 59
+        self.assertTrue(cache.can_fetch("https://example.com/news/b", ROBOTS_USER_AGENT))
+        self.assertEqual(cache.crawl_delay("https://example.com/c"), 2)
+        self.assertEqual(self.downloads, ["https://example.com"])
+
+    def test_expired_entry_is_downloaded_again(self):
+        cache = self.cache()
+        cache.get_parser("https://example.com/a")
+        self.now += 61
+        self.assertEqual(cache.cached("https://example.com/a"), (False, None))
+        cache.get_parser("https://example.com/a")
+        self.assertEqual(self.downloads, ["https://example.com"] * 2)
+
+    def test_entries_are_per_host(self):
+        cache = self.cache()
+        cache.get_parser("https://example.com/a")
+        cache.get_parser("https://news.example.com/a")
+        cache.get_parser("http://example.com/a")
+        cache.get_parser("https://example.com/b")
+        self.assertEqual(
+            self.downloads,
+            ["https://example.com", "https://news.example.com", "http://example.com"],
+        )
+
+    def test_unreachable_robots_allows_everything_for_the_failure_ttl(self):
+        cache = self.cache(status=0, body="")
+        self.assertTrue(cache.can_fetch("https://example.com/private/a"))
+        self.now += 9
+        cache.get_parser("https://example.com/a")
+        self.now += 2
+        cache.get_parser("https://example.com/a")
+        self.assertEqual(len(self.downloads), 2)
+
+    def test_forbidden_robots_disallows_everything(self):
+        cache = self.cache(status=403, body="")
+        self.assertFalse(cache.can_fetch("https://example.com/news/a"))
+
+    def test_workers_share_one_download_through_redis(self):
+        shared = FakeRedis()
+        first, second = self.cache(shared=shared), self.cache(shared=shared)
+        self.assertFalse(first.can_fetch("https://example.com/private/a"))
+        self.assertFalse(second.can_fetch("https://example.com/private/a"))
+        self.assertEqual(self.downloads, ["https://example.com"])
+        self.assertEqual(shared.store["robots:https://example.com"][1], 60)
+
+    def test_failures_are_shared_for_the_failure_ttl(self):
+        shared = FakeRedis()
+        self.cache(status=503, body="", shared=shared).get_parser("https://example.com/a")
+        self.assertEqual(shared.store["robots:https://example.com"][1], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone as dt_timezone
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "NewsAggregator.settings")
+django.setup()
+
+from django.test import TestCase
+from django.test.utils import setup_databases, teardown_databases
+from core.models import NewsSource, ScrapeRun
+from core.utils import scheduling
+
+NOW = datetime(2024, 3, 14, 12, 0, tzinfo=dt_timezone.utc)
+
+
+def setUpModule():
+    global _databases
+    _databases = setup_databases(verbosity=0, interactive=False)
+
+
+def tearDownModule():
+    teardown_databases(_databases, verbosity=0)
+
+
+class TestClaimSource(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(
+            name="Example", base_url="https://example.com", scraping_interval=600
+        )
+
+    def test_due_source_is_claimed_once(self):
+        # Two schedulers read the same row before either claims it
+        first = NewsSource.objects.get(pk=self.source.pk)
+        second = NewsSource.objects.get(pk=self.source.pk)
+        self.assertTrue(scheduling.claim_source(first, NOW))
+        self.assertFalse(scheduling.claim_source(second, NOW))
+
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.next_scrape_at, NOW + timedelta(seconds=600))
+
+    def test_claimed_source_is_not_due_until_its_lease_ends(self):
+        scheduling.claim_source(self.source, NOW)
+        self.assertNotIn(self.source, scheduling.due_sources(NOW + timedelta(seconds=599)))
+        self.assertIn(self.source, scheduling.due_sources(NOW + timedelta(seconds=600)))
+
+    def test_inactive_sources_are_never_due(self):
+        NewsSource.objects.filter(pk=self.source.pk).update(is_active=False)
+        self.assertNotIn(self.source, scheduling.due_sources(NOW))
+
+
+class TestBackoff(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(
+            name="Example", base_url="https://example.com", scraping_interval=600
+        )
+
+    def delay_after_failure(self):
+        scheduling.record_failure(self.source, NOW)
+        self.source.refresh_from_db()
+        return (self.source.next_scrape_at - NOW).total_seconds()
+
+    def test_delay_doubles_with_each_failure(self):
+        delays = [self.delay_after_failure() for _ in range(3)]
+        self.assertEqual(delays, [1200, 2400, 4800])
+        self.assertEqual(self.source.consecutive_failures, 3)
+
+    def test_delay_is_capped(self):
+        NewsSource.objects.filter(pk=self.source.pk).update(consecutive_failures=20)
+        self.source.refresh_from_db()
+        self.assertEqual(self.delay_after_failure(), scheduling.MAX_BACKOFF)
+
+    def test_success_resets_the_backoff(self):
+        self.delay_after_failure()
+        scheduling.record_success(self.source, now=NOW)
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.consecutive_failures, 0)
+        self.assertEqual(self.source.next_scrape_at, NOW + timedelta(seconds=600))
+
+
+class TestAdaptiveInterval(TestCase):
+    def setUp(self):
+        self.source = NewsSource.objects.create(
+            name="Example", base_url="https://example.com", scraping_interval=3600
+        )
+
+    def test_configured_interval_until_there_is_history(self):
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), 3600)
+
+    def test_interval_follows_the_hour_of_day(self):
+        profile = [None] * 24
+        profile[12] = 12.0  # busy at noon: 3 new items every 15 minutes
+        profile[3] = 0.5  # quiet at night
+        self.source.yield_profile = profile
+
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), 900)
+        night = scheduling.effective_interval(self.source, NOW.replace(hour=3))
+        self.assertEqual(night, 6 * 3600)
+        # Hours without data use the average of the known ones
+        evening = scheduling.effective_interval(self.source, NOW.replace(hour=20))
+        self.assertEqual(evening, int(3 / 6.25 * 3600))
+
+    def test_interval_stays_within_bounds(self):
+        low, high = scheduling.interval_bounds(self.source)
+        self.source.yield_profile = [1000.0] * 24
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), low)
+        self.source.yield_profile = [0.0] * 24
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), high)
+
+    def test_long_base_interval_keeps_ordered_bounds(self):
+        self.source.scraping_interval = 2 * 24 * 3600
+        low, high = scheduling.interval_bounds(self.source)
+        self.assertEqual((low, high), (scheduling.MAX_INTERVAL, scheduling.MAX_INTERVAL))
+        self.source.yield_profile = [1000.0] * 24
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), high)
+        self.source.yield_profile = [0.0] * 24
+        self.assertEqual(scheduling.effective_interval(self.source, NOW), high)
+
+    def test_yield_is_credited_to_the_hours_since_the_last_scrape(self):
+        self.source.last_scraped_at = NOW - timedelta(hours=2)
+        profile = scheduling.updated_profile(self.source, 6, NOW)
+        self.assertEqual([profile[h] for h in (10, 11, 12)], [3.0, 3.0, 3.0])
+        self.assertIsNone(profile[9])
+
+        # Later runs move the learned rate part of the way
+        self.source.yield_profile = profile
+        profile = scheduling.updated_profile(self.source, 0, NOW)
+        self.assertAlmostEqual(profile[12], 3.0 * (1 - scheduling.YIELD_SMOOTHING))
+
+    def test_success_updates_the_profile_and_history(self):
+        NewsSource.objects.filter(pk=self.source.pk).update(last_scraped_at=NOW - timedelta(hours=1))
+        self.source.refresh_from_db()
+        scheduling.record_success(self.source, new_items=12, found=20, now=NOW)
+
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.yield_profile[12], 12.0)
+        self.assertEqual(self.source.next_scrape_at, NOW + timedelta(seconds=900))
+        run = ScrapeRun.objects.get(source=self.source)
+        self.assertEqual((run.found, run.new_items, run.interval), (20, 12, 900))
+
+
+if __name__ == '__main__':
+    unittest.main()
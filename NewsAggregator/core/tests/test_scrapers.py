@@ -1,5 +1,11 @@
+import os
+import tempfile
 import unittest
 import logging
+from unittest import mock
+from http_fixtures import FixtureStore, adapter_from_env, write_synthetic_fixtures
+from core.utils import scrapers
+from core.utils.robots_cache import robots_cache
 from core.utils.scrapers import (
     get_scraper_for_url,
     scrape_npr,
@@ -14,6 +20,31 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class TestScrapers(unittest.TestCase):
+    """Runs the scrapers against recorded fixtures instead of the live sites."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = tempfile.TemporaryDirectory()
+        write_synthetic_fixtures(FixtureStore(cls.fixtures.name), n_items=3)
+        env = {"SCRAPER_HTTP_MODE": "replay", "SCRAPER_FIXTURES_DIR": cls.fixtures.name}
+        cls.patches = [
+            mock.patch.dict(os.environ, env),
+            mock.patch.object(scrapers, "http_adapter_factory", adapter_from_env),
+            # No politeness delays are needed against fixtures
+            mock.patch("random.uniform", return_value=0),
+            # Nor a shared Redis robots.txt cache
+            mock.patch.object(robots_cache, "redis_url", ""),
+            mock.patch.object(robots_cache, "_redis", None),
+        ]
+        for patch in cls.patches:
+            patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patch in reversed(cls.patches):
+            patch.stop()
+        cls.fixtures.cleanup()
+
     def setUp(self):
         # Test URLs for each news source
         self.test_urls = {
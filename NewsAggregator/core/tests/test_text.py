@@ -0,0 +1,26 @@
+import unittest
+from core.utils.text import split_sentences
+
+
+class TestSplitSentences(unittest.TestCase):
+    def test_round_trip(self):
+        text = 'First one. "Quoted?" he asked.\n\nNew paragraph!  Last'
+        pieces = split_sentences(text)
+        self.assertEqual("".join(s + sep for s, sep in pieces), text)
+        self.assertEqual(
+            [s for s, _ in pieces],
+            ["First one.", '"Quoted?"', "he asked.", "New paragraph!", "Last"],
+        )
+
+    def test_abbreviations_inside_words_are_kept(self):
+        self.assertEqual(len(split_sentences("Version 3.5 shipped.")), 1)
+
+    def test_long_sentence_is_cut_between_words(self):
+        pieces = split_sentences("word " * 100, max_chars=42)
+        self.assertTrue(all(len(s) <= 42 for s, _ in pieces))
+        self.assertTrue(all(not s.endswith("wor") for s, _ in pieces))
+        self.assertEqual(sum(s.count("word") for s, _ in pieces), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from core.utils.translation_cache import TranslationCache, text_key
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TranslationCache(local_max_entries=3)
+        self.cache._redis = False  # in-process layer only
+        self.calls = []
+
+    def fake_translate(self, texts, source, target):
+        self.calls.extend(texts)
+        return [f"[{target}] {text}" for text in texts]
+
+    def test_repeated_text_is_translated_once(self):
+        texts = ["Hello world.", "Hello   world.", "Goodbye."]
+        first = self.cache.translate(texts, "en", "es", self.fake_translate)
+        second = self.cache.translate(["Hello world."], "en", "es", self.fake_translate)
+
+        self.assertEqual(first[0], first[1])
+        self.assertEqual(second[0], first[0])
+        self.assertEqual(self.calls, ["Hello world.", "Goodbye."])
+
+    def test_key_includes_languages(self):
+        self.assertNotEqual(text_key("Hi", "en", "es"), text_key("Hi", "en", "fr"))
+        self.cache.translate(["Hi"], "en", "es", self.fake_translate)
+        self.cache.translate(["Hi"], "en", "fr", self.fake_translate)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_untranslated_echo_is_not_cached(self):
+        self.cache.translate(["OK"], "en", "es", lambda texts, *langs: texts)
+        self.assertEqual(self.cache.get_many(["OK"], "en", "es"), [None])
+
+    def test_local_entries_are_bounded(self):
+        texts = [f"Sentence {i}." for i in range(5)]
+        self.cache.translate(texts, "en", "es", self.fake_translate)
+        self.assertEqual(len(self.cache._local), 3)
+        self.assertEqual(self.cache.get_many(texts[:1], "en", "es"), [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from core.utils.translation_client import (
+    LibreTranslateClient,
+    TranslationError,
+)
+from core.utils.translation_server import TranslateServer
+
+
+class TestBatches(unittest.TestCase):
+    def test_batches_respect_item_and_char_limits(self):
+        client = LibreTranslateClient(
+            "http://localhost:5000", max_batch_items=3, max_batch_chars=10, cache=None
+        )
+        try:
+            batches = list(client._batches(["aaaa", "bbbb", "cc", "d", "eeeeeeeeeeee", "f"]))
+        finally:
+            client.close()
+        self.assertEqual(batches, [[0, 1, 2], [3], [4], [5]])
+
+
+class TestAgainstStandIn(unittest.TestCase):
+    def setUp(self):
+        self.server = TranslateServer(seed=0).start()
+        self.client = LibreTranslateClient(
+            self.server.url, max_batch_items=4, max_retries=1, cache=None
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_batched_translation_keeps_layout(self):
+        text = "One. Two.\n\nThree. Four. Five."
+        self.assertEqual(
+            self.client.translate_text(text, "en", "es"),
+            "[es] One. [es] Two.\n\n[es] Three. [es] Four. [es] Five.",
+        )
+        self.assertEqual(self.server.requests_served, 2)
+
+    def test_persistent_failure_raises(self):
+        self.server.failure_rate = 1.0
+        with self.assertRaises(TranslationError):
+            self.client.translate_text("One. Two.", "en", "es")
+
+
+if __name__ == '__main__':
+    unittest.main()
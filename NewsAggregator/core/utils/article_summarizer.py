@@ -3,6 +3,9 @@ from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
 import os
 from pathlib import Path
 from django.conf import settings
+from . import model_registry
+from .batching import padded_batches
+from .text import split_sentences
 
 
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
@@ -11,8 +14,57 @@ os.environ["CUDA_VISIBLE_DEVICES"] = "0" if torch.cuda.is_available() else ""
 CACHE_DIR = Path(settings.BASE_DIR) / "core/ml_models/summarizer/"
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# DistilBART reads at most 1024 positions
+MAX_INPUT_TOKENS = 1024
+# Padded tokens per generate() call (rows x longest row)
+MAX_BATCH_TOKENS = 8192
+_CPU_DTYPES = {"fp32": torch.float32, "bf16": torch.bfloat16, "fp16": torch.float16}
+# A summary is never allowed more tokens than this share of its input
+MAX_SUMMARY_RATIO = 0.5
+# Map-reduce of long articles: per-section summary budget, and the most
+# sections summarized (32 x 60 tokens reduce in two more passes)
+SECTION_MAX_LENGTH = 60
+SECTION_MIN_LENGTH = 15
+MAX_SECTIONS = 32
 
-def initialize_summarizer():
+
+def summarizer_options():
+    """
+    Inference settings of the summarizer:
+
+    - ``SUMMARIZER_DEVICE``: "auto" (CUDA when available), "cuda" or "cpu"
+    - ``SUMMARIZER_CPU_DTYPE``: "fp32" or "bf16" weights on CPU
+    - ``SUMMARIZER_QUANTIZE``: dynamic int8 quantization of Linear layers
+      (CPU only, applied to fp32 weights)
+    - ``SUMMARIZER_THREADS`` / ``SUMMARIZER_INTEROP_THREADS``: torch intra-
+      and inter-op thread pools on CPU
+    """
+    device = getattr(settings, "SUMMARIZER_DEVICE", "auto")
+    if device == "auto":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    return {
+        "device": device,
+        "dtype": getattr(settings, "SUMMARIZER_CPU_DTYPE", "fp32"),
+        "quantize": getattr(settings, "SUMMARIZER_QUANTIZE", False),
+        "threads": getattr(settings, "SUMMARIZER_THREADS", None) or os.cpu_count(),
+        "interop_threads": getattr(settings, "SUMMARIZER_INTEROP_THREADS", 1),
+    }
+
+
+def configure_threads(threads, interop_threads):
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(interop_threads)
+    except RuntimeError:
+        # Only settable before the first parallel op of the process
+        pass
+
+
+def initialize_summarizer(device=None, dtype=None, quantize=None, threads=None):
+    options = summarizer_options()
+    device = device or options["device"]
+    dtype = dtype or options["dtype"]
+    quantize = options["quantize"] if quantize is None else quantize
     model_path = CACHE_DIR / "sshleifer_distilbart-cnn-12-6"
 
     if not model_path.exists():
@@ -27,63 +79,260 @@ def initialize_summarizer():
         tokenizer.save_pretrained(model_path)
 
     tokenizer = AutoTokenizer.from_pretrained(model_path)
-    model_path = CACHE_DIR / "sshleifer_distilbart-cnn-12-6"
 
-    model = AutoModelForSeq2SeqLM.from_pretrained(
-        model_path,
-        device_map="auto" if torch.cuda.is_available() else None,
-        torch_dtype=torch.float16,
-        low_cpu_mem_usage=True,
-    )
+    if device == "cuda":
+        model = AutoModelForSeq2SeqLM.from_pretrained(
+            model_path,
+            device_map="auto",
+            torch_dtype=torch.float16,
+            low_cpu_mem_usage=True,
+        )
+    else:
+        configure_threads(threads or options["threads"], options["interop_threads"])
+        # fp16 matmuls are emulated on most CPUs; int8 kernels want fp32 input
+        torch_dtype = torch.float32 if quantize else _CPU_DTYPES[dtype]
+        model = AutoModelForSeq2SeqLM.from_pretrained(
+            model_path, torch_dtype=torch_dtype, low_cpu_mem_usage=True
+        )
+        if quantize:
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+    model.eval()
 
     return pipeline(
         "summarization",
         model=model,
         tokenizer=tokenizer,
         framework="pt",
-        torch_dtype=torch.float16,
-        batch_size=1,
+        device=None if device == "cuda" else torch.device("cpu"),
     )
 
 
-def summarize_article(text, summarizer=None, max_length=130, min_length=30):
-    if not summarizer:
-        summarizer = initialize_summarizer()
+def get_summarizer():
+    """The summarization pipeline of this process, loaded on first use."""
+    return model_registry.get_model("summarizer")
 
-    try:
-        torch.cuda.empty_cache() if torch.cuda.is_available() else None
-
-        max_chunk_length = 1024
-        chunks = [
-            text[i : i + max_chunk_length]
-            for i in range(0, len(text), max_chunk_length)
-        ]
-
-        summaries = []
-        for chunk in chunks:
-            result = summarizer(
-                chunk,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False,
-                clean_up_tokenization_spaces=True,
-                truncation=True,
-            )
-            summaries.append(result[0]["summary_text"])
 
-            del chunk, result
+def _special_tokens(tokenizer):
+    """The ids the tokenizer puts ``(before, after)`` a single sequence."""
+    content = tokenizer("a", add_special_tokens=False)["input_ids"]
+    full = tokenizer("a")["input_ids"]
+    start = next(
+        i for i in range(len(full)) if full[i : i + len(content)] == content
+    )
+    return full[:start], full[start + len(content) :]
+
+
+def chunk_by_tokens(text, tokenizer, max_tokens=MAX_INPUT_TOKENS):
+    """
+    Token id lists of at most ``max_tokens`` (special tokens included),
+    packed from whole sentences; a sentence longer than that is split.
+    """
+    sentences = [s for s, _ in split_sentences(text) if s.strip()]
+    if not sentences:
+        return []
+    before, after = _special_tokens(tokenizer)
+    budget = max_tokens - len(before) - len(after)
+    encoded = tokenizer(sentences, add_special_tokens=False)["input_ids"]
+
+    chunks, current = [], []
+    for ids in encoded:
+        if current and len(current) + len(ids) > budget:
+            chunks.append(current)
+            current = []
+        while len(ids) > budget:
+            chunks.append(ids[:budget])
+            ids = ids[budget:]
+        current = current + ids
+    if current:
+        chunks.append(current)
+    return [before + ids + after for ids in chunks]
+
+
+def generation_lengths(input_tokens, max_length, min_length):
+    """
+    ``(max_length, min_length)`` for an input of ``input_tokens`` tokens:
+    short inputs get a proportionally short cap so beam search stops early.
+    """
+    cap = max(8, int(input_tokens * MAX_SUMMARY_RATIO))
+    max_length = min(max_length, cap)
+    return max_length, min(min_length, max_length // 2)
+
+
+def _generate(summarizer, chunks, max_length, min_length):
+    model, tokenizer = summarizer.model, summarizer.tokenizer
+    max_length, min_length = generation_lengths(
+        max(len(ids) for ids in chunks), max_length, min_length
+    )
+    inputs = tokenizer.pad(
+        {"input_ids": chunks}, padding=True, return_tensors="pt"
+    ).to(model.device)
+    with torch.inference_mode():
+        output = model.generate(
+            **inputs, max_length=max_length, min_length=min_length, do_sample=False
+        )
+    return tokenizer.batch_decode(
+        output, skip_special_tokens=True, clean_up_tokenization_spaces=True
+    )
+
+
+def _spread(sections, limit=MAX_SECTIONS):
+    """At most ``limit`` sections, evenly spaced, keeping the first and last."""
+    if len(sections) <= limit:
+        return sections
+    step = (len(sections) - 1) / (limit - 1)
+    return [sections[round(i * step)] for i in range(limit)]
+
+
+def _summarize_chunks(
+    summarizer, chunks, max_length, min_length, max_batch_tokens, on_batch=None
+):
+    """
+    Summaries of token id ``chunks`` generated in padded batches, longest
+    first; ``on_batch(indexes, outputs)`` runs after every batch.
+    """
+    outputs = [None] * len(chunks)
+    pending = list(padded_batches([len(ids) for ids in chunks], max_batch_tokens))
+    while pending:
+        batch = pending.pop(0)
+        try:
+            results = _generate(summarizer, [chunks[i] for i in batch], max_length, min_length)
+        except RuntimeError as e:
+            if "out of memory" not in str(e) or len(batch) == 1:
+                raise
+            # Halve the batch instead of giving up on the whole run
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
+            half = len(batch) // 2
+            pending[:0] = [batch[:half], batch[half:]]
+            continue
+        for i, summary in zip(batch, results):
+            outputs[i] = summary.strip()
+        if on_batch:
+            on_batch(batch, outputs)
+    return outputs
+
+
+def summarize_batch(
+    texts,
+    summarizer=None,
+    max_length=130,
+    min_length=30,
+    max_batch_tokens=None,
+    on_partial=None,
+):
+    """
+    Summaries of ``texts``, one per text.
+
+    A text that fits one model window is summarized directly. Longer texts
+    are summarized map-reduce style: their token-bounded sections get a
+    short summary each (``SECTION_MAX_LENGTH`` tokens), the section
+    summaries are joined and summarized again, until the result fits one
+    window and gets the final ``max_length`` budget. Texts of more than
+    ``MAX_SECTIONS`` sections are sampled evenly to keep latency bounded.
+
+    Each round sorts the chunks of all texts by length and generates them
+    in padded batches. ``on_partial(index, text)`` receives the section
+    summaries of text ``index`` so far after every batch of a map round.
+    """
+    if not summarizer:
+        summarizer = get_summarizer()
+    if max_batch_tokens is None:
+        max_batch_tokens = getattr(settings, "SUMMARY_BATCH_TOKENS", MAX_BATCH_TOKENS)
+    tokenizer = summarizer.tokenizer
+
+    sections = [_spread(chunk_by_tokens(text or "", tokenizer)) for text in texts]
+    summaries = ["" for _ in texts]
+
+    while True:
+        final = [doc for doc, parts in enumerate(sections) if len(parts) == 1]
+        mapped = [doc for doc, parts in enumerate(sections) if len(parts) > 1]
+        if final:
+            outputs = _summarize_chunks(
+                summarizer,
+                [sections[doc][0] for doc in final],
+                max_length,
+                min_length,
+                max_batch_tokens,
+            )
+            for doc, summary in zip(final, outputs):
+                summaries[doc] = summary
+        if not mapped:
+            break
 
-        return " ".join(summaries)
+        chunks, owners = [], []
+        for doc in mapped:
+            chunks.extend(sections[doc])
+            owners.extend([doc] * len(sections[doc]))
+
+        def joined(doc, outputs):
+            return " ".join(
+                summary
+                for summary, owner in zip(outputs, owners)
+                if owner == doc and summary is not None
+            )
+
+        def report(batch, outputs):
+            for doc in sorted({owners[i] for i in batch}):
+                on_partial(doc, joined(doc, outputs))
+
+        outputs = _summarize_chunks(
+            summarizer,
+            chunks,
+            SECTION_MAX_LENGTH,
+            SECTION_MIN_LENGTH,
+            max_batch_tokens,
+            on_batch=report if on_partial else None,
+        )
+        sections = [[] for _ in texts]
+        for doc in mapped:
+            sections[doc] = _spread(chunk_by_tokens(joined(doc, outputs), tokenizer))
+
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    return summaries
+
+
+def summarize_article(
+    text, summarizer=None, max_length=130, min_length=30, on_partial=None
+):
+    """
+    Summary of one article; ``on_partial(text)``, if given, receives the
+    section summaries of a long article while the final pass is pending.
+    """
+    if not summarizer:
+        summarizer = get_summarizer()
+
+    try:
+        return summarize_batch(
+            [text],
+            summarizer,
+            max_length,
+            min_length,
+            on_partial=(lambda _, partial: on_partial(partial)) if on_partial else None,
+        )[0]
 
     except RuntimeError as e:
 
-        if "CUDA out of memory" in str(e):
+        if "CUDA out of memory" in str(e) and summarizer.model.device.type != "cpu":
             print("Falling back to CPU due to memory constraints")
             summarizer.model = summarizer.model.cpu()
-            return summarize_article(text, summarizer)
+            summarizer.device = torch.device("cpu")
+            return summarize_article(text, summarizer, max_length, min_length, on_partial)
         raise
 
 
+model_registry.register(
+    "summarizer",
+    initialize_summarizer,
+    warmup=lambda summarizer: summarize_article(
+        "The model is loaded once per process and reused for every article. " * 4,
+        summarizer,
+        max_length=20,
+        min_length=5,
+    ),
+)
+
+
 # summarize_article("In today’s fast-paced world, technology has become an integral part of our daily lives. From the moment we wake up to the moment we go to bed, we are surrounded by gadgets and devices that help us stay connected, entertained, and informed. Smartphones, laptops, and tablets have revolutionized the way we work, learn, and communicate. The internet has made it possible to access information from anywhere in the world, at any time. Social media platforms have connected people from different corners of the globe, enabling them to share their thoughts, experiences, and ideas in real-time. However, with all these advancements, there are also challenges. The overuse of technology has led to concerns about privacy, data security, and the impact of screen time on mental health. People are becoming more aware of the need to strike a balance between embracing technology and ensuring that it doesn’t negatively affect their well-being. Additionally, the rise of artificial intelligence and automation is changing the landscape of the job market, with some jobs becoming obsolete while new ones are being created. This has raised questions about the future of work and the skills required to thrive in an increasingly automated world. As we continue to advance, it is crucial to think about how we can harness the power of technology in a responsible and sustainable way that benefits society as a whole.")
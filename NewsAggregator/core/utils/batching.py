@@ -0,0 +1,16 @@
+def padded_batches(lengths, max_batch_tokens):
+    """
+    Indexes of ``lengths`` grouped into batches, longest first, so that
+    rows x longest row (the padded tensor size) stays within
+    ``max_batch_tokens``. Sorting keeps the padding inside a batch small;
+    an input longer than the budget still gets a batch of its own.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batch = []
+    for i in order:
+        if batch and lengths[batch[0]] * (len(batch) + 1) > max_batch_tokens:
+            yield batch
+            batch = []
+        batch.append(i)
+    if batch:
+        yield batch
@@ -0,0 +1,103 @@
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:  # pragma: no cover - dateutil is optional
+    dateutil_parser = None
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%d %b %Y",
+    "%Y-%m-%d",
+    "%B %d, %Y, %I:%M %p",
+    "%B %d, %Y %H:%M",
+    "%d %B %Y",
+    "%A, %B %d, %Y",
+    "%A %B %d %Y",
+    "%a, %d %b %Y %H:%M:%S %z",  # RFC 2822
+    "%Y-%m-%dT%H:%M:%S.%fZ",      # RFC 3339/ISO 8601
+    "%a, %d %b %Y %H:%M:%S GMT",  # RSS/Atom
+]
+
+# Per source: (formats in most-recently-successful order, formats list given)
+_format_memo = {}
+
+
+def _aware(value):
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _fast_parse(date_str):
+    if date_str[:4].isdigit():
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
+    if date_str[:1].isalpha() and "," in date_str[:5]:
+        try:
+            return parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def parse_date(date_str, formats=None, source=None):
+    """
+    Parse a feed or page date into a timezone-aware datetime.
+
+    ISO-8601 and RFC-2822 strings take a fast path through the standard
+    library. Anything else is matched against ``formats``, trying first the
+    ones that most recently worked for ``source``, and finally handed to
+    dateutil. Naive results are taken to be UTC; unparseable input gives
+    "now".
+    """
+    if not date_str:
+        return datetime.now(timezone.utc)
+
+    date_str = date_str.strip()
+
+    # Handle ISO 8601 durations (e.g., P3M,47S)
+    if date_str.startswith('P') and any(c in date_str for c in 'YMDHS'):
+        logger.warning(f"Could not parse date (duration): {date_str}")
+        return datetime.now(timezone.utc)
+
+    parsed = _fast_parse(date_str)
+    if parsed is not None:
+        return _aware(parsed)
+
+    if formats is None:
+        formats = DATE_FORMATS
+
+    # Formats ordered by how recently they worked for this source
+    ordered = _format_memo.get(source)
+    if ordered is None or ordered[1] is not formats:
+        ordered = (list(formats), formats)
+        _format_memo[source] = ordered
+
+    for i, fmt in enumerate(ordered[0]):
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        if i:
+            ordered[0].insert(0, ordered[0].pop(i))
+        return _aware(parsed)
+
+    if dateutil_parser is not None:
+        try:
+            return _aware(dateutil_parser.parse(date_str))
+        except (ValueError, OverflowError):
+            pass
+
+    logger.warning(f"Could not parse date: {date_str}")
+    return datetime.now(timezone.utc)
@@ -0,0 +1,194 @@
+import logging
+from urllib.parse import urljoin
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+logger = logging.getLogger(__name__)
+
+# Per-domain extraction config. Every key holds CSS selectors tried in order;
+# the first one that matches anything wins.
+#   headlines      - elements on the section page that carry a headline
+#   headline_link  - link inside a headline element (default: nearest <a>)
+#   title/body/date - on the article page; date reads @datetime, then text
+EXTRACTOR_SPECS = {
+    "npr.org": {
+        "headlines": ["article", ".story-wrap"],
+        "headline_link": ["h3 a", ".title a", "a.title", "h2 a"],
+        "title": ["h1"],
+        "body": [
+            ".storytext p",
+            "[data-testid='story-text'] p",
+            ".story-body p",
+            ".article-body p",
+        ],
+        "date": ["time", ".date", ".timestamp"],
+    },
+    "theguardian.com": {
+        "headlines": [".fc-item__title", ".js-headline-text"],
+        "title": ["h1"],
+        "body": [".article-body-commercial-selector p", ".content__article-body p"],
+        "date": ["time"],
+    },
+    "aljazeera.com": {
+        "headlines": [".gc__title", ".article-card__title"],
+        "title": ["h1"],
+        "body": [".wysiwyg p", "article p"],
+        "date": [".article-dates__modified time", "time"],
+    },
+    "abc.net.au": {
+        "headlines": [".doctype-article h3", ".title-link"],
+        "title": ["h1"],
+        "body": [".article-body p", "._1HzXw p"],
+        "date": [".timestamp", "time"],
+    },
+    "usatoday.com": {
+        "headlines": [".gnt_m_flm_a", ".gnt_m_flm_a h3"],
+        "title": ["h1"],
+        "body": [".gnt_ar_b p", ".gnt_ar_b"],
+        "date": ["time", ".gnt_ar_dt"],
+    },
+}
+
+_BOILERPLATE = CSSSelector("script, style, noscript, nav, header, footer, aside, form")
+_PARAGRAPHS = CSSSelector("p")
+_META_TITLE = CSSSelector("meta[property='og:title']")
+_META_DATE = CSSSelector(
+    "meta[property='article:published_time'], meta[name='date'], meta[itemprop='datePublished']"
+)
+
+
+def _compile(selectors):
+    return [CSSSelector(selector) for selector in selectors or []]
+
+
+def _first_match(root, selectors):
+    for selector in selectors:
+        found = selector(root)
+        if found:
+            return found
+    return []
+
+
+def _text(elem):
+    return " ".join(elem.text_content().split())
+
+
+def _link_for(elem):
+    if elem.tag == "a":
+        return elem
+    found = elem.find(".//a")
+    if found is not None:
+        return found
+    for ancestor in elem.iterancestors("a"):
+        return ancestor
+    return None
+
+
+def parse_html(content, base_url=None):
+    return lxml.html.fromstring(content, base_url=base_url)
+
+
+def readability_body(doc, min_length=25):
+    """
+    Generic body extraction for pages without a matching spec.
+
+    Paragraphs vote for their parent (and, at half weight, grandparent) by
+    text length; the paragraphs of the best-scoring container are the body.
+    """
+    for elem in _BOILERPLATE(doc):
+        elem.drop_tree()
+
+    scores = {}
+    for p in _PARAGRAPHS(doc):
+        length = len(_text(p))
+        if length < min_length:
+            continue
+        parent = p.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0) + length
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0) + length / 2
+
+    if not scores:
+        return ""
+    best = max(scores, key=scores.get)
+    return " ".join(t for t in (_text(p) for p in _PARAGRAPHS(best)) if t)
+
+
+class ArticleExtractor:
+    """Selectors of one ``EXTRACTOR_SPECS`` entry, compiled once to XPath."""
+
+    def __init__(self, spec=None):
+        spec = spec or {}
+        self.headlines = _compile(spec.get("headlines"))
+        self.headline_link = _compile(spec.get("headline_link"))
+        self.title = _compile(spec.get("title"))
+        self.body = _compile(spec.get("body"))
+        self.date = _compile(spec.get("date"))
+
+    def extract_links(self, doc, base_url, limit=15):
+        """``(title, absolute_url)`` pairs for the headlines on a section page."""
+        links = []
+        for headline in _first_match(doc, self.headlines)[:limit]:
+            if self.headline_link:
+                link = _first_match(headline, self.headline_link)
+                link = link[0] if link else None
+                title_elem = link
+            else:
+                link = _link_for(headline)
+                title_elem = headline
+            if link is None:
+                continue
+
+            article_url = urljoin(base_url, link.get("href", ""))
+            if article_url:
+                links.append((_text(title_elem), article_url))
+        return links
+
+    def extract_article(self, doc):
+        """Title, body text and raw date string of an article page."""
+        title = _first_match(doc, self.title)
+        if title:
+            title = _text(title[0])
+        else:
+            meta = _META_TITLE(doc)
+            title = meta[0].get("content", "").strip() if meta else ""
+
+        date_str = ""
+        date_elem = _first_match(doc, self.date)
+        if date_elem:
+            date_str = date_elem[0].get("datetime") or _text(date_elem[0])
+        else:
+            meta = _META_DATE(doc)
+            date_str = meta[0].get("content", "") if meta else ""
+
+        paragraphs = _first_match(doc, self.body)
+        content = " ".join(t for t in (_text(p) for p in paragraphs) if t)
+        if not content:
+            content = readability_body(doc)
+
+        return {"title": title, "content": content, "date": date_str}
+
+
+EXTRACTORS = {domain: ArticleExtractor(spec) for domain, spec in EXTRACTOR_SPECS.items()}
+GENERIC_EXTRACTOR = ArticleExtractor()
+
+
+def lookup_domain(host, registry):
+    """
+    Resolve ``host`` to its entry in ``registry`` by walking up its labels.
+
+    "www.edition.theguardian.com" tries "edition.theguardian.com", then
+    "theguardian.com", then "com": a few dict lookups regardless of how many
+    sources are registered.
+    """
+    host = (host or "").lower().split(":")[0]
+    if host.startswith("www."):
+        host = host[4:]
+    while host:
+        if host in registry:
+            return host
+        _, _, host = host.partition(".")
+    return None
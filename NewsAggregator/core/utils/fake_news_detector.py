@@ -3,59 +3,194 @@ import os
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
 os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
+import logging
 import torch
 from transformers import DebertaV2Tokenizer, DebertaV2ForSequenceClassification
 from pathlib import Path
 from django.conf import settings
+from . import model_registry
+from .batching import padded_batches
+from .fake_news_prefilter import FAKE_LABEL, FAKE_THRESHOLD, Prefilter, in_band
+
+logger = logging.getLogger(__name__)
 
 MODEL_DIR = Path(settings.BASE_DIR) / "core/ml_models/fake_news_detector"
 
+MAX_INPUT_TOKENS = 512
+# Padded tokens per forward pass (rows x longest row)
+MAX_BATCH_TOKENS = 16384
 
-def detect_fake_news(text, model_dir=MODEL_DIR):
-    if not hasattr(detect_fake_news, "model"):
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+PREFILTER_PATH = Path(settings.BASE_DIR) / "core/ml_models/fake_news_prefilter.npz"
+# Prefilter P(fake) strictly inside this band goes on to the transformer
+UNCERTAINTY_BAND = (0.1, 0.9)
 
-        required_files = {
-            "config.json": "Model configuration",
-            "pytorch_model.bin": "Model weights",
-            "tokenizer_config.json": "Tokenizer settings",
-        }
+TIER_PREFILTER = "prefilter"
+TIER_TRANSFORMER = "transformer"
 
-        for f in required_files:
-            if not (model_dir / f).exists():
-                raise FileNotFoundError(f"Missing required file: {model_dir/f}")
+_prefilter_missing = False
 
-        detect_fake_news.model = DebertaV2ForSequenceClassification.from_pretrained(
-            model_dir, local_files_only=True, num_labels=2
-        )
 
-        detect_fake_news.tokenizer = DebertaV2Tokenizer.from_pretrained(
-            model_dir, local_files_only=True
+def load_detector(model_dir=MODEL_DIR, backend=None):
+    """
+    ``(model, tokenizer)`` of the detector in ``model_dir``.
+
+    ``backend`` (default: the FAKE_NEWS_BACKEND setting) is "torch", or
+    "onnx" / "onnx-int8" for an ONNX Runtime session over the export made
+    by ``manage.py export_fake_news_onnx``.
+    """
+    backend = backend or getattr(settings, "FAKE_NEWS_BACKEND", "torch")
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    required_files = {
+        "config.json": "Model configuration",
+        "tokenizer_config.json": "Tokenizer settings",
+    }
+    if backend == "torch":
+        required_files["pytorch_model.bin"] = "Model weights"
+
+    for f in required_files:
+        if not (model_dir / f).exists():
+            raise FileNotFoundError(f"Missing required file: {model_dir/f}")
+
+    tokenizer = DebertaV2Tokenizer.from_pretrained(
+        model_dir, local_files_only=True
+    )
+
+    if backend != "torch":
+        from .fake_news_onnx import OnnxDetector, onnx_path
+
+        model = OnnxDetector(
+            onnx_path(model_dir, quantized=backend == "onnx-int8"),
+            threads=getattr(settings, "FAKE_NEWS_ONNX_THREADS", None),
         )
+        return model, tokenizer
 
-        detect_fake_news.model = detect_fake_news.model.to(device).eval()
-        torch.cuda.empty_cache() if device.type == "cuda" else None
+    model = DebertaV2ForSequenceClassification.from_pretrained(
+        model_dir, local_files_only=True, num_labels=2
+    )
+
+    model = model.to(device).eval()
+    torch.cuda.empty_cache() if device.type == "cuda" else None
+    return model, tokenizer
 
-    inputs = detect_fake_news.tokenizer(
-        text.strip(),
-        max_length=512,
-        padding="max_length",
-        truncation=True,
-        return_tensors="pt",
-    ).to(detect_fake_news.model.device)
 
+def _torch_fake_probabilities(model, inputs):
+    inputs = inputs.to(model.device)
     with torch.no_grad(), torch.amp.autocast(
-        device_type="cuda" if detect_fake_news.model.device.type == "cuda" else "cpu",
-        enabled=detect_fake_news.model.device.type == "cuda",
+        device_type="cuda" if model.device.type == "cuda" else "cpu",
+        enabled=model.device.type == "cuda",
     ):
-        outputs = detect_fake_news.model(**inputs)
-        probabilities = torch.softmax(outputs.logits, dim=1)
+        outputs = model(**inputs)
+        probabilities = torch.softmax(outputs.logits.float(), dim=1)
+    return probabilities[:, FAKE_LABEL].tolist()
+
+
+def score_batch(model, tokenizer, texts, max_batch_tokens=None):
+    """
+    Fake scores in percent of ``texts`` under a loaded detector.
+
+    Texts are tokenized once, sorted by token count and scored in batches
+    padded only to their longest member, at most ``max_batch_tokens``
+    padded tokens per forward pass.
+    """
+    on_torch = isinstance(model, torch.nn.Module)
+    if max_batch_tokens is None:
+        max_batch_tokens = getattr(settings, "FAKE_NEWS_BATCH_TOKENS", MAX_BATCH_TOKENS)
+
+    encoded = tokenizer(
+        [(text or "").strip() for text in texts],
+        max_length=MAX_INPUT_TOKENS,
+        truncation=True,
+    )["input_ids"]
+
+    scores = [0.0] * len(texts)
+    for batch in padded_batches([len(ids) for ids in encoded], max_batch_tokens):
+        inputs = tokenizer.pad(
+            {"input_ids": [encoded[i] for i in batch]},
+            padding=True,
+            return_tensors="pt" if on_torch else "np",
+        )
+        if on_torch:
+            probabilities = _torch_fake_probabilities(model, inputs)
+        else:
+            probabilities = model.fake_probabilities(
+                inputs["input_ids"], inputs["attention_mask"]
+            )
 
-    fake_score = probabilities[0, 1].item() * 100
-    is_fake = fake_score > 50
+        for i, probability in zip(batch, probabilities):
+            scores[i] = probability * 100
 
-    del inputs, outputs, probabilities
-    if torch.cuda.is_available():
+    if on_torch and model.device.type == "cuda":
         torch.cuda.empty_cache()
 
-    return is_fake, fake_score
\ No newline at end of file
+    return scores
+
+
+def detect_fake_news_batch(
+    texts, model_dir=MODEL_DIR, max_batch_tokens=None, backend=None
+):
+    """``(is_fake, fake score in percent)`` for each of ``texts``."""
+    if model_dir == MODEL_DIR and backend is None:
+        model, tokenizer = model_registry.get_model("fake_news_detector")
+    else:
+        model, tokenizer = load_detector(model_dir, backend)
+    scores = score_batch(model, tokenizer, texts, max_batch_tokens)
+    return [(score > FAKE_THRESHOLD * 100, score) for score in scores]
+
+
+def detect_fake_news(text, model_dir=MODEL_DIR):
+    return detect_fake_news_batch([text], model_dir)[0]
+
+
+def load_prefilter(path=PREFILTER_PATH):
+    return Prefilter.load(path)
+
+
+def _prefilter():
+    """The loaded prefilter, or None once it is known to be missing."""
+    global _prefilter_missing
+    if _prefilter_missing:
+        return None
+    try:
+        return model_registry.get_model("fake_news_prefilter")
+    except FileNotFoundError:
+        _prefilter_missing = True
+        logger.warning(f"No prefilter at {PREFILTER_PATH}, scoring every text with the transformer")
+        return None
+
+
+def classify_cascade(texts, band=None):
+    """
+    ``(is_fake, fake score in percent, tier)`` for each of ``texts``.
+
+    The hashed n-gram prefilter scores every text; texts it is sure about
+    (outside ``band``, default FAKE_NEWS_UNCERTAINTY_BAND) are decided by
+    it, the rest are scored in one batch by the transformer. Without a
+    trained prefilter every text goes to the transformer.
+    """
+    if band is None:
+        band = getattr(settings, "FAKE_NEWS_UNCERTAINTY_BAND", UNCERTAINTY_BAND)
+    prefilter = _prefilter()
+
+    results = [None] * len(texts)
+    escalated = []
+    for i, text in enumerate(texts):
+        probability = prefilter.score(text) if prefilter else 0.5
+        if prefilter and not in_band(probability, band):
+            results[i] = (probability > FAKE_THRESHOLD, probability * 100, TIER_PREFILTER)
+        else:
+            escalated.append(i)
+
+    if escalated:
+        scored = detect_fake_news_batch([texts[i] for i in escalated])
+        for i, (is_fake, score) in zip(escalated, scored):
+            results[i] = (is_fake, score, TIER_TRANSFORMER)
+    return results
+
+
+model_registry.register("fake_news_prefilter", load_prefilter)
+model_registry.register(
+    "fake_news_detector",
+    load_detector,
+    warmup=lambda _: detect_fake_news("The model is loaded once per process."),
+)
@@ -0,0 +1,111 @@
+"""
+ONNX Runtime backend of the fake news detector.
+
+``export_onnx`` turns the trained DebertaV2 checkpoint into
+``onnx/model.onnx`` (dynamic batch and sequence axes) and, optionally,
+``onnx/model.int8.onnx`` with dynamically int8-quantized weights.
+``OnnxDetector`` runs either file on CPU; it stands in for the PyTorch
+model in ``fake_news_detector`` when FAKE_NEWS_BACKEND is "onnx" or
+"onnx-int8".
+"""
+import inspect
+import os
+from pathlib import Path
+import numpy as np
+import onnxruntime as ort
+import torch
+from transformers import DebertaV2ForSequenceClassification
+from .fake_news_prefilter import FAKE_LABEL
+
+ONNX_FILE = "model.onnx"
+INT8_FILE = "model.int8.onnx"
+
+
+def onnx_path(model_dir, quantized=False):
+    return Path(model_dir) / "onnx" / (INT8_FILE if quantized else ONNX_FILE)
+
+
+class _Logits(torch.nn.Module):
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+
+def export_onnx(model_dir, quantize=True, opset=17):
+    """Export the checkpoint in ``model_dir``; returns the written paths."""
+    model = DebertaV2ForSequenceClassification.from_pretrained(
+        model_dir, local_files_only=True, num_labels=2
+    ).eval()
+
+    path = onnx_path(model_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    input_ids = torch.ones((2, 16), dtype=torch.long)
+    attention_mask = torch.ones((2, 16), dtype=torch.long)
+    # torch >= 2.9 defaults to the dynamo exporter; dynamic_axes wants the old one
+    exporter = (
+        {"dynamo": False}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters
+        else {}
+    )
+    with torch.no_grad():
+        torch.onnx.export(
+            _Logits(model),
+            (input_ids, attention_mask),
+            str(path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=opset,
+            do_constant_folding=True,
+            **exporter,
+        )
+    paths = [path]
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized = onnx_path(model_dir, quantized=True)
+        quantize_dynamic(str(path), str(quantized), weight_type=QuantType.QInt8)
+        paths.append(quantized)
+    return paths
+
+
+class OnnxDetector:
+    """An ONNX Runtime CPU session over an exported detector."""
+
+    def __init__(self, path, threads=None, interop_threads=1):
+        if not Path(path).exists():
+            raise FileNotFoundError(
+                f"Missing ONNX model: {path} (run manage.py export_fake_news_onnx)"
+            )
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads or os.cpu_count()
+        options.inter_op_num_threads = interop_threads
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.path = Path(path)
+        self.session = ort.InferenceSession(
+            str(path), options, providers=["CPUExecutionProvider"]
+        )
+
+    def logits(self, input_ids, attention_mask):
+        return self.session.run(
+            ["logits"],
+            {
+                "input_ids": np.asarray(input_ids, dtype=np.int64),
+                "attention_mask": np.asarray(attention_mask, dtype=np.int64),
+            },
+        )[0]
+
+    def fake_probabilities(self, input_ids, attention_mask):
+        logits = self.logits(input_ids, attention_mask).astype(np.float64)
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        return (probabilities[:, FAKE_LABEL] / probabilities.sum(axis=1)).tolist()
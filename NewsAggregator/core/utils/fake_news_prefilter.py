@@ -0,0 +1,99 @@
+"""
+Cheap first tier of the fake news cascade.
+
+A logistic regression over hashed word 1- and 2-grams, trained by
+``fake-news-detector/train.py prefilter`` on the same True/Fake CSVs as the
+DeBERTa detector. Scoring one article is a few sparse dot products, so it
+runs on every article; only scores inside the uncertainty band are sent on
+to the transformer (see ``fake_news_detector.classify_cascade``).
+"""
+import math
+import re
+import zlib
+import numpy as np
+
+N_FEATURES = 2**18
+MAX_CHARS = 5000
+
+# Class index of fake news: ``load_data`` in fake-news-detector/train.py
+# labels real news 1 and fake news 0, for both tiers
+FAKE_LABEL = 0
+# P(fake) above which either tier calls a text fake
+FAKE_THRESHOLD = 0.5
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def features(text, n_features=N_FEATURES):
+    """
+    ``(indices, values)`` of the hashed 1- and 2-gram counts of ``text``:
+    signed (bit 31 of the CRC32), log-scaled and L2-normalised.
+    """
+    tokens = _TOKEN.findall((text or "")[:MAX_CHARS].lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if not grams:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+    hashes = np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+        dtype=np.uint32,
+        count=len(grams),
+    )
+    signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+    indices, inverse = np.unique(hashes % n_features, return_inverse=True)
+    counts = np.bincount(inverse, weights=signs)
+    values = np.sign(counts) * np.log1p(np.abs(counts))
+    norm = np.linalg.norm(values)
+    if norm:
+        values /= norm
+    return indices.astype(np.int64), values.astype(np.float32)
+
+
+def feature_matrix(texts, n_features=N_FEATURES):
+    """Sparse CSR matrix of ``features`` for training."""
+    from scipy.sparse import csr_matrix
+
+    indptr, indices, values = [0], [], []
+    for text in texts:
+        idx, val = features(text, n_features)
+        indices.append(idx)
+        values.append(val)
+        indptr.append(indptr[-1] + len(idx))
+    return csr_matrix(
+        (
+            np.concatenate(values) if values else np.zeros(0, dtype=np.float32),
+            np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+            np.array(indptr),
+        ),
+        shape=(len(texts), n_features),
+    )
+
+
+class Prefilter:
+    """Weights of the hashed n-gram model; ``score`` is P(fake)."""
+
+    def __init__(self, weights, bias):
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = float(bias)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["weights"], data["bias"])
+
+    def save(self, path):
+        np.savez_compressed(path, weights=self.weights, bias=np.float32(self.bias))
+
+    def score(self, text):
+        indices, values = features(text, len(self.weights))
+        z = float(values @ self.weights[indices]) + self.bias
+        return 1 / (1 + math.exp(-max(min(z, 30.0), -30.0)))
+
+    def score_many(self, texts):
+        return [self.score(text) for text in texts]
+
+
+def in_band(probability, band):
+    """Whether ``probability`` is too uncertain for the prefilter to decide."""
+    low, high = band
+    return low < probability < high
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+# Same directory as db.sqlite3 (settings.BASE_DIR), without importing settings
+FEED_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "feed_cache.json"
+
+
+class FeedCache:
+    """
+    Persistent HTTP validator store for feed and API endpoints.
+
+    For every feed it remembers the ``ETag`` / ``Last-Modified`` validators of
+    the last 200 response, so the next request can be made conditional, and a
+    digest of the item GUIDs, so a feed whose body changed but whose items did
+    not can skip the DB work as well.
+
+    What a fetch learns is only staged, under the job (source URL) that
+    fetched it; ``commit(job)`` makes it count once that source's articles
+    are stored, so a failed DB write is not followed by a 304 or an
+    "unchanged" digest that would lose its items for good. ``save``
+    writes the committed entries.
+    """
+
+    def __init__(self, path=FEED_CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._staged = {}
+        self._dirty = set()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.path}: {str(e)}")
+            return {}
+
+    @staticmethod
+    def key(url, params=None):
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def request_headers(self, key):
+        entry = self._entries.get(key, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _stage(self, job, key, **fields):
+        with self._lock:
+            self._staged.setdefault(job, {}).setdefault(key, {}).update(fields)
+
+    def store_validators(self, key, response, job=None):
+        self._stage(
+            job,
+            key,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def items_unchanged(self, key, guids, job=None):
+        """Stage the GUID digest for ``key`` and report whether it matched."""
+        digest = hashlib.sha1("\n".join(guids).encode("utf-8")).hexdigest()
+        with self._lock:
+            unchanged = self._entries.get(key, {}).get("items") == digest
+        if not unchanged:
+            self._stage(job, key, items=digest)
+        return unchanged
+
+    def commit(self, job=None):
+        """Keep what ``job`` fetched (every job with None) for the next run."""
+        with self._lock:
+            jobs = list(self._staged) if job is None else [job]
+            for name in jobs:
+                for key, fields in self._staged.pop(name, {}).items():
+                    entry = self._entries.setdefault(key, {})
+                    if any(entry.get(f) != v for f, v in fields.items()):
+                        entry.update(fields)
+                        self._dirty.add(key)
+
+    def discard(self, job):
+        """Forget what ``job`` fetched, so the next run fetches it in full."""
+        with self._lock:
+            self._staged.pop(job, None)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                # Merge into the file as it is now, other workers save too
+                entries = self._load()
+                for key in self._dirty:
+                    entries[key] = self._entries[key]
+                self._entries = entries
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = set()
+            except Exception as e:
+                logger.warning(f"Could not save feed cache {self.path}: {str(e)}")
@@ -0,0 +1,88 @@
+import io
+import logging
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+_ITEM_TAGS = ("item", f"{{{ATOM_NS}}}entry")
+
+
+def _child_text(elem, *tags):
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None and child.text:
+            return child.text.strip()
+    return ""
+
+
+def _atom_link(entry):
+    fallback = ""
+    for link in entry.iterfind(f"{{{ATOM_NS}}}link"):
+        href = link.get("href", "")
+        if link.get("rel", "alternate") == "alternate":
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+def _normalize(elem):
+    if elem.tag == "item":
+        url = _child_text(elem, "link")
+        return {
+            "title": _child_text(elem, "title"),
+            "content": _child_text(elem, "description"),
+            "date": _child_text(elem, "pubDate", f"{{{DC_NS}}}date"),
+            "url": url,
+            "guid": _child_text(elem, "guid") or url or _child_text(elem, "title"),
+        }
+
+    url = _atom_link(elem)
+    return {
+        "title": _child_text(elem, f"{{{ATOM_NS}}}title"),
+        "content": _child_text(elem, f"{{{ATOM_NS}}}summary", f"{{{ATOM_NS}}}content"),
+        "date": _child_text(elem, f"{{{ATOM_NS}}}published", f"{{{ATOM_NS}}}updated"),
+        "url": url,
+        "guid": _child_text(elem, f"{{{ATOM_NS}}}id") or url,
+    }
+
+
+def iter_feed_items(data, limit=None):
+    """
+    Stream normalized items out of an RSS 2.0 or Atom document.
+
+    ``data`` is the raw feed as bytes or a binary file object. Items are
+    yielded as ``{"title", "content", "date", "url", "guid"}`` dicts as soon
+    as their closing tag is read, each element is freed once processed and
+    parsing stops after ``limit`` items, so only the part of the feed we use
+    is ever parsed.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = io.BytesIO(data)
+
+    context = etree.iterparse(
+        data,
+        events=("end",),
+        tag=_ITEM_TAGS,
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    count = 0
+    try:
+        for _, elem in context:
+            try:
+                yield _normalize(elem)
+                count += 1
+            except Exception as e:
+                logger.error(f"Error parsing feed item: {str(e)}")
+            finally:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            if limit is not None and count >= limit:
+                break
+    finally:
+        del context
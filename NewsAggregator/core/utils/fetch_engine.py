@@ -0,0 +1,216 @@
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from .robots_cache import ROBOTS_USER_AGENT, robots_cache
+from .scrapers import get_session
+
+logger = logging.getLogger(__name__)
+
+# URL of the scraper job a coroutine runs for; feed validators are staged
+# under it (see FeedCache.commit)
+_current_job = contextvars.ContextVar("fetch_engine_job", default=None)
+
+
+class RobotsDisallowed(Exception):
+    pass
+
+
+class FetchEngine:
+    """
+    Asyncio fetch engine shared by every scraper in a scrape cycle.
+
+    Requests go through one pooled keep-alive ``requests`` session and are
+    run on a thread pool so the event loop never blocks. Each host gets its
+    own concurrency limit and a politeness delay between consecutive
+    requests, so different sources are fetched in parallel while a single
+    site is never hammered.
+
+    Every URL is checked against the shared robots.txt cache first, and a
+    host's ``Crawl-delay`` raises its politeness delay. Pass ``robots=None``
+    to skip robots checks.
+
+    Pass a ``FeedCache`` to make feed requests conditional across runs;
+    without one every feed is fetched and parsed in full. Validators are
+    only staged per job: the caller commits and saves the cache once it has
+    stored that job's articles.
+    """
+
+    def __init__(
+        self,
+        session=None,
+        per_host_limit=2,
+        max_connections=16,
+        delay_range=(1, 3),
+        timeout=15,
+        feed_cache=None,
+        robots=robots_cache,
+    ):
+        self.session = session or get_session(pool_maxsize=max_connections)
+        self.feed_cache = feed_cache
+        self.robots = robots
+        self.per_host_limit = per_host_limit
+        self.delay_range = delay_range
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_connections)
+        self._host_semaphores = {}
+        self._host_locks = {}
+        self._host_next_slot = {}
+        self._host_crawl_delay = {}
+        self._robots_locks = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _host_state(self, host):
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+            self._host_locks[host] = asyncio.Lock()
+            self._host_next_slot[host] = 0.0
+        return self._host_semaphores[host], self._host_locks[host]
+
+    async def _wait_for_slot(self, host):
+        _, lock = self._host_state(host)
+        async with lock:
+            wait = self._host_next_slot[host] - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            delay = max(
+                random.uniform(*self.delay_range),
+                self._host_crawl_delay.get(host) or 0,
+            )
+            self._host_next_slot[host] = time.monotonic() + delay
+
+    async def _robots_allowed(self, url, host):
+        hit, parser = self.robots.cached(url)
+        if not hit:
+            # Only one robots.txt download per host; it runs off the event loop
+            lock = self._robots_locks.setdefault(host, asyncio.Lock())
+            async with lock:
+                hit, parser = self.robots.cached(url)
+                if not hit:
+                    loop = asyncio.get_running_loop()
+                    parser = await loop.run_in_executor(
+                        self._executor, self.robots.get_parser, url
+                    )
+        if parser is None:
+            return True
+        if host not in self._host_crawl_delay:
+            self._host_crawl_delay[host] = parser.crawl_delay(ROBOTS_USER_AGENT)
+        return parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+    async def get(self, url, **kwargs):
+        """Fetch ``url`` politely and return the ``requests.Response``."""
+        host = urlparse(url).netloc.lower()
+        semaphore, _ = self._host_state(host)
+        kwargs.setdefault("timeout", self.timeout)
+
+        if self.robots is not None and not await self._robots_allowed(url, host):
+            raise RobotsDisallowed(f"Disallowed by robots.txt: {url}")
+
+        async with semaphore:
+            await self._wait_for_slot(host)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, lambda: self.session.get(url, **kwargs)
+            )
+
+    async def get_feed(self, url, params=None):
+        """
+        Conditional GET for a feed or API endpoint.
+
+        Returns None when the server answers 304 Not Modified, otherwise the
+        response; validators of a 200 response are kept for the next run.
+        """
+        if self.feed_cache is None:
+            return await self.get(url, params=params)
+
+        key = self.feed_cache.key(url, params)
+        response = await self.get(
+            url, params=params, headers=self.feed_cache.request_headers(key)
+        )
+        if response.status_code == 304:
+            logger.info(f"Feed not modified since last fetch: {key}")
+            return None
+        if response.status_code == 200:
+            self.feed_cache.store_validators(key, response, _current_job.get())
+        return response
+
+    def feed_unchanged(self, url, guids, params=None):
+        """True when ``url`` lists exactly the same items as on the last run."""
+        if self.feed_cache is None:
+            return False
+
+        key = self.feed_cache.key(url, params)
+        if self.feed_cache.items_unchanged(key, guids, _current_job.get()):
+            logger.info(f"Feed items unchanged since last fetch: {key}")
+            return True
+        return False
+
+    async def fetch_html(self, url):
+        """Body of a successful page fetch, or None on any error."""
+        try:
+            response = await self.get(url)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            return None
+
+    async def fetch_many_html(self, urls):
+        return await asyncio.gather(*(self.fetch_html(u) for u in urls))
+
+    async def fetch_soup(self, url, selector=None):
+        """Async counterpart of ``scrape_with_delay``: returns a soup or None."""
+        content = await self.fetch_html(url)
+        if content is None:
+            return None
+
+        soup = BeautifulSoup(content, "lxml")
+
+        if selector:
+            return soup.select(selector)
+        return soup
+
+    async def fetch_many(self, urls, selector=None):
+        return await asyncio.gather(*(self.fetch_soup(u, selector) for u in urls))
+
+
+async def _run_job(scraper, url, engine):
+    # Each gathered coroutine runs in its own copy of the context
+    _current_job.set(url)
+    return await scraper(url, engine)
+
+
+async def _gather_scrapers(jobs, engine_kwargs):
+    async with FetchEngine(**engine_kwargs) as engine:
+        return await asyncio.gather(
+            *(_run_job(scraper, url, engine) for scraper, url in jobs),
+            return_exceptions=True,
+        )
+
+
+def run_scrapers(jobs, **engine_kwargs):
+    """
+    Run ``(async_scraper, url)`` pairs concurrently on one shared engine.
+
+    Returns one entry per job in the same order: the scraper's article list,
+    or the exception it raised. With a ``feed_cache``, commit each job's URL
+    once its articles are stored, then save the cache.
+    """
+    if not jobs:
+        return []
+    return asyncio.run(_gather_scrapers(jobs, engine_kwargs))
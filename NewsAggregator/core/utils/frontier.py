@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from ..models import Article, FrontierURL
+from .fetch_engine import FetchEngine, RobotsDisallowed
+from . import ingest
+from .scrapers import extract_article_page
+from .text import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Feed items with at least this much text are stored without fetching the page
+FULL_CONTENT_CHARS = 1000
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 600
+# A failed fetch waits this long before its second attempt, doubling after
+RETRY_DELAY = 300
+BATCH_SIZE = 50
+
+
+def record_discovered(source, articles):
+    """
+    Stage one: remember the article URLs found on ``source``'s feed or index.
+
+    URLs already in the frontier, or already stored as an article, are
+    ignored. New items that arrived with their full text (e.g. the Guardian
+    API) are ingested straight away; the rest are queued for the fetch
+    workers. Returns ``(ingested, queued)``.
+    """
+    items = {}
+    complete = []
+    for article_data in articles:
+        if not article_data.get("url"):
+            # Nothing to fetch later, keep whatever the feed gave us
+            if article_data.get("content"):
+                complete.append(article_data)
+            continue
+        items.setdefault(normalize_url(article_data["url"])[:1000], article_data)
+
+    seen = set(
+        FrontierURL.objects.filter(url__in=list(items)).values_list("url", flat=True)
+    )
+    seen.update(
+        Article.objects.filter(url__in=list(items)).values_list("url", flat=True)
+    )
+
+    rows = []
+    for url, article_data in items.items():
+        if url in seen:
+            continue
+        content = article_data.get("content") or ""
+        done = len(content) >= FULL_CONTENT_CHARS
+        if done:
+            complete.append(article_data)
+        rows.append(
+            FrontierURL(
+                source=source,
+                url=url,
+                title=(article_data.get("title") or "")[:500],
+                summary=content,
+                published=(article_data.get("date") or "")[:100],
+                state=FrontierURL.DONE if done else FrontierURL.PENDING,
+            )
+        )
+    # Rows stored as done must not outlive a failed ingest, or the next
+    # discovery pass would skip their items for good
+    with transaction.atomic():
+        FrontierURL.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+        ingested = ingest.ingest_articles(source, complete, dispatch=False) if complete else []
+        _link_articles(ingested)
+    ingest.dispatch_follow_up(ingest.follow_up_ids(ingested))
+    queued = sum(row.state == FrontierURL.PENDING for row in rows)
+    return len(ingested), queued
+
+
+def _claimable(now):
+    # A pending row with a future lease_expires_at is waiting to be retried
+    not_leased = Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now)
+    return Q(state__in=[FrontierURL.PENDING, FrontierURL.FETCHING]) & not_leased
+
+
+def claim_batch(limit=BATCH_SIZE, source_id=None, now=None):
+    """
+    Lease up to ``limit`` pending URLs, oldest first.
+
+    Rows whose lease expired (their worker died) are pending again, and
+    rows backing off after a failed fetch wait for their retry time. The
+    update re-checks the claimable condition, so concurrent workers never
+    lease the same row; only rows carrying our lease are returned.
+    """
+    now = now or timezone.now()
+    pending = FrontierURL.objects.filter(_claimable(now))
+    if source_id is not None:
+        pending = pending.filter(source_id=source_id)
+    ids = list(pending.order_by("discovered_at").values_list("id", flat=True)[:limit])
+    if not ids:
+        return []
+
+    lease = now + timedelta(seconds=LEASE_SECONDS)
+    FrontierURL.objects.filter(_claimable(now), pk__in=ids).update(
+        state=FrontierURL.FETCHING,
+        lease_expires_at=lease,
+        attempts=F("attempts") + 1,
+    )
+    return list(
+        FrontierURL.objects.filter(
+            pk__in=ids, state=FrontierURL.FETCHING, lease_expires_at=lease
+        ).select_related("source")
+    )
+
+
+async def _fetch_rows(rows, engine_kwargs):
+    async def fetch(engine, row):
+        try:
+            response = await engine.get(row.url)
+            response.raise_for_status()
+            return extract_article_page(response.content, row.url, title=row.title), None
+        except Exception as e:
+            return None, e
+
+    async with FetchEngine(**engine_kwargs) as engine:
+        return await asyncio.gather(*(fetch(engine, row) for row in rows))
+
+
+def fetch_batch(rows, **engine_kwargs):
+    """Stage two: fetch and extract leased ``rows``; ``(article_data, error)`` each."""
+    if not rows:
+        return []
+    return asyncio.run(_fetch_rows(rows, engine_kwargs))
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def complete_batch(rows, results, now=None):
+    """
+    Ingest the fetched pages and settle every row's state.
+
+    A failed fetch goes back to pending, not claimable before
+    ``retry_delay``, until it has been tried ``MAX_ATTEMPTS`` times
+    (robots.txt refusals are final at once); a row that gives up is stored
+    from its feed summary if it had one.
+    """
+    now = now or timezone.now()
+    by_source = defaultdict(list)
+
+    for row, (article_data, error) in zip(rows, results):
+        if article_data and article_data["content"]:
+            if row.published:
+                # The feed's date is more reliable than one scraped off the page
+                article_data["date"] = row.published
+            by_source[row.source].append(article_data)
+            continue
+
+        error = error or ValueError("No article text extracted")
+        final = isinstance(error, RobotsDisallowed) or row.attempts >= MAX_ATTEMPTS
+        logger.warning(f"Error fetching {row.url} (attempt {row.attempts}): {str(error)}")
+        FrontierURL.objects.filter(pk=row.pk).update(
+            state=FrontierURL.FAILED if final else FrontierURL.PENDING,
+            lease_expires_at=None if final else now + retry_delay(row.attempts),
+            last_error=str(error)[:1000],
+        )
+        if final and row.summary:
+            by_source[row.source].append(
+                {
+                    "title": row.title,
+                    "content": row.summary,
+                    "date": row.published,
+                    "url": row.url,
+                }
+            )
+
+    created = []
+    for source, articles in by_source.items():
+        created.extend(ingest.ingest_articles(source, articles))
+
+    # Rows still leased are the ones fetched successfully
+    FrontierURL.objects.filter(
+        pk__in=[row.pk for row in rows], state=FrontierURL.FETCHING
+    ).update(
+        state=FrontierURL.DONE, lease_expires_at=None, fetched_at=now
+    )
+    _link_articles(created)
+    return len(created)
+
+
+def _link_articles(articles):
+    article_ids = {article.url: article.id for article in articles if article.url}
+    rows = list(FrontierURL.objects.filter(url__in=list(article_ids)))
+    for row in rows:
+        row.article_id = article_ids[row.url]
+    FrontierURL.objects.bulk_update(rows, ["article"], batch_size=500)
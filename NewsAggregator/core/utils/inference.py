@@ -0,0 +1,238 @@
+"""
+Client of the shared inference server (``manage.py inference_server``).
+
+Views and tasks call ``summarize``, ``classify`` and ``embed`` here instead
+of loading the models themselves. With INFERENCE_SOCKET set (a Unix socket
+path, or ``host:port``) the texts go to the server, which holds each model
+once and merges concurrent requests into micro-batches; without it, or
+while nothing listens on the socket, they run in this process. A server
+that is up but slow to answer is waited for (INFERENCE_TIMEOUT) and a
+timeout is raised, so a busy server does not make every caller load the
+models itself.
+
+Messages are length-prefixed JSON: a 4-byte big-endian size, then
+``{"op": ..., "texts": [...], "options": {...}}`` one way and
+``{"results": [...]}`` or ``{"error": "..."}`` the other.
+"""
+import base64
+import json
+import logging
+import socket
+import struct
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 600
+# Seconds before the first reconnect after a refused connection; doubles
+# with each further refusal up to MAX_RECONNECT_DELAY
+RECONNECT_DELAY = 5
+MAX_RECONNECT_DELAY = 300
+
+_HEADER = struct.Struct(">I")
+
+
+class InferenceError(Exception):
+    """The server ran the request and the model failed."""
+
+
+class ServerUnavailable(ConnectionError):
+    """Nothing listens at the address; the caller may run the models itself."""
+
+
+def send_message(sock, payload):
+    body = json.dumps(payload).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def recv_message(stream):
+    """The next message of a socket file, or None at end of stream."""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (size,) = _HEADER.unpack(header)
+    body = stream.read(size)
+    if len(body) < size:
+        return None
+    return json.loads(body)
+
+
+def encode_array(array):
+    array = np.ascontiguousarray(array, dtype=np.float32)
+    return {
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def decode_array(payload):
+    return np.frombuffer(
+        base64.b64decode(payload["data"]), dtype=np.float32
+    ).reshape(payload["shape"])
+
+
+def parse_address(address):
+    """A Unix socket path, or ``(host, port)`` for ``host:port``."""
+    if address.startswith("/") or ":" not in address:
+        return address
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+class InferenceClient:
+    """One connection per thread to the server at ``address``."""
+
+    def __init__(self, address, timeout=DEFAULT_TIMEOUT):
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._refusals = 0
+        self._retry_at = 0.0
+
+    def _connect(self):
+        """
+        A new connection; raises ServerUnavailable if the server refuses it
+        or its socket is missing, and without trying again until the
+        reconnect delay has passed.
+        """
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise ServerUnavailable(
+                f"Inference server at {self.address} unavailable, "
+                f"retrying in {self._retry_at - now:.0f}s"
+            )
+        try:
+            if isinstance(self.address, tuple):
+                sock = socket.create_connection(self.address, timeout=self.timeout)
+            else:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(self.timeout)
+                try:
+                    sock.connect(self.address)
+                except OSError:
+                    sock.close()
+                    raise
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            delay = min(RECONNECT_DELAY * 2**self._refusals, MAX_RECONNECT_DELAY)
+            self._refusals += 1
+            self._retry_at = now + delay
+            logger.warning(
+                f"Inference server at {self.address} unavailable, "
+                f"running models in-process for {delay}s: {str(e)}"
+            )
+            raise ServerUnavailable(str(e)) from e
+        self._refusals = 0
+        self._retry_at = 0.0
+        return sock, sock.makefile("rb")
+
+    def _exchange(self, message):
+        sock, stream = self._local.conn
+        try:
+            send_message(sock, message)
+            response = recv_message(stream)
+            if response is None:
+                raise ConnectionError("Inference server closed the connection")
+        except OSError:
+            self.close()
+            raise
+        return response
+
+    def request(self, op, texts=(), **options):
+        message = {"op": op, "texts": list(texts), "options": options}
+        if getattr(self._local, "conn", None) is None:
+            self._local.conn = self._connect()
+            response = self._exchange(message)
+        else:
+            try:
+                response = self._exchange(message)
+            except socket.timeout:
+                raise
+            except OSError:
+                # The server restarted since this connection was opened
+                self._local.conn = self._connect()
+                response = self._exchange(message)
+        if "error" in response:
+            raise InferenceError(response["error"])
+        return response["results"]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn:
+            conn[1].close()
+            conn[0].close()
+
+    def ping(self):
+        return self.request("ping")
+
+    def summarize(self, texts, max_length=130, min_length=30):
+        return self.request("summarize", texts, max_length=max_length, min_length=min_length)
+
+    def classify(self, texts):
+        return [tuple(result) for result in self.request("classify", texts)]
+
+    def embed(self, texts):
+        return decode_array(self.request("embed", texts))
+
+
+_clients = {}
+
+
+def get_client():
+    """The client for INFERENCE_SOCKET, or None to run models in-process."""
+    from django.conf import settings
+
+    address = getattr(settings, "INFERENCE_SOCKET", "")
+    if not address:
+        return None
+    if address not in _clients:
+        _clients[address] = InferenceClient(
+            address, getattr(settings, "INFERENCE_TIMEOUT", DEFAULT_TIMEOUT)
+        )
+    return _clients[address]
+
+
+def _remote(op, *args):
+    """
+    Results from the server, or None to fall back to the local models when
+    there is no server. Timeouts and other errors are raised.
+    """
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        return getattr(client, op)(*args)
+    except ServerUnavailable:
+        return None
+
+
+def summarize(texts, max_length=130, min_length=30):
+    """Summaries of ``texts`` (see ``article_summarizer.summarize_batch``)."""
+    results = _remote("summarize", texts, max_length, min_length)
+    if results is None:
+        from .article_summarizer import summarize_batch
+
+        results = summarize_batch(texts, max_length=max_length, min_length=min_length)
+    return results
+
+
+def classify(texts):
+    """``(is_fake, score, tier)`` of ``texts`` (see ``fake_news_detector.classify_cascade``)."""
+    results = _remote("classify", texts)
+    if results is None:
+        from .fake_news_detector import classify_cascade
+
+        results = classify_cascade(texts)
+    return results
+
+
+def embed(texts):
+    """Sentence embeddings of ``texts`` as a float32 array."""
+    results = _remote("embed", texts)
+    if results is None:
+        from .recommendations import get_model
+
+        results = get_model().encode(list(texts), convert_to_numpy=True)
+    return results
@@ -0,0 +1,221 @@
+"""
+Shared local inference server.
+
+One process holds each model once and serves the ``core.utils.inference``
+protocol on a Unix socket or a localhost port. Requests for a model queue
+up in its ``MicroBatcher``: the first waiting request opens a batch, which
+takes in whatever else arrives within ``max_wait`` seconds (up to
+``max_batch`` texts) and runs as one call of the model, so concurrent
+single-article requests from views and tasks share a forward pass.
+
+    INFERENCE_SOCKET=/tmp/newsaggregator-inference.sock python manage.py inference_server
+
+with the same INFERENCE_SOCKET in the environment of the web and Celery
+processes.
+"""
+import json
+import logging
+import os
+import queue
+import socketserver
+import threading
+import time
+from .inference import encode_array, parse_address, recv_message, send_message
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH = 32
+MAX_WAIT = 0.01
+
+
+class _Pending:
+    def __init__(self, texts, options):
+        self.texts = texts
+        self.options = options
+        self.results = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """Runs ``fn(texts, **options)`` on micro-batches of submitted texts."""
+
+    def __init__(self, fn, max_batch=MAX_BATCH, max_wait=MAX_WAIT, name="model"):
+        self.fn = fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.name = name
+        self.batches = 0
+        self.requests = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"batcher-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts, options=None):
+        """Results for ``texts``, once the batch they joined has run."""
+        pending = _Pending(list(texts), options or {})
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.results
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first):
+        batch, size = [first], len(first.texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                pending = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if pending is None:
+                self._queue.put(None)
+                break
+            batch.append(pending)
+            size += len(pending.texts)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+
+            # Requests with different options (e.g. summary length) run apart
+            groups = {}
+            for pending in batch:
+                key = json.dumps(pending.options, sort_keys=True)
+                groups.setdefault(key, []).append(pending)
+
+            for group in groups.values():
+                texts = [text for pending in group for text in pending.texts]
+                try:
+                    results = self.fn(texts, **group[0].options) if texts else []
+                except Exception as e:
+                    logger.error(f"{self.name} failed on a batch of {len(texts)} texts: {str(e)}")
+                    for pending in group:
+                        pending.error = e
+                else:
+                    start = 0
+                    for pending in group:
+                        pending.results = results[start : start + len(pending.texts)]
+                        start += len(pending.texts)
+                for pending in group:
+                    pending.done.set()
+                self.batches += 1
+            self.requests += len(batch)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.inference
+        while True:
+            try:
+                message = recv_message(self.rfile)
+            except (OSError, ValueError):
+                return
+            if message is None:
+                return
+            try:
+                response = {"results": server.dispatch(message)}
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {str(e)}"}
+            try:
+                send_message(self.connection, response)
+            except OSError:
+                return
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    # Every web and worker process may connect at once
+    request_queue_size = 128
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class InferenceServer:
+    """
+    Serves ``handlers`` (``{op: fn(texts, **options)}``) on ``address``;
+    ``encoders`` turn an op's results into JSON (e.g. embeddings to base64).
+    Use as a context manager or ``serve_forever()``.
+    """
+
+    def __init__(self, address, handlers, encoders=None, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.address = parse_address(address)
+        self.batchers = {
+            op: MicroBatcher(fn, max_batch, max_wait, name=op) for op, fn in handlers.items()
+        }
+        self.encoders = encoders or {}
+
+        if isinstance(self.address, tuple):
+            self.server = _TCPServer(self.address, _Handler)
+        else:
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            self.server = _UnixServer(self.address, _Handler)
+        self.server.inference = self
+        self._thread = None
+
+    def dispatch(self, message):
+        op = message.get("op")
+        if op == "ping":
+            return {
+                name: {"batches": batcher.batches, "requests": batcher.requests}
+                for name, batcher in self.batchers.items()
+            }
+        if op not in self.batchers:
+            raise ValueError(f"Unknown op {op!r}")
+        results = self.batchers[op].submit(message.get("texts", []), message.get("options"))
+        encode = self.encoders.get(op)
+        return encode(results) if encode else results
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for batcher in self.batchers.values():
+            batcher.stop()
+        if not isinstance(self.address, tuple) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def model_handlers():
+    """The handlers and encoders of the app's models, loaded on first use."""
+    from .article_summarizer import summarize_batch
+    from .fake_news_detector import classify_cascade
+    from .recommendations import get_model
+
+    handlers = {
+        "summarize": lambda texts, max_length=130, min_length=30: summarize_batch(
+            texts, max_length=max_length, min_length=min_length
+        ),
+        "classify": lambda texts: [list(result) for result in classify_cascade(texts)],
+        "embed": lambda texts: get_model().encode(texts, convert_to_numpy=True),
+    }
+    return handlers, {"embed": encode_array}
@@ -0,0 +1,156 @@
+import logging
+from django.db import IntegrityError, transaction
+from ..models import Article
+from .language_id import detect_language, needs_translation
+from .near_duplicates import index_articles, link_near_duplicates
+from .scrapers import parse_date
+from .text import normalize_title, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Translation of new articles is deferred so bursts of ingests batch up behind it
+TRANSLATION_DELAY = 300
+
+
+def _build_articles(source, articles):
+    candidates = {}
+    for article_data in articles:
+        title = (article_data.get("title") or "").strip()
+        title_key = normalize_title(title)
+        if not title_key or title_key in candidates:
+            continue
+        candidates[title_key] = article_data
+    return candidates
+
+
+def _existing_keys(source, title_keys):
+    return set(
+        Article.objects.filter(
+            source=source, title_key__in=list(title_keys)
+        ).values_list("title_key", flat=True)
+    )
+
+
+def _insert_new(source, articles, attempts=3):
+    """
+    ``bulk_create`` the ``articles`` whose headlines are still unseen and
+    return exactly the rows inserted here.
+
+    A conflict means another worker stored some of the headlines in the
+    meantime: those are dropped (that worker follows them up) and the rest
+    are inserted again.
+    """
+    for attempt in range(attempts):
+        try:
+            with transaction.atomic():
+                created = Article.objects.bulk_create(articles, batch_size=100)
+            break
+        except IntegrityError:
+            if attempt == attempts - 1:
+                raise
+            taken = _existing_keys(source, (a.title_key for a in articles))
+            articles = [a for a in articles if a.title_key not in taken]
+            for article in articles:
+                # Ids handed out by the rolled-back insert are not real
+                article.pk = None
+            if not articles:
+                return []
+
+    if any(a.pk is None for a in created):
+        # The backend did not return primary keys from the bulk insert; the
+        # unique constraint makes every row with these keys one of ours
+        ids = dict(
+            Article.objects.filter(
+                source=source, title_key__in=[a.title_key for a in created]
+            ).values_list("title_key", "id")
+        )
+        for article in created:
+            article.pk = ids.get(article.title_key)
+    return created
+
+
+def ingest_articles(source, articles, dispatch=True):
+    """
+    Store scraped ``articles`` for ``source`` in a handful of queries.
+
+    Existing headlines are looked up with one query, only unseen ones are
+    written with ``bulk_create`` and follow-up translation is queued as one
+    batched task. Near-duplicates of a recent story from any source are
+    linked to it and skip the follow-up work. Returns the list of newly
+    created ``Article`` objects.
+    """
+    candidates = _build_articles(source, articles)
+    if not candidates:
+        return []
+
+    existing = _existing_keys(source, candidates)
+
+    new_articles = []
+    for title_key, article_data in candidates.items():
+        if title_key in existing:
+            continue
+        try:
+            new_articles.append(
+                Article(
+                    source=source,
+                    title=article_data["title"].strip()[:500],
+                    title_key=title_key,
+                    url=normalize_url(article_data["url"])[:1000] if article_data.get("url") else "",
+                    raw_content=article_data["content"],
+                    processed_content=article_data["content"],
+                    publication_date=parse_date(article_data["date"], source=source.pk),
+                    language=detect_language(
+                        f"{article_data['title']}. {article_data['content']}"
+                    )[0],
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error preparing article '{article_data.get('title', 'Unknown')}': {str(e)}"
+            )
+
+    if not new_articles:
+        return []
+
+    duplicates = link_near_duplicates(new_articles)
+    if duplicates:
+        logger.info(f"{duplicates} new articles from {source.name} are near-duplicates")
+
+    # Duplicates of a story first seen in this batch need its id: insert them
+    # once the rest are stored
+    later = [a for a in new_articles if a.canonical is not None and a.canonical.pk is None]
+    later_ids = {id(a) for a in later}
+    created = _insert_new(source, [a for a in new_articles if id(a) not in later_ids])
+    for article in later:
+        if article.canonical.pk is None:
+            # Its canonical was stored by another worker in the meantime
+            article.canonical = None
+    if later:
+        created += _insert_new(source, later)
+    index_articles(created)
+
+    if dispatch:
+        dispatch_follow_up(follow_up_ids(created))
+    return created
+
+
+def follow_up_ids(articles):
+    # Only non-English originals are translated; near-duplicates reuse
+    # their canonical article's results
+    return [
+        a.id
+        for a in articles
+        if a.canonical_id is None and needs_translation(a.language)
+    ]
+
+
+def dispatch_follow_up(article_ids):
+    if not article_ids:
+        return
+    from ..tasks import translate_articles_batch
+
+    translate_articles_batch.apply_async(
+        args=(article_ids, "en"),
+        queue="translations",
+        countdown=TRANSLATION_DELAY,
+    )
@@ -0,0 +1,80 @@
+import math
+import re
+from collections import Counter
+from .language_samples import SAMPLES
+
+MAX_CHARS = 2000
+MIN_LETTERS = 20
+
+_NON_LETTERS = re.compile(r"[\W\d_]+", re.UNICODE)
+
+# Writing systems that identify a language on their own
+_SCRIPTS = [
+    ("ru", re.compile(r"[Ѐ-ӿ]")),
+    ("ar", re.compile(r"[؀-ۿ]")),
+    ("el", re.compile(r"[Ͱ-Ͽ]")),
+    ("ko", re.compile(r"[가-힯]")),
+    ("ja", re.compile(r"[぀-ヿ]")),
+    ("zh", re.compile(r"[一-鿿]")),
+]
+
+
+def _trigrams(text):
+    counts = Counter()
+    for word in _NON_LETTERS.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            counts[padded[i : i + 3]] += 1
+    return counts
+
+
+def _build_profiles(samples):
+    profiles = {}
+    for language, text in samples.items():
+        counts = _trigrams(text)
+        total = sum(counts.values())
+        vocabulary = len(counts) + 1
+        # Add-one smoothed log probabilities; unseen trigrams share the floor
+        profiles[language] = (
+            {gram: math.log((n + 1) / (total + vocabulary)) for gram, n in counts.items()},
+            math.log(1 / (total + vocabulary)),
+        )
+    return profiles
+
+
+_PROFILES = _build_profiles(SAMPLES)
+
+
+def detect_language(text, min_letters=MIN_LETTERS):
+    """
+    ``(language code, confidence)`` of ``text``, or ``("", 0.0)`` if unsure.
+
+    Non-Latin scripts are recognised from their Unicode ranges. Latin text
+    is scored with a naive Bayes model over character trigrams built from
+    ``language_samples``; confidence is the posterior of the winner. Only
+    the first ``MAX_CHARS`` characters are looked at.
+    """
+    text = (text or "")[:MAX_CHARS]
+    letters = sum(ch.isalpha() for ch in text)
+    if letters < min_letters:
+        return "", 0.0
+
+    for language, script in _SCRIPTS:
+        if len(script.findall(text)) > letters / 2:
+            return language, 1.0
+
+    grams = _trigrams(text)
+    if not grams:
+        return "", 0.0
+    scores = {
+        language: sum(n * logprobs.get(gram, floor) for gram, n in grams.items())
+        for language, (logprobs, floor) in _PROFILES.items()
+    }
+    best = max(scores, key=scores.get)
+    norm = sum(math.exp(score - scores[best]) for score in scores.values())
+    return best, 1 / norm
+
+
+def needs_translation(language, target="en"):
+    """Whether text detected as ``language`` must be translated to ``target``."""
+    return bool(language) and language != target
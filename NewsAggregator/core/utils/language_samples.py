@@ -0,0 +1,175 @@
+# Seed text for the character n-gram language profiles in language_id.py.
+# News-style prose; a few hundred words per language is enough to separate
+# these languages on article-length input.
+SAMPLES = {
+    "en": """
+The government announced on Tuesday that it would increase spending on
+public health and education after months of pressure from opposition
+parties and local officials. The minister said the new budget would be
+presented to parliament next week and that most of the money would go to
+hospitals, schools and transport in the regions that have been hit hardest
+by the economic slowdown. Critics argued that the plan does not go far
+enough and that households are still struggling with high prices for food
+and energy. Meanwhile, the central bank kept interest rates unchanged and
+warned that inflation could remain above its target for longer than
+expected. Officials said they were watching the situation closely and were
+ready to act if necessary. In other news, thousands of people gathered in
+the capital over the weekend to protest against the closure of a factory
+that employed more than two thousand workers. Police said the
+demonstration was peaceful. Scientists have also reported that this summer
+was one of the hottest on record, with wildfires and floods affecting
+several countries. The company said its profits rose in the third quarter
+thanks to strong demand for its products, although it expects sales to
+slow down next year. Players and fans celebrated late into the night after
+the team won the championship for the first time in over twenty years.
+They will travel to the final round of the tournament, which is being held
+this year in a city where the weather should be warm and dry, according
+to forecasters. What happens next will depend on whether the talks between
+the two sides can produce an agreement that both of them are willing to
+accept.
+""",
+    "es": """
+El gobierno anunció el martes que aumentará el gasto en sanidad pública y
+educación después de meses de presión por parte de los partidos de la
+oposición y de las autoridades locales. El ministro dijo que el nuevo
+presupuesto se presentará al parlamento la próxima semana y que la mayor
+parte del dinero se destinará a hospitales, escuelas y transporte en las
+regiones más afectadas por la desaceleración económica. Los críticos
+afirmaron que el plan no va lo suficientemente lejos y que los hogares
+siguen teniendo dificultades con los altos precios de los alimentos y la
+energía. Mientras tanto, el banco central mantuvo los tipos de interés sin
+cambios y advirtió de que la inflación podría seguir por encima de su
+objetivo durante más tiempo de lo previsto. Los responsables señalaron que
+están siguiendo la situación de cerca y que están preparados para actuar si
+fuera necesario. Miles de personas se reunieron en la capital durante el
+fin de semana para protestar contra el cierre de una fábrica que empleaba a
+más de dos mil trabajadores. La policía informó de que la manifestación fue
+pacífica. Los científicos también han señalado que este verano ha sido uno
+de los más calurosos desde que hay registros, con incendios e inundaciones
+en varios países. La empresa dijo que sus beneficios crecieron en el tercer
+trimestre gracias a la fuerte demanda de sus productos, aunque espera que
+las ventas se moderen el próximo año. Los jugadores y los aficionados
+celebraron hasta altas horas de la noche después de que el equipo ganara el
+campeonato por primera vez en más de veinte años.
+""",
+    "fr": """
+Le gouvernement a annoncé mardi qu'il allait augmenter les dépenses de
+santé publique et d'éducation après des mois de pression de la part des
+partis d'opposition et des élus locaux. Le ministre a déclaré que le
+nouveau budget serait présenté au parlement la semaine prochaine et que
+l'essentiel de l'argent irait aux hôpitaux, aux écoles et aux transports
+dans les régions les plus touchées par le ralentissement économique. Les
+critiques estiment que le plan ne va pas assez loin et que les ménages ont
+toujours du mal à faire face aux prix élevés de l'alimentation et de
+l'énergie. Pendant ce temps, la banque centrale a maintenu ses taux
+d'intérêt inchangés et a averti que l'inflation pourrait rester au-dessus
+de son objectif plus longtemps que prévu. Les responsables ont indiqué
+qu'ils suivaient la situation de près et qu'ils étaient prêts à agir si
+nécessaire. Des milliers de personnes se sont rassemblées dans la capitale
+ce week-end pour protester contre la fermeture d'une usine qui employait
+plus de deux mille salariés. La police a indiqué que la manifestation
+s'était déroulée dans le calme. Les scientifiques ont également rapporté
+que cet été avait été l'un des plus chauds jamais enregistrés, avec des
+incendies et des inondations dans plusieurs pays. L'entreprise a déclaré
+que ses bénéfices avaient augmenté au troisième trimestre grâce à une forte
+demande pour ses produits, même si elle s'attend à un ralentissement des
+ventes l'année prochaine. Les joueurs et les supporters ont fêté jusque
+tard dans la nuit la victoire de l'équipe, championne pour la première fois
+depuis plus de vingt ans.
+""",
+    "de": """
+Die Regierung hat am Dienstag angekündigt, die Ausgaben für das öffentliche
+Gesundheitswesen und die Bildung zu erhöhen, nachdem Oppositionsparteien und
+Kommunalpolitiker monatelang Druck gemacht hatten. Der Minister sagte, der
+neue Haushalt werde dem Parlament in der kommenden Woche vorgelegt und der
+größte Teil des Geldes fließe in Krankenhäuser, Schulen und den Verkehr in
+den Regionen, die vom wirtschaftlichen Abschwung am stärksten betroffen
+sind. Kritiker bemängelten, dass der Plan nicht weit genug gehe und die
+Haushalte weiterhin unter den hohen Preisen für Lebensmittel und Energie
+litten. Unterdessen ließ die Zentralbank die Zinsen unverändert und warnte,
+dass die Inflation länger als erwartet über ihrem Ziel bleiben könnte. Die
+Verantwortlichen erklärten, sie beobachteten die Lage genau und seien
+bereit, wenn nötig zu handeln. Tausende Menschen versammelten sich am
+Wochenende in der Hauptstadt, um gegen die Schließung einer Fabrik zu
+protestieren, in der mehr als zweitausend Arbeiter beschäftigt waren. Die
+Polizei teilte mit, die Demonstration sei friedlich verlaufen.
+Wissenschaftler berichteten außerdem, dass dieser Sommer einer der
+heißesten seit Beginn der Aufzeichnungen gewesen sei, mit Waldbränden und
+Überschwemmungen in mehreren Ländern. Das Unternehmen teilte mit, sein
+Gewinn sei im dritten Quartal dank der starken Nachfrage nach seinen
+Produkten gestiegen, auch wenn es für das nächste Jahr mit einem
+schwächeren Absatz rechne. Spieler und Fans feierten bis spät in die Nacht,
+nachdem die Mannschaft zum ersten Mal seit über zwanzig Jahren die
+Meisterschaft gewonnen hatte.
+""",
+    "it": """
+Il governo ha annunciato martedì che aumenterà la spesa per la sanità
+pubblica e l'istruzione dopo mesi di pressioni da parte dei partiti di
+opposizione e degli amministratori locali. Il ministro ha detto che la
+nuova legge di bilancio sarà presentata al parlamento la prossima settimana
+e che la maggior parte dei fondi andrà a ospedali, scuole e trasporti nelle
+regioni più colpite dal rallentamento dell'economia. I critici sostengono
+che il piano non sia sufficiente e che le famiglie continuino a fare fatica
+con i prezzi elevati di cibo ed energia. Nel frattempo, la banca centrale
+ha lasciato invariati i tassi di interesse e ha avvertito che l'inflazione
+potrebbe restare sopra l'obiettivo più a lungo del previsto. I responsabili
+hanno spiegato che stanno seguendo la situazione da vicino e che sono pronti
+a intervenire se necessario. Migliaia di persone si sono radunate nella
+capitale durante il fine settimana per protestare contro la chiusura di una
+fabbrica che dava lavoro a più di duemila operai. La polizia ha riferito
+che la manifestazione si è svolta in modo pacifico. Gli scienziati hanno
+inoltre segnalato che questa estate è stata una delle più calde mai
+registrate, con incendi e alluvioni in diversi paesi. L'azienda ha
+dichiarato che i suoi utili sono cresciuti nel terzo trimestre grazie alla
+forte domanda dei suoi prodotti, anche se prevede un calo delle vendite il
+prossimo anno. Giocatori e tifosi hanno festeggiato fino a tarda notte dopo
+che la squadra ha vinto il campionato per la prima volta in oltre
+vent'anni.
+""",
+    "pt": """
+O governo anunciou na terça-feira que vai aumentar os gastos com saúde
+pública e educação depois de meses de pressão dos partidos da oposição e
+das autoridades locais. O ministro disse que o novo orçamento será
+apresentado ao parlamento na próxima semana e que a maior parte do dinheiro
+irá para hospitais, escolas e transportes nas regiões mais atingidas pela
+desaceleração econômica. Os críticos afirmaram que o plano não vai longe o
+suficiente e que as famílias continuam com dificuldades por causa dos
+preços altos dos alimentos e da energia. Enquanto isso, o banco central
+manteve as taxas de juros inalteradas e alertou que a inflação pode
+continuar acima da meta por mais tempo do que o esperado. Os responsáveis
+disseram que estão acompanhando a situação de perto e que estão prontos
+para agir se for necessário. Milhares de pessoas se reuniram na capital no
+fim de semana para protestar contra o fechamento de uma fábrica que
+empregava mais de dois mil trabalhadores. A polícia informou que a
+manifestação foi pacífica. Os cientistas também relataram que este verão
+foi um dos mais quentes já registrados, com incêndios e enchentes em vários
+países. A empresa disse que seus lucros cresceram no terceiro trimestre
+graças à forte procura pelos seus produtos, embora espere que as vendas
+diminuam no próximo ano. Jogadores e torcedores comemoraram até tarde da
+noite depois que a equipe conquistou o campeonato pela primeira vez em mais
+de vinte anos.
+""",
+    "nl": """
+De regering heeft dinsdag aangekondigd dat zij meer geld gaat uitgeven aan
+de volksgezondheid en het onderwijs, na maandenlange druk van
+oppositiepartijen en lokale bestuurders. De minister zei dat de nieuwe
+begroting volgende week aan het parlement wordt voorgelegd en dat het
+grootste deel van het geld naar ziekenhuizen, scholen en vervoer gaat in
+de regio's die het hardst zijn getroffen door de economische vertraging.
+Critici vinden dat het plan niet ver genoeg gaat en dat huishoudens het nog
+steeds moeilijk hebben met de hoge prijzen voor voedsel en energie.
+Ondertussen liet de centrale bank de rente ongewijzigd en waarschuwde zij
+dat de inflatie langer dan verwacht boven haar doel kan blijven. De
+verantwoordelijken zeiden dat zij de situatie nauwlettend volgen en klaar
+staan om zo nodig in te grijpen. Duizenden mensen verzamelden zich in het
+weekend in de hoofdstad om te protesteren tegen de sluiting van een fabriek
+waar meer dan tweeduizend werknemers in dienst waren. De politie meldde dat
+de demonstratie rustig verliep. Wetenschappers meldden ook dat deze zomer
+een van de warmste ooit gemeten was, met bosbranden en overstromingen in
+verschillende landen. Het bedrijf zei dat de winst in het derde kwartaal
+is gestegen dankzij de sterke vraag naar zijn producten, al verwacht het
+dat de verkoop volgend jaar zal afnemen. Spelers en supporters vierden tot
+laat in de nacht feest nadat het team voor het eerst in meer dan twintig
+jaar het kampioenschap had gewonnen.
+""",
+}
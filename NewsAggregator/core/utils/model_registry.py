@@ -0,0 +1,60 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_loaders = {}
+_warmups = {}
+_models = {}
+_lock = threading.Lock()
+
+
+def register(name, loader, warmup=None):
+    """
+    Declare how to load model ``name``; nothing is loaded yet.
+
+    ``warmup(model)``, if given, runs one small inference after loading so
+    the first real request does not pay for lazy initialisation.
+    """
+    _loaders[name] = loader
+    if warmup is not None:
+        _warmups[name] = warmup
+
+
+def get_model(name):
+    """The process-wide instance of ``name``, loaded on first use."""
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        model = _models.get(name)
+        if model is None:
+            start = time.perf_counter()
+            model = _loaders[name]()
+            _models[name] = model
+            logger.info(f"Loaded model {name} in {time.perf_counter() - start:.1f}s")
+    return model
+
+
+def warmup(names=None):
+    """Load (and warm up) ``names``, or every registered model."""
+    for name in names or list(_loaders):
+        try:
+            model = get_model(name)
+            if name in _warmups:
+                start = time.perf_counter()
+                _warmups[name](model)
+                logger.info(f"Warmed up model {name} in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            logger.error(f"Could not warm up model {name}: {str(e)}")
+
+
+def is_loaded(name):
+    return name in _models
+
+
+def unload(name):
+    with _lock:
+        _models.pop(name, None)
@@ -0,0 +1,192 @@
+import hashlib
+import re
+from datetime import timedelta
+import numpy as np
+from django.utils import timezone
+from ..models import Article, LSHBucket
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# With 16 bands of 4 rows, pairs at this Jaccard similarity become
+# candidates ~99% of the time; candidates are then verified against it.
+DUPLICATE_JACCARD = 0.7
+SHINGLE_SIZE = 3
+MIN_TOKENS = 30
+LOOKBACK_DAYS = 14
+
+DERIVED_FIELDS = (
+    "summary",
+    "article_summary",
+    "is_fake_news",
+    "fake_news_confidence",
+    "fake_news_tier",
+    "is_verified",
+    "verification_score",
+)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Multiply-shift hash family: h_i(x) = (a_i * x + b_i mod 2**64) >> 32, a_i odd
+_rng = np.random.RandomState(20240314)
+_A = (_rng.randint(0, 2**62, NUM_PERM, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+_B = _rng.randint(0, 2**62, NUM_PERM, dtype=np.uint64)
+
+
+def minhash(text):
+    """
+    MinHash signature (``NUM_PERM`` uint32 values) of the word 3-shingles of
+    ``text``, or None when the text is too short to fingerprint reliably
+    (e.g. a one-line RSS description).
+    """
+    tokens = _TOKEN.findall((text or "").lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+
+    shingles = {
+        " ".join(tokens[i : i + SHINGLE_SIZE])
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+    digests = b"".join(
+        hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles
+    )
+    hashes = np.frombuffer(digests, dtype="<u8")
+    with np.errstate(over="ignore"):
+        permuted = (hashes[:, None] * _A + _B) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(a == b))
+
+
+def band_keys(signature):
+    """One 64-bit LSH bucket key per band; the band index is part of the key."""
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS : (band + 1) * ROWS].tobytes()
+        digest = hashlib.blake2b(bytes([band]) + rows, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
+
+
+def signature_from_bytes(value):
+    return np.frombuffer(bytes(value), dtype="<u4")
+
+
+def fingerprint(article):
+    """Compute and attach the MinHash signature of an unsaved ``article``."""
+    signature = minhash(article.processed_content or article.raw_content)
+    if signature is not None:
+        article.minhash = signature.astype("<u4").tobytes()
+    return signature
+
+
+def find_canonical(signature, threshold=DUPLICATE_JACCARD, lookback_days=LOOKBACK_DAYS):
+    """
+    Most similar recent canonical article at or above ``threshold``, or None.
+
+    Only articles sharing an LSH bucket with ``signature`` are read back (one
+    indexed ``IN`` lookup), so the cost does not grow with the table size.
+    """
+    candidates = (
+        Article.objects.filter(
+            lsh_buckets__key__in=band_keys(signature),
+            canonical__isnull=True,
+            created_at__gte=timezone.now() - timedelta(days=lookback_days),
+        )
+        .distinct()
+        .only("id", "minhash", *DERIVED_FIELDS)
+    )
+
+    best, best_score = None, threshold
+    for candidate in candidates:
+        score = similarity(signature, signature_from_bytes(candidate.minhash))
+        if score >= best_score:
+            best, best_score = candidate, score
+    return best
+
+
+def link_duplicate(article, canonical):
+    """Point ``article`` at ``canonical`` and reuse whatever it has computed."""
+    article.canonical = canonical
+    for field in DERIVED_FIELDS:
+        value = getattr(canonical, field)
+        if value is not None:
+            setattr(article, field, value)
+
+
+def link_near_duplicates(articles, threshold=DUPLICATE_JACCARD):
+    """
+    Fingerprint unsaved ``articles`` and link each near-duplicate to its
+    canonical: a recent stored article or an earlier one of ``articles``,
+    whose buckets are held in memory until they are saved and indexed.
+    Returns how many were linked.
+    """
+    batch = {}
+    linked = 0
+    for article in articles:
+        signature = fingerprint(article)
+        if signature is None:
+            continue
+        keys = band_keys(signature)
+        canonical = find_canonical(signature, threshold)
+        if canonical is None:
+            best_score = threshold
+            for key in keys:
+                for candidate, candidate_signature in batch.get(key, ()):
+                    score = similarity(signature, candidate_signature)
+                    if score >= best_score:
+                        canonical, best_score = candidate, score
+        if canonical is not None:
+            link_duplicate(article, canonical)
+            linked += 1
+        else:
+            for key in keys:
+                batch.setdefault(key, []).append((article, signature))
+    return linked
+
+
+def canonical_articles(articles, only=()):
+    """
+    ``articles`` with every near-duplicate replaced by its canonical article
+    (each one once), so the models run on canonical articles only and
+    ``share_with_duplicates`` copies their results back. ``only`` restricts
+    the fields loaded for the canonical articles fetched here.
+    """
+    by_id = {article.id: article for article in articles if article.canonical_id is None}
+    missing = {article.canonical_id for article in articles} - set(by_id) - {None}
+    if missing:
+        canonicals = Article.objects.filter(id__in=missing)
+        if only:
+            canonicals = canonicals.only(*only)
+        for canonical in canonicals:
+            by_id[canonical.id] = canonical
+    return list(by_id.values())
+
+
+def share_with_duplicates(articles, fields):
+    """
+    Copy ``fields`` of freshly summarized or classified ``articles`` onto
+    their near-duplicates, which were linked before the results existed.
+    """
+    by_id = {article.id: article for article in articles}
+    duplicates = list(
+        Article.objects.filter(canonical_id__in=list(by_id)).only("id", "canonical_id")
+    )
+    for duplicate in duplicates:
+        for field in fields:
+            setattr(duplicate, field, getattr(by_id[duplicate.canonical_id], field))
+    Article.objects.bulk_update(duplicates, fields, batch_size=500)
+
+
+def index_articles(articles):
+    """Add the LSH buckets of saved canonical ``articles`` in one insert."""
+    buckets = [
+        LSHBucket(article_id=article.id, key=key)
+        for article in articles
+        if article.minhash and article.canonical_id is None
+        for key in band_keys(signature_from_bytes(article.minhash))
+    ]
+    LSHBucket.objects.bulk_create(buckets, batch_size=500)
@@ -0,0 +1,79 @@
+import logging
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count, Exists, OuterRef
+from django.utils import timezone
+from ..models import Article, ArticleTranslation, CustomUser
+from .translation import translate_and_store
+
+logger = logging.getLogger(__name__)
+
+OFF_PEAK_HOURS = (1, 6)
+BUDGET_SECONDS = 600
+LOOKBACK_HOURS = 24
+
+
+def is_off_peak(now=None):
+    """True inside the configured [start, end) UTC hour window."""
+    start, end = getattr(settings, "PRETRANSLATION_OFF_PEAK_HOURS", OFF_PEAK_HOURS)
+    hour = (now or timezone.now()).hour
+    return start <= hour < end if start <= end else hour >= start or hour < end
+
+
+def preferred_languages():
+    """``{language: number of active users}`` for every non-English preference."""
+    return dict(
+        CustomUser.objects.filter(is_active=True)
+        .exclude(language_preference="en")
+        .values_list("language_preference")
+        .annotate(users=Count("id"))
+        .order_by("-users")
+    )
+
+
+def candidates(language, since):
+    """Canonical articles since ``since`` still missing ``language``, most read first."""
+    translated = ArticleTranslation.objects.filter(
+        article=OuterRef("pk"), language=language
+    )
+    return (
+        Article.objects.filter(created_at__gte=since, canonical__isnull=True)
+        .exclude(language=language)
+        .exclude(Exists(translated))
+        .annotate(reads=Count("useractivity"))
+        .order_by("-reads", "-publication_date")
+    )
+
+
+def pretranslate(budget_seconds=None, now=None):
+    """
+    Translate new top articles into the languages users prefer.
+
+    The time budget is split between languages by how many users prefer
+    each one; a language stops once its share is spent, or when it runs out
+    of untranslated articles. Returns ``{language: articles translated}``.
+    """
+    now = now or timezone.now()
+    if budget_seconds is None:
+        budget_seconds = getattr(settings, "PRETRANSLATION_BUDGET_SECONDS", BUDGET_SECONDS)
+
+    languages = preferred_languages()
+    total_users = sum(languages.values())
+    since = now - timedelta(hours=LOOKBACK_HOURS)
+    done = {}
+
+    for language, users in languages.items():
+        deadline = time.monotonic() + budget_seconds * users / total_users
+        done[language] = 0
+        for article in candidates(language, since).iterator():
+            if time.monotonic() >= deadline:
+                break
+            try:
+                translate_and_store(article, language)
+                done[language] += 1
+            except Exception as e:
+                logger.error(
+                    f"Pre-translation of article {article.id} to {language} failed: {str(e)}"
+                )
+    return done
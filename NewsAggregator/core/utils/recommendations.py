@@ -8,27 +8,31 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sentence_transformers import SentenceTransformer
 from ..models import Article, UserActivity
+from . import inference, model_registry
+
+
+def load_embedder():
+    if torch.cuda.is_available():
+        try:
+            device = 'cuda:0'
+            # Initialize CUDA context
+            torch.cuda.init()
+            torch.cuda.set_device(0)
+            print(f"Using GPU: {torch.cuda.get_device_name(0)}")
+        except Exception as e:
+            print(f"Failed to initialize CUDA: {e}")
+            device = 'cpu'
+    else:
+        device = 'cpu'
+        print("Using CPU")
+    return SentenceTransformer("paraphrase-MiniLM-L6-v2", device=device)
 
-_model = None
 
 def get_model():
-    global _model
-    if _model is None:
-        if torch.cuda.is_available():
-            try:
-                device = 'cuda:0'
-                # Initialize CUDA context
-                torch.cuda.init()
-                torch.cuda.set_device(0)
-                print(f"Using GPU: {torch.cuda.get_device_name(0)}")
-            except Exception as e:
-                print(f"Failed to initialize CUDA: {e}")
-                device = 'cpu'
-        else:
-            device = 'cpu'
-            print("Using CPU")
-        _model = SentenceTransformer("paraphrase-MiniLM-L6-v2", device=device)
-    return _model
+    return model_registry.get_model("sentence_embedder")
+
+
+model_registry.register("sentence_embedder", load_embedder)
 
 def build_tfidf_matrix():
     articles = Article.objects.filter(processed_content__isnull=False)
@@ -81,9 +85,8 @@ def get_sentence_bert_recommendations(user_id, n=10):
         if activity.article.processed_content
     ]
     all_articles = list(Article.objects.filter(processed_content__isnull=False))
-    model = get_model()
     article_contents = [article.processed_content for article in all_articles]
-    all_embeddings = model.encode(article_contents, convert_to_tensor=True)
+    all_embeddings = torch.from_numpy(np.array(inference.embed(article_contents)))
     read_indices = [
         all_articles.index(article)
         for article in read_articles
@@ -108,11 +111,13 @@ FAISS_EMBEDDINGS_PATH = os.path.join(settings.BASE_DIR, "faiss_embeddings.npy")
 
 
 def build_and_save_faiss_index():
-    all_articles = list(Article.objects.filter(processed_content__isnull=False))
-    model = get_model()
+    # Near-duplicates would only add copies of their canonical's embedding
+    all_articles = list(
+        Article.objects.filter(processed_content__isnull=False, canonical__isnull=True)
+    )
     article_contents = [article.processed_content for article in all_articles]
 
-    embeddings = model.encode(article_contents, convert_to_numpy=True)
+    embeddings = np.array(inference.embed(article_contents), dtype="float32")
 
     faiss.normalize_L2(embeddings)
 
@@ -157,9 +162,8 @@ def get_faiss_recommendations(user_id, n=10):
 
     all_articles, index, embeddings = load_faiss_index()
 
-    model = get_model()
     read_contents = [article.processed_content for article in read_articles]
-    read_embeddings = model.encode(read_contents, convert_to_numpy=True)
+    read_embeddings = inference.embed(read_contents)
 
     user_profile = np.mean(read_embeddings, axis=0)
 
@@ -0,0 +1,153 @@
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_USER_AGENT = "NewsAggregatorBot/1.0"
+ROBOTS_TTL = 6 * 3600
+ROBOTS_FAILURE_TTL = 10 * 60
+
+
+def _base_url(url):
+    parsed_url = urlparse(url)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+
+class RobotsCache:
+    """
+    Process-wide robots.txt cache keyed by scheme and host.
+
+    Parsed rules are kept for ``ttl`` seconds. Hosts whose robots.txt could
+    not be fetched are cached as "allow everything" for ``failure_ttl``
+    seconds so a flaky site is not asked again on every URL. When a Redis
+    URL is configured the raw robots.txt is shared there, so every Celery
+    worker reuses the same download.
+    """
+
+    def __init__(self, ttl=ROBOTS_TTL, failure_ttl=ROBOTS_FAILURE_TTL, redis_url=None):
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.redis_url = redis_url
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def _get_redis(self):
+        if self._redis is None:
+            redis_url = self.redis_url
+            if redis_url is None:
+                try:
+                    from django.conf import settings
+
+                    if settings.configured:
+                        redis_url = getattr(settings, "ROBOTS_CACHE_REDIS_URL", None)
+                except ImportError:
+                    pass
+            if not redis_url:
+                self._redis = False
+            else:
+                try:
+                    import redis
+
+                    self._redis = redis.Redis.from_url(redis_url, socket_timeout=2)
+                except Exception as e:
+                    logger.warning(f"Robots cache running without Redis: {str(e)}")
+                    self._redis = False
+        return self._redis or None
+
+    def cached(self, url):
+        """Return ``(hit, parser)`` without touching the network."""
+        key = _base_url(url)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    def get_parser(self, url):
+        """Return the RobotFileParser for ``url``'s host, or None if unavailable."""
+        hit, parser = self.cached(url)
+        if hit:
+            return parser
+
+        key = _base_url(url)
+        status, body = self._load_shared(key)
+        if status is None:
+            status, body = self._download(key)
+            self._store_shared(key, status, body)
+
+        parser = self._build_parser(key, status, body)
+        ttl = self.failure_ttl if parser is None else self.ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, parser)
+        return parser
+
+    def can_fetch(self, url, user_agent=ROBOTS_USER_AGENT):
+        parser = self.get_parser(url)
+        return True if parser is None else parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, url, user_agent="*"):
+        parser = self.get_parser(url)
+        return parser.crawl_delay(user_agent) if parser is not None else None
+
+    def _download(self, base_url):
+        from .scrapers import get_session
+
+        try:
+            with get_session(user_agent=ROBOTS_USER_AGENT, pool_maxsize=1) as session:
+                response = session.get(f"{base_url}/robots.txt", timeout=10)
+            return response.status_code, response.text
+        except Exception as e:
+            logger.warning(f"Error reading robots.txt for {base_url}: {str(e)}")
+            return 0, ""
+
+    def _build_parser(self, base_url, status, body):
+        # Same status handling as RobotFileParser.read()
+        if status == 0 or status >= 500:
+            return None
+        parser = RobotFileParser(f"{base_url}/robots.txt")
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(body.splitlines())
+        return parser
+
+    def _load_shared(self, base_url):
+        client = self._get_redis()
+        if client is None:
+            return None, None
+        try:
+            raw = client.get(f"robots:{base_url}")
+            if raw is None:
+                return None, None
+            data = json.loads(raw)
+            return data["status"], data["body"]
+        except Exception as e:
+            logger.warning(f"Error reading shared robots cache: {str(e)}")
+            return None, None
+
+    def _store_shared(self, base_url, status, body):
+        client = self._get_redis()
+        if client is None:
+            return
+        ttl = self.failure_ttl if status == 0 or status >= 500 else self.ttl
+        try:
+            client.setex(
+                f"robots:{base_url}",
+                ttl,
+                json.dumps({"status": status, "body": body}),
+            )
+        except Exception as e:
+            logger.warning(f"Error writing shared robots cache: {str(e)}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+robots_cache = RobotsCache()
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from django.db.models import F, Q
+from django.utils import timezone
+from ..models import NewsSource, ScrapeRun
+
+MAX_BACKOFF = 24 * 3600
+
+# Adaptive interval: aim for this many new items per scrape, within
+# [scraping_interval / 4, scraping_interval * 6] and the absolute bounds.
+TARGET_NEW_PER_RUN = 3
+MIN_INTERVAL = 5 * 60
+MAX_INTERVAL = 6 * 3600
+YIELD_SMOOTHING = 0.3
+HISTORY_DAYS = 14
+
+
+def interval_bounds(source):
+    low = max(MIN_INTERVAL, source.scraping_interval // 4)
+    high = min(MAX_INTERVAL, source.scraping_interval * 6)
+    # A configured interval over 4 * MAX_INTERVAL would put low above high
+    return min(low, high), high
+
+
+def expected_rate(source, now=None):
+    """Learned new items per hour at ``now``'s hour of day, or None if unknown."""
+    profile = source.yield_profile or []
+    known = [rate for rate in profile if rate is not None]
+    if len(profile) != 24 or not known:
+        return None
+    now = now or timezone.now()
+    rate = profile[now.hour]
+    return rate if rate is not None else sum(known) / len(known)
+
+
+def effective_interval(source, now=None):
+    """
+    Seconds between scrapes of ``source`` at ``now``.
+
+    Sources with yield history are scraped often enough to pick up about
+    ``TARGET_NEW_PER_RUN`` new items per run at that time of day; the
+    configured ``scraping_interval`` is used until there is history.
+    """
+    rate = expected_rate(source, now)
+    if rate is None:
+        return source.scraping_interval
+    low, high = interval_bounds(source)
+    if rate <= 0:
+        return high
+    return int(min(max(TARGET_NEW_PER_RUN / rate * 3600, low), high))
+
+
+def updated_profile(source, new_items, now):
+    """
+    Fold one run's yield into the hour-of-day profile.
+
+    The items arrived some time since the previous scrape, so the observed
+    rate is credited to every hour of day that interval covered.
+    """
+    profile = list(source.yield_profile or [])
+    if len(profile) != 24:
+        profile = [None] * 24
+    if source.last_scraped_at is None:
+        return profile
+
+    elapsed = max((now - source.last_scraped_at).total_seconds(), 60)
+    rate = new_items / (elapsed / 3600)
+    hours = min(int(elapsed // 3600) + 1, 24)
+    for i in range(hours):
+        hour = (now - timedelta(hours=i)).hour
+        old = profile[hour]
+        profile[hour] = rate if old is None else old + YIELD_SMOOTHING * (rate - old)
+    return profile
+
+
+def due_sources(now=None):
+    now = now or timezone.now()
+    return NewsSource.objects.filter(is_active=True).filter(
+        Q(next_scrape_at__isnull=True) | Q(next_scrape_at__lte=now)
+    )
+
+
+def claim_source(source, now=None):
+    """
+    Lease a due source by pushing its next-due time one interval ahead.
+
+    The update only matches while ``next_scrape_at`` still holds the value we
+    read, so when several schedulers run at once exactly one dispatches it.
+    """
+    now = now or timezone.now()
+    lease = now + timedelta(seconds=effective_interval(source, now))
+    return (
+        NewsSource.objects.filter(
+            pk=source.pk, next_scrape_at=source.next_scrape_at
+        ).update(next_scrape_at=lease)
+        == 1
+    )
+
+
+def record_success(source, new_items=None, found=0, now=None):
+    """
+    Schedule the next scrape after a successful one.
+
+    When ``new_items`` is given the run is added to the source's yield
+    history and the learned profile, which sets the next interval.
+    """
+    now = now or timezone.now()
+    fields = {"last_scraped_at": now, "consecutive_failures": 0}
+    if new_items is not None:
+        source.yield_profile = updated_profile(source, new_items, now)
+        fields["yield_profile"] = source.yield_profile
+
+    interval = effective_interval(source, now)
+    fields["next_scrape_at"] = now + timedelta(seconds=interval)
+    NewsSource.objects.filter(pk=source.pk).update(**fields)
+
+    if new_items is not None:
+        ScrapeRun.objects.create(
+            source=source, ran_at=now, found=found, new_items=new_items, interval=interval
+        )
+        ScrapeRun.objects.filter(
+            source=source, ran_at__lt=now - timedelta(days=HISTORY_DAYS)
+        ).delete()
+
+
+def record_failure(source, now=None):
+    """Back off exponentially after a scrape that exhausted its retries."""
+    now = now or timezone.now()
+    failures = source.consecutive_failures + 1
+    delay = min(effective_interval(source, now) * 2 ** failures, MAX_BACKOFF)
+    NewsSource.objects.filter(pk=source.pk).update(
+        next_scrape_at=now + timedelta(seconds=delay),
+        consecutive_failures=F("consecutive_failures") + 1,
+    )
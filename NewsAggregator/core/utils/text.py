@@ -0,0 +1,48 @@
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+MAX_SENTENCE_CHARS = 1000
+
+# A run of whitespace after sentence-final punctuation (optionally closed by a
+# quote or bracket), or any whitespace containing a line break
+_BOUNDARY = re.compile(
+    r"((?:(?<=[.!?…。！？])|(?<=[.!?…][\"'”’)\]]))\s+|\s*\n\s*)"
+)
+
+
+def normalize_title(title):
+    """Case- and punctuation-insensitive key used to deduplicate headlines."""
+    return _NON_WORD.sub(" ", (title or "").lower()).strip()[:500]
+
+
+def normalize_url(url):
+    """Identity of ``url``: host lowercased, query sorted, fragment dropped."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def split_sentences(text, max_chars=MAX_SENTENCE_CHARS):
+    """
+    Split ``text`` into ``(sentence, separator)`` pairs.
+
+    Joining every sentence with the separator that follows it gives back the
+    original text. Sentences longer than ``max_chars`` are cut at the last
+    space before the limit, never inside a word.
+    """
+    parts = _BOUNDARY.split(text or "")
+    pieces = []
+    for i in range(0, len(parts), 2):
+        sentence = parts[i]
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append((sentence[:cut], " "))
+            sentence = sentence[cut:].lstrip()
+        if sentence or separator:
+            pieces.append((sentence, separator))
+    return pieces
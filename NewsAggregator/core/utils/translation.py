@@ -1,5 +1,5 @@
-import requests
-from django.conf import settings
+from ..models import ArticleTranslation
+from .translation_client import get_client
 
 SUPPORTED_LANGUAGES = {
     'es': 'Spanish',
@@ -12,15 +12,42 @@ SUPPORTED_LANGUAGES = {
 def translate_article_content(text, target_lang):
     if target_lang not in SUPPORTED_LANGUAGES:
         raise ValueError(f"Unsupported language: {target_lang}")
-    
-    response = requests.post(
-        f'{settings.LIBRETRANSLATE_API}/translate',
-        json={
-            'q': text,
-            'source': 'en',
-            'target': target_lang,
-            'format': 'text'
-        },
-        timeout=settings.LIBRETRANSLATE_TIMEOUT
+
+    return get_client().translate_text(text, 'en', target_lang)
+
+
+def translate_and_store(article, target_lang, source_lang=None):
+    """
+    Translate ``article`` and keep the result alongside its other languages.
+
+    The source language defaults to the one detected at ingest.
+    """
+    content = article.processed_content or article.raw_content
+    if not content:
+        raise ValueError("No content to translate")
+
+    source_lang = source_lang or article.language or 'en'
+    if source_lang == target_lang:
+        return content
+
+    translated = get_client().translate_text(content, source_lang, target_lang)
+    if not translated.strip() or translated == content:
+        raise ValueError("No content was successfully translated")
+
+    ArticleTranslation.objects.update_or_create(
+        article=article, language=target_lang, defaults={'content': translated}
+    )
+    return translated
+
+
+def stored_translation(article, language):
+    """Stored ``language`` text of ``article`` or of the story it duplicates."""
+    ids = [article.id]
+    if article.canonical_id:
+        ids.append(article.canonical_id)
+    found = dict(
+        ArticleTranslation.objects.filter(
+            article_id__in=ids, language=language
+        ).values_list('article_id', 'content')
     )
-    return response.json()['translatedText']
+    return found.get(article.id) or found.get(article.canonical_id)
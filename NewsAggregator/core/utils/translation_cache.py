@@ -0,0 +1,173 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 200_000
+LOCAL_MAX_ENTRIES = 5_000
+_LRU_KEY = "tr:lru"
+
+
+def normalize_text(text):
+    """Whitespace-insensitive form of ``text``; case and punctuation are kept."""
+    return " ".join((text or "").split())
+
+
+def text_key(text, source, target):
+    digest = hashlib.sha1(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"tr:{source}:{target}:{digest}"
+
+
+class TranslationCache:
+    """
+    Translations keyed by (hash of normalized text, source, target language).
+
+    Entries are shared through Redis when a URL is configured, with a small
+    in-process LRU in front. Redis keeps at most ``max_entries``: every hit
+    refreshes the entry's score in a sorted set and the least recently used
+    entries are evicted once the set grows past the limit.
+    """
+
+    def __init__(self, redis_url=None, max_entries=None, local_max_entries=LOCAL_MAX_ENTRIES):
+        self.redis_url = redis_url
+        self.max_entries = max_entries
+        self.local_max_entries = local_max_entries
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def _settings(self, name, default):
+        try:
+            from django.conf import settings
+
+            if settings.configured:
+                return getattr(settings, name, default)
+        except ImportError:
+            pass
+        return default
+
+    def _get_redis(self):
+        if self._redis is None:
+            redis_url = self.redis_url or self._settings("TRANSLATION_CACHE_REDIS_URL", None)
+            if self.max_entries is None:
+                self.max_entries = self._settings("TRANSLATION_CACHE_MAX_ENTRIES", MAX_ENTRIES)
+            if not redis_url:
+                self._redis = False
+            else:
+                try:
+                    import redis
+
+                    self._redis = redis.Redis.from_url(redis_url, socket_timeout=2)
+                except Exception as e:
+                    logger.warning(f"Translation cache running without Redis: {str(e)}")
+                    self._redis = False
+        return self._redis or None
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def get_many(self, texts, source, target):
+        """Cached translation of each of ``texts`` (None where missing)."""
+        keys = [text_key(text, source, target) for text in texts]
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._local:
+                    self._local.move_to_end(key)
+                    found[key] = self._local[key]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        client = self._get_redis()
+        if missing and client is not None:
+            try:
+                values = client.mget(missing)
+                hits = {k: v.decode("utf-8") for k, v in zip(missing, values) if v is not None}
+                if hits:
+                    now = time.time()
+                    client.zadd(_LRU_KEY, {k: now for k in hits})
+                for key, value in hits.items():
+                    self._remember(key, value)
+                found.update(hits)
+            except Exception as e:
+                logger.warning(f"Error reading translation cache: {str(e)}")
+
+        return [found.get(key) for key in keys]
+
+    def set_many(self, pairs, source, target):
+        """Store ``(text, translation)`` pairs."""
+        entries = {text_key(text, source, target): value for text, value in pairs}
+        if not entries:
+            return
+        for key, value in entries.items():
+            self._remember(key, value)
+
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            now = time.time()
+            pipe = client.pipeline()
+            pipe.mset(entries)
+            pipe.zadd(_LRU_KEY, {key: now for key in entries})
+            pipe.zcard(_LRU_KEY)
+            size = pipe.execute()[-1]
+            if size > self.max_entries:
+                self._evict(client, size - self.max_entries)
+        except Exception as e:
+            logger.warning(f"Error writing translation cache: {str(e)}")
+
+    def _evict(self, client, count):
+        stale = client.zrange(_LRU_KEY, 0, count - 1)
+        if stale:
+            pipe = client.pipeline()
+            pipe.delete(*stale)
+            pipe.zrem(_LRU_KEY, *stale)
+            pipe.execute()
+
+    def translate(self, texts, source, target, translate_many):
+        """
+        Translate ``texts``, sending only cache misses to ``translate_many``.
+
+        ``translate_many(misses, source, target)`` gets each missing text once,
+        even if it repeats, and returns one translation (or None) per text.
+        Results equal to the input are not cached, as LibreTranslate echoes
+        text it could not translate.
+        """
+        results = self.get_many(texts, source, target)
+        misses = {}
+        for text, result in zip(texts, results):
+            if result is None:
+                misses.setdefault(normalize_text(text), text)
+
+        translated = {}
+        if misses:
+            values = translate_many(list(misses.values()), source, target)
+            translated = dict(zip(misses, values))
+            for i, text in enumerate(texts):
+                if results[i] is None:
+                    results[i] = translated[normalize_text(text)]
+
+        self.set_many(
+            [
+                (text, value)
+                for text, value in translated.items()
+                if value and normalize_text(value) != text
+            ],
+            source,
+            target,
+        )
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+
+
+translation_cache = TranslationCache()
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from .text import split_sentences
+from .translation_cache import translation_cache
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_ITEMS = 32
+MAX_BATCH_CHARS = 8000
+MAX_IN_FLIGHT = 4
+MAX_RETRIES = 2
+
+
+class TranslationError(Exception):
+    pass
+
+
+class LibreTranslateClient:
+    """
+    Batched client for a LibreTranslate server.
+
+    Texts go out as ``q`` arrays of up to ``max_batch_items`` entries /
+    ``max_batch_chars`` characters over one keep-alive session, with at most
+    ``max_in_flight`` requests open at a time per process. A batch that
+    fails is retried, then its entries are retried one by one so a single
+    bad sentence does not fail the rest.
+    """
+
+    def __init__(
+        self,
+        api_url,
+        timeout=30,
+        max_in_flight=MAX_IN_FLIGHT,
+        max_batch_items=MAX_BATCH_ITEMS,
+        max_batch_chars=MAX_BATCH_CHARS,
+        max_retries=MAX_RETRIES,
+        cache=translation_cache,
+    ):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.max_batch_items = max_batch_items
+        self.max_batch_chars = max_batch_chars
+        self.max_retries = max_retries
+        self.cache = cache
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="libretranslate"
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _post(self, q, source, target):
+        response = self.session.post(
+            f"{self.api_url}/translate",
+            json={"q": q, "source": source, "target": target, "format": "text"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        translated = response.json()["translatedText"]
+        if isinstance(q, list) and (
+            not isinstance(translated, list) or len(translated) != len(q)
+        ):
+            raise TranslationError("Batch response does not match the request")
+        return translated
+
+    def _post_with_retry(self, q, source, target):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._post(q, source, target)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"Translation request failed (attempt {attempt + 1}): {str(e)}")
+                time.sleep(0.5 * 2 ** attempt)
+
+    def _translate_batch(self, texts, source, target):
+        try:
+            return self._post_with_retry(texts, source, target)
+        except Exception as e:
+            if len(texts) == 1:
+                logger.error(f"Translation failed: {str(e)}")
+                return [None]
+            logger.warning(f"Batch of {len(texts)} failed, retrying entries individually: {str(e)}")
+
+        results = []
+        for text in texts:
+            try:
+                results.append(self._post_with_retry(text, source, target))
+            except Exception as e:
+                logger.error(f"Translation failed: {str(e)}")
+                results.append(None)
+        return results
+
+    def _batches(self, texts):
+        batch, chars = [], 0
+        for i, text in enumerate(texts):
+            if batch and (
+                len(batch) >= self.max_batch_items
+                or chars + len(text) > self.max_batch_chars
+            ):
+                yield batch
+                batch, chars = [], 0
+            batch.append(i)
+            chars += len(text)
+        if batch:
+            yield batch
+
+    def translate_many(self, texts, source, target):
+        """Translation of each of ``texts`` (None where it failed)."""
+        results = [None] * len(texts)
+        futures = [
+            (
+                indexes,
+                self._executor.submit(
+                    self._translate_batch, [texts[i] for i in indexes], source, target
+                ),
+            )
+            for indexes in self._batches(texts)
+        ]
+        for indexes, future in futures:
+            for i, value in zip(indexes, future.result()):
+                results[i] = value
+        return results
+
+    def translate_text(self, text, source, target):
+        """
+        Translate a whole document sentence by sentence.
+
+        Sentences already in the translation cache are not sent; the rest go
+        out in a few concurrent batches. Raises TranslationError if any
+        sentence could not be translated; those that were are cached, so a
+        retry only sends the failures.
+        """
+        pieces = split_sentences(text)
+        sentences = [sentence for sentence, _ in pieces if sentence.strip()]
+        if self.cache is not None:
+            translated = self.cache.translate(sentences, source, target, self.translate_many)
+        else:
+            translated = self.translate_many(sentences, source, target)
+
+        failed = sum(value is None for value in translated)
+        if failed:
+            raise TranslationError(f"{failed}/{len(sentences)} sentences could not be translated")
+
+        translations = iter(translated)
+        return "".join(
+            (next(translations) if sentence.strip() else sentence) + separator
+            for sentence, separator in pieces
+        )
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client configured from LIBRETRANSLATE_* settings."""
+    global _client
+    if _client is None:
+        from django.conf import settings
+
+        with _client_lock:
+            if _client is None:
+                _client = LibreTranslateClient(
+                    settings.LIBRETRANSLATE_API,
+                    timeout=settings.LIBRETRANSLATE_TIMEOUT,
+                    max_in_flight=getattr(settings, "LIBRETRANSLATE_MAX_IN_FLIGHT", MAX_IN_FLIGHT),
+                )
+    return _client
@@ -0,0 +1,174 @@
+"""
+Local stand-in for a LibreTranslate server.
+
+Implements the ``POST /translate`` contract (``q`` as a string or a list,
+JSON or form encoded) and ``GET /languages``. The "translation" is the text
+prefixed with the target language, e.g. ``[es] Hello.``. Every request waits
+``latency`` seconds plus ``per_char`` seconds per character, holding one of
+``workers`` slots like LibreTranslate's own thread pool, and fails with a
+500 with probability ``failure_rate``.
+
+    python -m core.utils.translation_server --port 5000 --latency 0.05
+
+then point LIBRETRANSLATE_API at http://127.0.0.1:5000.
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES = ["en", "es", "fr", "de", "it", "pt", "nl", "ru"]
+
+
+class _TranslateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/languages":
+            self._send(404, {"error": "Not found"})
+            return
+        self._send(
+            200,
+            [{"code": code, "name": code, "targets": LANGUAGES} for code in LANGUAGES],
+        )
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/translate":
+            self._send(404, {"error": "Not found"})
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            data = json.loads(body or b"{}")
+        else:
+            form = parse_qs(body.decode("utf-8"))
+            data = {k: v if k == "q" and len(v) > 1 else v[0] for k, v in form.items()}
+
+        q, target = data.get("q"), data.get("target")
+        if q is None or not target:
+            self._send(400, {"error": "Invalid request: missing q or target"})
+            return
+        if target not in LANGUAGES or data.get("source", "auto") not in LANGUAGES + ["auto"]:
+            self._send(400, {"error": f"{target} is not supported"})
+            return
+
+        texts = q if isinstance(q, list) else [q]
+        server = self.server
+        with server.workers:
+            time.sleep(server.latency + server.per_char * sum(len(t) for t in texts))
+        if server.should_fail():
+            server.count(failed=True)
+            self._send(500, {"error": "Injected failure"})
+            return
+
+        server.count(chars=sum(len(t) for t in texts))
+        translated = [f"[{target}] {text}" if text.strip() else text for text in texts]
+        self._send(200, {"translatedText": translated if isinstance(q, list) else translated[0]})
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class TranslateServer(ThreadingHTTPServer):
+    """Stand-in LibreTranslate; use as a context manager, ``url`` is the API root."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        latency=0.0,
+        per_char=0.0,
+        workers=4,
+        failure_rate=0.0,
+        seed=None,
+        host="127.0.0.1",
+        port=0,
+    ):
+        self.latency = latency
+        self.per_char = per_char
+        self.workers = threading.Semaphore(workers)
+        self.failure_rate = failure_rate
+        self.requests_served = 0
+        self.failures = 0
+        self.chars_translated = 0
+        self._random = random.Random(seed)
+        self._count_lock = threading.Lock()
+        self._thread = None
+        super().__init__((host, port), _TranslateHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def should_fail(self):
+        with self._count_lock:
+            return self._random.random() < self.failure_rate
+
+    def count(self, chars=0, failed=False):
+        with self._count_lock:
+            self.requests_served += 1
+            self.failures += failed
+            self.chars_translated += chars
+
+    def reset_counts(self):
+        with self._count_lock:
+            self.requests_served = self.failures = self.chars_translated = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LibreTranslate stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--per-char", type=float, default=0.0, help="seconds per character")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = TranslateServer(
+        latency=args.latency,
+        per_char=args.per_char,
+        workers=args.workers,
+        failure_rate=args.failure_rate,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving LibreTranslate stand-in on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
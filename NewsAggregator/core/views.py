@@ -2,8 +2,7 @@ from django.contrib.auth import login
 from django.contrib.auth.views import LoginView
 from django.shortcuts import redirect, render, get_object_or_404
 from django.contrib import messages
-from .utils.article_summarizer import summarize_article
-from .utils.fake_news_detector import detect_fake_news
+from .utils import inference
 from django.urls import reverse_lazy
 from django.views.generic import TemplateView, DetailView
 from .forms import CustomUserCreationForm
@@ -11,12 +10,18 @@ from .models import *
 from django.views.decorators.http import require_http_methods
 from django.http import JsonResponse
 from .tasks import translate_article_content
+from .utils.translation import stored_translation
+from .utils.near_duplicates import canonical_articles, share_with_duplicates
 from django.contrib.auth.decorators import login_required
 from .utils.recommendations import (
     get_content_based_recommendations,
     get_faiss_recommendations,
 )
-from .tasks import process_article_summary, process_fake_news_detection
+from .tasks import (
+    detect_fake_news_articles_batch,
+    summarize_article_progressive,
+    summarize_articles_batch,
+)
 from celery.result import AsyncResult
 
 @require_http_methods(["GET"])
@@ -41,6 +46,12 @@ def task_status(request, task_id):
                 "status": "FAILURE",
                 "result": str(task.result)
             })
+    if task.status == "PROGRESS":
+        return JsonResponse({
+            "status": "PROGRESS",
+            "result": None,
+            "partial": (task.info or {}).get("partial")
+        })
     return JsonResponse({
         "status": task.status,
         "result": None
@@ -51,12 +62,14 @@ def task_status(request, task_id):
 def article_content(request, article_id):
     article = get_object_or_404(Article, id=article_id)
     lang = request.GET.get('lang')
-    
-    if lang and lang != 'en' and article.translated_content:
-        content = article.translated_content
+
+    if lang and lang != (article.language or 'en'):
+        content = stored_translation(article, lang)
+        if content is None:
+            return JsonResponse({"error": f"No {lang} translation yet"}, status=404)
     else:
         content = article.processed_content or article.raw_content
-        
+
     return JsonResponse({"translated_content": content})
 
 
@@ -140,16 +153,18 @@ def event_clusters(request):
 @require_http_methods(["GET", "POST"])
 def generate_article_summary(request, article_id):
     article = get_object_or_404(Article, id=article_id)
+    # A near-duplicate shares its canonical article's summary
+    [canonical] = canonical_articles([article])
     
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        summary = summarize_article(article.raw_content)
-        article.article_summary = summary
-        article.save()
-        return JsonResponse({"success": True, "summary": summary})
+        # Long articles take a while; the page polls task_status for partials
+        task = summarize_article_progressive.delay(canonical.id)
+        return JsonResponse({"success": True, "task_id": task.id})
     else:
-        summary = summarize_article(article.raw_content)
-        article.article_summary = summary
-        article.save()
+        [summary] = inference.summarize([canonical.processed_content or canonical.raw_content])
+        canonical.article_summary = summary
+        canonical.save()
+        share_with_duplicates([canonical], ["article_summary"])
         messages.success(request, "Article summary generated successfully!")
         return redirect("article_detail", pk=article.id)
 
@@ -158,22 +173,37 @@ def generate_article_summary(request, article_id):
 @require_http_methods(["GET", "POST"])
 def detect_article_fake_news(request, article_id):
     article = get_object_or_404(Article, id=article_id)
+    # A near-duplicate shares its canonical article's result
+    [canonical] = canonical_articles([article])
     
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        is_fake, confidence = detect_fake_news(article.raw_content)
-        article.is_fake_news = is_fake
-        article.fake_news_confidence = confidence
-        article.save()
+        [(is_fake, confidence, tier)] = inference.classify(
+            [canonical.processed_content or canonical.raw_content]
+        )
+        canonical.is_fake_news = is_fake
+        canonical.fake_news_confidence = confidence
+        canonical.fake_news_tier = tier
+        canonical.save()
+        share_with_duplicates(
+            [canonical], ["is_fake_news", "fake_news_confidence", "fake_news_tier"]
+        )
         return JsonResponse({
             "success": True,
             "is_fake": is_fake,
-            "confidence": confidence
+            "confidence": confidence,
+            "tier": tier
         })
     else:
-        is_fake, confidence = detect_fake_news(article.raw_content)
-        article.is_fake_news = is_fake
-        article.fake_news_confidence = confidence
-        article.save()
+        [(is_fake, confidence, tier)] = inference.classify(
+            [canonical.processed_content or canonical.raw_content]
+        )
+        canonical.is_fake_news = is_fake
+        canonical.fake_news_confidence = confidence
+        canonical.fake_news_tier = tier
+        canonical.save()
+        share_with_duplicates(
+            [canonical], ["is_fake_news", "fake_news_confidence", "fake_news_tier"]
+        )
         messages.success(request, "Fake news detection completed!")
         return redirect("article_detail", pk=article.id)
 
@@ -184,11 +214,10 @@ def batch_process_articles(request):
         article_ids = request.POST.getlist("article_ids")
         process_type = request.POST.get("process_type")
 
-        for article_id in article_ids:
-            if process_type == "summary":
-                process_article_summary.delay(int(article_id))
-            elif process_type == "fake_news":
-                process_fake_news_detection.delay(int(article_id))
+        if process_type == "summary":
+            summarize_articles_batch.delay([int(article_id) for article_id in article_ids])
+        elif process_type == "fake_news":
+            detect_fake_news_articles_batch.delay([int(article_id) for article_id in article_ids])
 
         messages.success(
             request,
@@ -202,6 +231,15 @@ def batch_process_articles(request):
 @require_http_methods(["POST"])
 def translate_article_view(request, article_id):
     target_lang = request.POST.get('target_lang', 'en')
+    article = get_object_or_404(Article, id=article_id)
+    if target_lang == (article.language or 'en'):
+        content = article.processed_content or article.raw_content
+    else:
+        content = stored_translation(article, target_lang)
+    if content is not None:
+        # Already translated (usually ahead of time): no task to wait for
+        return JsonResponse({'translated_content': content})
+
     try:
         task = translate_article_content.apply_async(
             args=(article_id, target_lang),
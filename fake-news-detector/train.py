@@ -1,3 +1,6 @@
+import argparse
+import sys
+from pathlib import Path
 import torch
 from torch.utils.data import Dataset, DataLoader
 from transformers import DebertaV2Tokenizer, DebertaV2ForSequenceClassification
@@ -7,6 +10,15 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "NewsAggregator"))
+from core.utils.fake_news_prefilter import (
+    FAKE_LABEL,
+    FAKE_THRESHOLD,
+    Prefilter,
+    feature_matrix,
+    in_band,
+)
+
 CONFIG = {
     "model_name": "microsoft/deberta-v3-small",
     "max_length": 512,
@@ -19,6 +31,12 @@ CONFIG = {
     "device": "cuda" if torch.cuda.is_available() else "cpu",
 }
 
+PREFILTER_CONFIG = {
+    "C": 4.0,
+    "max_iter": 1000,
+    "band": (0.1, 0.9),
+}
+
 class NewsDataset(Dataset):
     def __init__(self, texts, labels, tokenizer):
         self.texts = texts
@@ -51,8 +69,8 @@ def load_data():
         "fake-news-detector-files/Fake.csv", usecols=["title", "text"]
     ).sample(20000)
 
-    real["label"] = 1
-    fake["label"] = 0
+    real["label"] = 1 - FAKE_LABEL
+    fake["label"] = FAKE_LABEL
 
     df = pd.concat([real, fake])
     df["text"] = df["title"] + " " + df["text"]
@@ -155,5 +173,37 @@ def train():
     torch.save(model.state_dict(), "fake_news_detector.pth")
 
 
+def train_prefilter():
+    from sklearn.linear_model import LogisticRegression
+
+    X_train, X_test, y_train, y_test = load_data()
+    # The prefilter scores P(fake)
+    fake_train = (y_train.to_numpy() == FAKE_LABEL).astype(int)
+    fake_test = (y_test.to_numpy() == FAKE_LABEL).astype(int)
+
+    model = LogisticRegression(
+        C=PREFILTER_CONFIG["C"],
+        max_iter=PREFILTER_CONFIG["max_iter"],
+        solver="liblinear",
+    )
+    model.fit(feature_matrix(X_train.tolist()), fake_train)
+
+    prefilter = Prefilter(model.coef_.ravel(), model.intercept_[0])
+    scores = np.array(prefilter.score_many(X_test.tolist()))
+    decided = np.array([not in_band(p, PREFILTER_CONFIG["band"]) for p in scores])
+    correct = (scores > FAKE_THRESHOLD) == fake_test
+    print(
+        f"Accuracy: {correct.mean():.2%} | "
+        f"decided outside {PREFILTER_CONFIG['band']}: {decided.mean():.2%} "
+        f"at {correct[decided].mean():.2%} accuracy"
+    )
+    prefilter.save("fake_news_prefilter.npz")
+
+
 if __name__ == "__main__":
-    train()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("model", nargs="?", choices=["deberta", "prefilter"], default="deberta")
+    if parser.parse_args().model == "prefilter":
+        train_prefilter()
+    else:
+        train()
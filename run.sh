@@ -4,6 +4,9 @@ GREEN=$(tput setaf 2)
 YELLOW=$(tput setaf 3)
 NC=$(tput sgr0) 
 
+# Views and Celery tasks send model work to one shared inference server
+export INFERENCE_SOCKET=${INFERENCE_SOCKET:-/tmp/newsaggregator-inference.sock}
+
 check_port() {
     port=$1
     if command -v nc >/dev/null 2>&1; then
@@ -66,6 +69,10 @@ kill_existing_processes() {
         echo "${YELLOW}Killing LibreTranslate processes${NC}"
         pkill -f "libretranslate" >/dev/null 2>&1 || true
     fi    
+    if ps aux | grep -i "[i]nference_server" >/dev/null; then
+        echo "${YELLOW}Killing inference server processes${NC}"
+        pkill -f "inference_server" >/dev/null 2>&1 || true
+    fi
     if ps aux | grep -i "[r]unserver" >/dev/null; then
         echo "${YELLOW}Killing Django processes${NC}"
         pkill -f "runserver" >/dev/null 2>&1 || true
@@ -110,6 +117,19 @@ start_libretranslate() {
     sleep 5
 }
 
+start_inference_server() {
+    echo "${YELLOW}Starting inference server...${NC}"
+    rm -f "$INFERENCE_SOCKET"
+    python NewsAggregator/manage.py inference_server &
+    INFERENCE_PID=$!
+    echo "${GREEN}Inference server started with PID $INFERENCE_PID on $INFERENCE_SOCKET${NC}"
+    # Models load and warm up before the socket is bound
+    for _ in $(seq 1 120); do
+        [ -S "$INFERENCE_SOCKET" ] && break
+        sleep 1
+    done
+}
+
 start_django() {
     echo "${YELLOW}Starting Django server...${NC}"
     python NewsAggregator/manage.py migrate
@@ -134,6 +154,18 @@ start_celery() {
     celery -A NewsAggregator worker -l info -Q celery,translations --concurrency=1 --pool=prefork --prefetch-multiplier=1 &
     WORKER_PID=$!
     echo "${GREEN}Celery worker started with PID $WORKER_PID${NC}"
+
+    # Article pages found by discovery are fetched on their own pool
+    celery -A NewsAggregator worker -l info -Q frontier -n frontier@%h --concurrency=2 --pool=prefork --prefetch-multiplier=1 &
+    FRONTIER_PID=$!
+    echo "${GREEN}Celery frontier worker started with PID $FRONTIER_PID${NC}"
+
+    # Summaries and fake news detection: the tasks forward texts to the
+    # inference server at $INFERENCE_SOCKET, so no ML_WORKER warmup here; only
+    # progressive summaries load the summarizer in the worker, on first use
+    celery -A NewsAggregator worker -l info -Q ml -n ml@%h --concurrency=1 --pool=prefork --prefetch-multiplier=1 &
+    ML_PID=$!
+    echo "${GREEN}Celery ML worker started with PID $ML_PID${NC}"
     
     cd ..
     sleep 3
@@ -169,6 +201,7 @@ main() {
     check_venv
     kill_existing_processes
     check_services
+    start_inference_server
     start_django
     start_celery
     trigger_initial_tasks
@@ -179,6 +212,7 @@ main() {
     echo "User dashboard:    http://localhost:8000"
     echo "Celery flower:     http://localhost:5555"
     echo "LibreTranslate:    http://localhost:5000"
+    echo "Inference server:  $INFERENCE_SOCKET"
     echo "\n${YELLOW}Press Ctrl+C to stop all services${NC}"
     trap 'pkill -P $$' SIGINT SIGTERM
     wait